@@ -1,7 +1,7 @@
 # backend/app/api/api.py
 
 from fastapi import APIRouter
-from app.api.endpoints import indicators, new_indicators
+from app.api.endpoints import indicators, new_indicators, analytics
 
 router = APIRouter()
 
@@ -12,6 +12,13 @@ router.include_router(
     tags=["indicators-v2"]
 )
 
+# Cross-indicator analytics (backtests, panels)
+router.include_router(
+    analytics.router,
+    prefix="/v2/analytics",
+    tags=["analytics"]
+)
+
 # Keep the old indicators router for backward compatibility
 router.include_router(
     indicators.router,
@@ -32,6 +39,10 @@ async def root():
             "docs": "/docs",
             "indicators_v2": "/api/v2/indicators",
             "market_status": "/api/v2/indicators/market-status",
-            "categories": "/api/v2/indicators/categories"
+            "categories": "/api/v2/indicators/categories",
+            "backtest": "/api/v2/analytics/backtest",
+            "panel": "/api/v2/analytics/panel",
+            "correlations": "/api/v2/analytics/correlations",
+            "regime": "/api/v2/analytics/regime"
         }
     }
\ No newline at end of file
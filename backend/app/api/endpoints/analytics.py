@@ -0,0 +1,133 @@
+# backend/app/api/endpoints/analytics.py
+
+import logging
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from app.services.container import services
+from app.api.timing import TimedRoute
+from app.models.indicators import (
+    BacktestReport,
+    IndicatorBacktestResult,
+    AlignedPanelResponse,
+    CorrelationMatrixResponse,
+    RollingCorrelationResponse,
+    RegimeResponse
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.get("/panel", response_model=AlignedPanelResponse)
+async def get_aligned_panel(
+    indicators: Optional[str] = Query(None, description="Comma-separated list of indicator IDs (defaults to all)"),
+    frequency: str = Query("monthly", description="Common frequency: daily, weekly, monthly or quarterly"),
+    start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
+    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
+    transformed: bool = Query(True, description="Apply each indicator's configured transformation (e.g. YoY)"),
+    fill_limit: Optional[int] = Query(None, ge=0, description="Maximum number of periods a value is carried forward")
+):
+    """
+    Get a date-aligned panel for several indicators, resampled server-side to a common
+    frequency using as-of values and bounded forward-fill. Values are returned column-wise.
+    """
+    indicator_list = [ind.strip() for ind in indicators.split(",") if ind.strip()] if indicators else None
+    try:
+        return services.panel.get_aligned_panel(indicator_list, frequency.lower(), start_date, end_date, transformed, fill_limit)
+    except ValueError as e:
+        logger.warning(f"Invalid panel request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error building aligned panel: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error building aligned panel: {str(e)}")
+
+@router.get("/backtest", response_model=BacktestReport)
+async def get_backtest_report(
+    refresh: bool = Query(False, description="Recompute the report instead of serving the cached copy")
+):
+    """
+    Backtest every indicator's historical signal against SP500 forward returns and
+    FRED recession dates: hit rates, forward-return distributions and lead-lag correlations.
+    The report is cached and recomputed once it is older than BACKTEST_REPORT_TTL_SECONDS.
+    """
+    try:
+        return services.backtest.get_report(refresh)
+    except ValueError as e:
+        logger.warning(f"Backtest report unavailable: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error computing backtest report: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error computing backtest report: {str(e)}")
+
+@router.get("/backtest/{indicator_id}", response_model=IndicatorBacktestResult)
+async def get_indicator_backtest(
+    indicator_id: str,
+    refresh: bool = Query(False, description="Recompute the report instead of serving the cached copy")
+):
+    """
+    Backtest statistics for a single indicator, taken from the cached report.
+    """
+    try:
+        return services.backtest.get_indicator_result(indicator_id, refresh)
+    except ValueError as e:
+        logger.warning(f"Backtest result not found for {indicator_id}: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error computing backtest for {indicator_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error computing backtest for {indicator_id}: {str(e)}")
+
+@router.get("/correlations", response_model=CorrelationMatrixResponse)
+async def get_correlation_matrix(
+    frequency: str = Query("monthly", description="Common frequency: daily, weekly, monthly or quarterly"),
+    window: Optional[int] = Query(None, ge=3, description="Rolling window in periods (defaults to 252 daily / 36 monthly)"),
+    indicators: Optional[str] = Query(None, description="Comma-separated list of indicator IDs (defaults to all)")
+):
+    """
+    Get the pairwise correlation matrix over the latest rolling window.
+    Served from a cache that is refreshed incrementally when an underlying series changes.
+    """
+    indicator_list = [ind.strip() for ind in indicators.split(",") if ind.strip()] if indicators else None
+    try:
+        return services.correlation.get_correlation_matrix(frequency.lower(), window, indicator_list)
+    except ValueError as e:
+        logger.warning(f"Invalid correlation request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error computing correlation matrix: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error computing correlation matrix: {str(e)}")
+
+@router.get("/correlations/{indicator_a}/{indicator_b}", response_model=RollingCorrelationResponse)
+async def get_rolling_correlation(
+    indicator_a: str,
+    indicator_b: str,
+    frequency: str = Query("monthly", description="Common frequency: daily, weekly, monthly or quarterly"),
+    window: Optional[int] = Query(None, ge=3, description="Rolling window in periods (defaults to 252 daily / 36 monthly)")
+):
+    """
+    Get the rolling correlation history between two indicators.
+    """
+    try:
+        return services.correlation.get_rolling_correlation(indicator_a, indicator_b, frequency.lower(), window)
+    except ValueError as e:
+        logger.warning(f"Invalid rolling correlation request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error computing rolling correlation for {indicator_a}/{indicator_b}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error computing rolling correlation: {str(e)}")
+
+@router.get("/regime", response_model=RegimeResponse)
+async def get_regime(
+    frequency: str = Query("monthly", description="Common frequency: daily, weekly, monthly or quarterly")
+):
+    """
+    Classify the current market regime (expansion, slowdown, contraction, recovery)
+    from the average signals of leading and coincident indicators, with its history.
+    """
+    try:
+        return services.correlation.get_regime(frequency.lower())
+    except ValueError as e:
+        logger.warning(f"Regime classification unavailable: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error classifying regime: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error classifying regime: {str(e)}")
@@ -1,44 +1,59 @@
 from fastapi import APIRouter, HTTPException, Query, Path
-from app.services.fred_service import FredService
-from app.services.dbnom_service import DBNomicsService
-from app.services.yahoo_finance_service import YahooFinanceService
-from app.services.composite_indicators_service import CompositeIndicatorsService
+from app.services.container import services
 from app.models.indicators import TimeSeriesData, TimeSeriesPoint, IndicatorSignal
+from app.api.timing import TimedRoute
 from typing import List, Optional
 from datetime import datetime, timedelta
-import pandas as pd
 
 
-router = APIRouter()
-fred_service = FredService()
-dbnom_service = DBNomicsService()
-yahoo_finance_service = YahooFinanceService()
-composite_indicators_service = CompositeIndicatorsService()
+router = APIRouter(route_class=TimedRoute)
+
+
+def _to_points(df) -> List[TimeSeriesPoint]:
+    """Convert a date/value DataFrame to response points, skipping missing values."""
+    import pandas as pd  # Deferred so importing the API does not import pandas
+    return [
+        TimeSeriesPoint(date=row["date"], value=row["value"])
+        for _, row in df.iterrows() if pd.notna(row["value"])
+    ]
 
 @router.get("/fred/{series_id}", response_model=TimeSeriesData)
 async def get_fred_data(
     series_id: str,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    realtime_start: Optional[str] = Query(None, description="Start of the ALFRED real-time period (vintage), YYYY-MM-DD"),
+    realtime_end: Optional[str] = Query(None, description="End of the ALFRED real-time period (vintage), YYYY-MM-DD")
 ):
     """
-    Get time series data from FRED.
+    Get time series data from FRED, optionally as published during a real-time period.
     """
     # Get series info for title and other metadata
-    series_info = fred_service.get_series_info(series_id)
+    series_info = services.fred.get_series_info(series_id)
     if not series_info:
         raise HTTPException(status_code=404, detail=f"Series {series_id} not found")
     
-    # Get series data
-    df = fred_service.get_series_data(series_id, start_date, end_date)
+    # Get series data; vintages come from the series store, where past ones are kept permanently
+    if realtime_start or realtime_end:
+        today = datetime.now().strftime("%Y-%m-%d")
+        realtime_start, realtime_end = realtime_start or today, realtime_end or today  # FRED's defaults
+        if realtime_start > realtime_end:
+            raise HTTPException(status_code=400, detail="realtime_start must not be after realtime_end")
+        try:
+            df = services.unified.get_fred_vintage(series_id, realtime_start, realtime_end)
+        except ValueError:
+            raise HTTPException(status_code=404, detail=f"No data found for series {series_id}")
+        if start_date:
+            df = df[df["date"] >= start_date]
+        if end_date:
+            df = df[df["date"] <= end_date]
+    else:
+        df = services.fred.get_series_data(series_id, start_date, end_date)
     if df.empty:
         raise HTTPException(status_code=404, detail=f"No data found for series {series_id}")
     
     # Convert to response model
-    data_points = [
-        TimeSeriesPoint(date=row["date"], value=row["value"]) 
-        for _, row in df.iterrows() if pd.notna(row["value"])
-    ]
+    data_points = _to_points(df)
     
     return TimeSeriesData(
         series_id=series_id,
@@ -56,16 +71,13 @@ async def get_ism_pmi(
     """
     Get ISM Manufacturing PMI data from DBNomics.
     """
-    df = dbnom_service.get_ism_pmi(start_date, end_date)
+    df = services.dbnomics.get_ism_pmi(start_date, end_date)
     
     if df.empty:
         raise HTTPException(status_code=404, detail="No ISM PMI data found. Please check the DBNomics API.")
     
     # Convert to response model
-    data_points = [
-        TimeSeriesPoint(date=row["date"], value=row["value"]) 
-        for _, row in df.iterrows() if pd.notna(row["value"])
-    ]
+    data_points = _to_points(df)
     
     return TimeSeriesData(
         series_id="ISM-PMI",
@@ -83,16 +95,13 @@ async def get_ism_new_orders(
     """
     Get ISM New Orders Index data from DBNomics.
     """
-    df = dbnom_service.get_ism_new_orders(start_date, end_date)
+    df = services.dbnomics.get_ism_new_orders(start_date, end_date)
     
     if df.empty:
         raise HTTPException(status_code=404, detail="No ISM New Orders data found. Please check the DBNomics API.")
     
     # Convert to response model
-    data_points = [
-        TimeSeriesPoint(date=row["date"], value=row["value"]) 
-        for _, row in df.iterrows() if pd.notna(row["value"])
-    ]
+    data_points = _to_points(df)
     
     return TimeSeriesData(
         series_id="ISM-NEW-ORDERS",
@@ -107,7 +116,7 @@ async def get_providers():
     """
     Get a list of all providers from DBNomics.
     """
-    return dbnom_service.get_providers()
+    return services.dbnomics.get_providers()
 
 @router.get("/dbnom/datasets/{provider_code}")
 async def get_datasets(
@@ -116,7 +125,7 @@ async def get_datasets(
     """
     Get a list of all datasets for a provider from DBNomics.
     """
-    return dbnom_service.get_datasets(provider_code)
+    return services.dbnomics.get_datasets(provider_code)
 
 @router.get("/dbnom/debug/{provider_code}/{dataset_code}/{series_code}")
 async def debug_series(
@@ -127,7 +136,7 @@ async def debug_series(
     """
     Debug endpoint to fetch a specific series by its components.
     """
-    df = dbnom_service.get_series_by_id(provider_code, dataset_code, series_code)
+    df = services.dbnomics.get_series_by_id(provider_code, dataset_code, series_code)
     
     if df.empty:
         raise HTTPException(status_code=404, detail=f"No data found for {provider_code}/{dataset_code}/{series_code}")
@@ -151,16 +160,13 @@ async def get_gold_copper_ratio(
     A rising ratio indicates risk-off sentiment (gold gaining vs copper), 
     while a falling ratio indicates risk-on sentiment (copper gaining vs gold).
     """
-    df = composite_indicators_service.get_gold_copper_ratio(start_date, end_date)
+    df = services.composite.get_gold_copper_ratio(start_date, end_date)
     
     if df.empty:
         raise HTTPException(status_code=404, detail="No Gold/Copper ratio data found. Please check the API connection.")
     
     # Convert to response model
-    data_points = [
-        TimeSeriesPoint(date=row["date"], value=row["value"]) 
-        for _, row in df.iterrows() if pd.notna(row["value"])
-    ]
+    data_points = _to_points(df)
     
     return TimeSeriesData(
         series_id="GOLD-COPPER-RATIO",
@@ -180,16 +186,13 @@ async def get_sp500(
     The S&P 500 is a stock market index tracking the stock performance of 500 large companies
     listed on stock exchanges in the United States.
     """
-    df = composite_indicators_service.get_sp500_performance(start_date, end_date)
+    df = services.composite.get_sp500_performance(start_date, end_date)
     
     if df.empty:
         raise HTTPException(status_code=404, detail="No S&P 500 data found. Please check the API connection.")
     
     # Convert to response model
-    data_points = [
-        TimeSeriesPoint(date=row["date"], value=row["value"]) 
-        for _, row in df.iterrows() if pd.notna(row["value"])
-    ]
+    data_points = _to_points(df)
     
     return TimeSeriesData(
         series_id="SP500",
@@ -199,30 +202,35 @@ async def get_sp500(
         frequency="Daily"
     )
 
+_INTERVAL_FREQUENCIES = {"1h": "Hourly", "1d": "Daily", "1wk": "Weekly"}
+
 @router.get("/yahoo/{ticker}", response_model=TimeSeriesData)
 async def get_yahoo_ticker(
     ticker: str,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    interval: str = Query("1d", description="Bar interval: 1h, 1d or 1wk")
 ):
     """
-    Get price data for any Yahoo Finance ticker.
+    Get price data for any Yahoo Finance ticker. Without a start date, the interval's default
+    window is returned (5 days of hourly, 400 days of daily, 5 years of weekly bars). Daily
+    bars are served from the stored ticker history; hourly and weekly bars fetch only the window.
     """
-    df = yahoo_finance_service.get_ticker_data(ticker, start_date, end_date)
+    try:
+        df = services.yahoo.get_ticker_window(ticker, start_date, end_date, interval)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     if df.empty:
         raise HTTPException(status_code=404, detail=f"No data found for ticker {ticker}. Please check if the ticker symbol is valid.")
     
     # Convert to response model
-    data_points = [
-        TimeSeriesPoint(date=row["date"], value=row["value"]) 
-        for _, row in df.iterrows() if pd.notna(row["value"])
-    ]
+    data_points = _to_points(df)
     
     return TimeSeriesData(
         series_id=f"YAHOO-{ticker}",
         title=f"{ticker} Price",
         data=data_points,
         units="Price",
-        frequency="Daily"
+        frequency=_INTERVAL_FREQUENCIES[interval]
     )
\ No newline at end of file
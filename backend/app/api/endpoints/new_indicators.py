@@ -1,8 +1,9 @@
 # backend/app/api/endpoints/new_indicators.py
 
-from fastapi import APIRouter, HTTPException, Query, Path
+import gzip
+from fastapi import APIRouter, HTTPException, Query, Path, Request, Response
 from typing import List, Optional
-from app.services.unified_indicator_service import UnifiedIndicatorService
+from app.services.container import services
 from app.models.indicators import (
     EnrichedIndicatorData,
     IndicatorMetadataResponse,
@@ -11,19 +12,19 @@ from app.models.indicators import (
     IndicatorsByTypeResponse
 )
 from app.core.indicator_config import IndicatorType # For path parameter validation
+from app.api.timing import TimedRoute
 
-router = APIRouter()
-unified_service = UnifiedIndicatorService()
+router = APIRouter(route_class=TimedRoute)
 
 @router.get("/", response_model=List[IndicatorMetadataResponse])
 async def get_all_indicators_metadata_list():
     """
     Get metadata for all available indicators.
-    The order is determined by their definition in indicator_config.py.
+    The order is determined by their definition in indicators.toml.
     """
     try:
-        # unified_service.get_all_indicators_metadata() now returns an ordered list
-        return unified_service.get_all_indicators_metadata()
+        # services.unified.get_all_indicators_metadata() now returns an ordered list
+        return services.unified.get_all_indicators_metadata()
     except Exception as e:
         logger.error(f"Error fetching indicators metadata: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching indicators metadata: {str(e)}")
@@ -33,11 +34,11 @@ async def get_categories():
     """
     Get all available categories with their defined indicators.
     Categories are sorted by 'display_order'. Indicators within each category
-    are sorted by their definition order in indicator_config.py.
+    are sorted by their definition order in indicators.toml.
     """
     try:
-        # unified_service.get_categories() now returns an ordered list of CategoryInfo
-        return unified_service.get_categories()
+        # services.unified.get_categories() now returns an ordered list of CategoryInfo
+        return services.unified.get_categories()
     except Exception as e:
         logger.error(f"Error fetching categories: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching categories: {str(e)}")
@@ -55,21 +56,27 @@ async def get_market_status(
         if indicators:
             indicator_list = [ind.strip() for ind in indicators.split(",")]
 
-        return unified_service.calculate_market_status(indicator_list)
+        return services.unified.calculate_market_status(indicator_list)
     except Exception as e:
         logger.error(f"Error calculating market status: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error calculating market status: {str(e)}")
 
 @router.get("/type/{indicator_type_value}", response_model=IndicatorsByTypeResponse)
 async def get_indicators_by_type_endpoint( # Renamed for clarity
+    request: Request,
     indicator_type_value: str = Path(..., description="The type of indicators to fetch (e.g., 'leading', 'coincident', 'lagging')"),
     start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
-    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format")
+    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
+    include_signal_series: bool = Query(False, description="Include the run-length encoded per-point signal history"),
+    window: Optional[str] = Query(None, description="Default window ending today (1Y, 2Y, 3Y, 4Y, 5Y, 10Y or 20Y), served from a precomputed bundle; overrides start_date/end_date")
 ):
     """
     Get all indicators of a specific type (leading, coincident, or lagging)
     along with their data and relevant categories.
     Indicators and categories are ordered as defined in the configuration.
+
+    Default windows (`window`) are served as precomputed gzipped JSON with a strong ETag
+    (one per content-coding); a matching If-None-Match gets 304 Not Modified.
     """
     try:
         indicator_type_enum = IndicatorType(indicator_type_value.lower())
@@ -81,10 +88,21 @@ async def get_indicators_by_type_endpoint( # Renamed for clarity
             detail=f"Invalid indicator type '{indicator_type_value}'. Valid types are: {valid_types}."
         )
     
+    if window is not None:
+        if window not in services.bundles.WINDOWS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid window '{window}'. Valid windows are: {', '.join(services.bundles.WINDOWS)}."
+            )
+        if not include_signal_series:
+            return _bundle_response(request, indicator_type_enum, window)
+        # Bundles carry no signal series; build this one dynamically
+        start_date, end_date = services.bundles.window_start(window), None
+
     try:
-        # unified_service.get_enriched_indicators_by_type() returns an IndicatorsByTypeResponse
+        # services.unified.get_enriched_indicators_by_type() returns an IndicatorsByTypeResponse
         # with ordered lists of indicators and categories.
-        return unified_service.get_enriched_indicators_by_type(indicator_type_enum, start_date, end_date)
+        return services.unified.get_enriched_indicators_by_type(indicator_type_enum, start_date, end_date, include_signal_series)
     except ValueError as e: 
         logger.error(f"Value error for indicator type '{indicator_type_value}': {e}", exc_info=True)
         raise HTTPException(status_code=404, detail=str(e))
@@ -93,17 +111,60 @@ async def get_indicators_by_type_endpoint( # Renamed for clarity
         raise HTTPException(status_code=500, detail=f"Error fetching indicators by type '{indicator_type_value}': {str(e)}")
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match evaluation (RFC 9110 13.1.2): "*" or any listed tag, compared weakly."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (listed, or via "*", without q=0)."""
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.strip()] = quality
+    return accepted.get("gzip", accepted.get("*", 0.0)) > 0
+
+
+def _bundle_response(request: Request, indicator_type: IndicatorType, window: str) -> Response:
+    try:
+        bundle = services.bundles.get(indicator_type, window)
+    except Exception as e:
+        logger.error(f"Error building the {indicator_type.value}/{window} bundle: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error fetching indicators by type '{indicator_type.value}': {str(e)}")
+
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    etag = bundle.gzip_etag if use_gzip else bundle.etag
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        return Response(bundle.body, media_type="application/json", headers={**headers, "Content-Encoding": "gzip"})
+    return Response(gzip.decompress(bundle.body), media_type="application/json", headers=headers)
+
+
 @router.get("/{indicator_id}", response_model=EnrichedIndicatorData)
 async def get_indicator_data( 
     indicator_id: str,
     start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
-    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format")
+    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
+    include_signal_series: bool = Query(False, description="Include the run-length encoded per-point signal history")
 ):
     """
     Get enriched indicator data with transformations and signals for a single indicator.
     """
     try:
-        return unified_service.get_indicator(indicator_id, start_date, end_date)
+        return services.unified.get_indicator(indicator_id, start_date, end_date, include_signal_series)
     except ValueError as e: 
         logger.warning(f"Indicator not found (ValueError): {indicator_id}, Error: {e}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -119,7 +180,7 @@ async def get_indicator_metadata_item(
     Get metadata for a specific indicator.
     """
     try:
-        return unified_service.get_indicator_metadata(indicator_id)
+        return services.unified.get_indicator_metadata(indicator_id)
     except ValueError as e:
         logger.warning(f"Metadata not found for indicator (ValueError): {indicator_id}, Error: {e}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -131,15 +192,16 @@ async def get_indicator_metadata_item(
 async def get_indicators_by_category_name_list( 
     category_name: str, 
     start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
-    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format")
+    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
+    include_signal_series: bool = Query(False, description="Include the run-length encoded per-point signal history")
 ):
     """
     Get all enriched indicators in a specific category by the category's name.
-    Indicators are returned in their definition order from indicator_config.py.
+    Indicators are returned in their definition order from indicators.toml.
     """
     try:
-        # unified_service.get_indicators_by_category_name() returns an ordered list
-        indicators = unified_service.get_indicators_by_category_name(category_name, start_date, end_date)
+        # services.unified.get_indicators_by_category_name() returns an ordered list
+        indicators = services.unified.get_indicators_by_category_name(category_name, start_date, end_date, include_signal_series)
         # No specific error if category exists but has no indicators; an empty list is valid.
         return indicators
     except Exception as e:
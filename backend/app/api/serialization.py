@@ -0,0 +1,56 @@
+# backend/app/api/serialization.py
+
+from datetime import datetime
+from typing import Any, Set
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # Optional dependency: fall back to pydantic's own (Rust) JSON encoder
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+# Model classes already seen; isinstance() against pydantic's ABC metaclass is slow per point
+_model_types: Set[type] = set()
+
+
+def _default(obj: Any) -> Any:
+    if type(obj) in _model_types:
+        # Field values as they are; orjson walks them without building intermediate dicts
+        return obj.__dict__
+    if isinstance(obj, BaseModel):
+        _model_types.add(type(obj))
+        return obj.__dict__
+    if isinstance(obj, datetime):
+        # Subclasses such as pandas.Timestamp
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    Serialise response content (pydantic models, lists of them, dicts, NumPy arrays) to
+    JSON bytes, producing the same document as FastAPI's default response path.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode("utf-8")
+    if isinstance(content, list) and all(isinstance(item, BaseModel) for item in content):
+        return b"[" + b",".join(item.model_dump_json().encode("utf-8") for item in content) + b"]"
+    import json
+    from fastapi.encoders import jsonable_encoder
+    return json.dumps(jsonable_encoder(content), separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with dump_json."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
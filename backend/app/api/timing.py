@@ -0,0 +1,144 @@
+# backend/app/api/timing.py
+
+import asyncio
+import functools
+import time
+import typing
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.serialization import FastJSONResponse
+from app.core.config import settings
+from app.core.metrics import (
+    current_request_spans,
+    metrics,
+    server_timing_header,
+    span,
+    start_request_spans
+)
+
+
+def _fast_response(response_model: Any, status_code: Optional[int]) -> Callable[[Any], Any]:
+    """
+    Wrap an endpoint result that is exactly its declared response model (or a list of it) in
+    a FastJSONResponse. FastAPI returns Response objects as they are, so the result is
+    serialised once with orjson instead of being dumped, re-validated against the model,
+    serialised again and passed through json.dumps. Other results are left to FastAPI.
+    The response model still documents the endpoint in the OpenAPI schema.
+    """
+    if isinstance(response_model, type) and issubclass(response_model, BaseModel):
+        def matches(result):
+            return type(result) is response_model
+    elif typing.get_origin(response_model) is list and len(typing.get_args(response_model)) == 1:
+        item_model = typing.get_args(response_model)[0]
+        if not (isinstance(item_model, type) and issubclass(item_model, BaseModel)):
+            return lambda result: result
+
+        def matches(result):
+            return isinstance(result, list) and all(type(item) is item_model for item in result)
+    else:
+        return lambda result: result
+
+    def to_response(result):
+        if matches(result):
+            return FastJSONResponse(result, status_code=status_code or 200)
+        return result
+    return to_response
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that times the endpoint function and, separately, everything the route does
+    after it returns (JSON serialisation, or FastAPI's response model validation for
+    results that do not take the fast path; see _fast_response).
+    Use as APIRouter(route_class=TimedRoute).
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        # include_router re-creates routes from the already wrapped endpoint; wrap only once.
+        # functools.wraps keeps the signature FastAPI inspects for parameters.
+        to_response = _fast_response(kwargs.get("response_model"), kwargs.get("status_code"))
+        if getattr(endpoint, "_timed_endpoint", False):
+            timed_endpoint = endpoint
+        elif asyncio.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def timed_endpoint(*args, **endpoint_kwargs):
+                with span("endpoint"):
+                    result = await endpoint(*args, **endpoint_kwargs)
+                return to_response(result)
+        else:
+            @functools.wraps(endpoint)
+            def timed_endpoint(*args, **endpoint_kwargs):
+                with span("endpoint"):
+                    result = endpoint(*args, **endpoint_kwargs)
+                return to_response(result)
+        timed_endpoint._timed_endpoint = True
+
+        super().__init__(path, timed_endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        route_path = self.path_format
+
+        async def timed_handler(request: Request) -> Response:
+            started = time.perf_counter()
+            status_code = 500
+            request_spans = current_request_spans()
+            spans_before = len(request_spans) if request_spans is not None else 0
+            try:
+                response = await handler(request)
+                status_code = response.status_code
+                return response
+            except HTTPException as exc:
+                status_code = exc.status_code
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                metrics.observe(
+                    "macro_http_request_duration_seconds", elapsed,
+                    route=route_path, method=request.method, status=str(status_code)
+                )
+                if request_spans is not None:
+                    endpoint_seconds = sum(
+                        seconds for name, seconds in request_spans[spans_before:] if name == "endpoint"
+                    )
+                    serialize_seconds = max(0.0, elapsed - endpoint_seconds)
+                    request_spans.append(("serialize", serialize_seconds))
+                    metrics.observe("macro_span_seconds", serialize_seconds, span="serialize")
+
+        return timed_handler
+
+
+class ServerTimingMiddleware:
+    """
+    Collects the spans recorded while handling each request and, when
+    settings.SERVER_TIMING_ENABLED, reports them in a Server-Timing response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_spans = start_request_spans()
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING_ENABLED:
+                request_spans.append(("total", time.perf_counter() - started))
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing_header(request_spans).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
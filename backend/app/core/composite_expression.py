@@ -0,0 +1,187 @@
+# backend/app/core/composite_expression.py
+
+"""
+Parser for declarative composite indicator expressions.
+
+Grammar (operators must be separated from leaf symbols by whitespace, because
+symbols such as "BTC-USD" or "GC=F" may contain '-' and '='):
+
+    expression := term (("+" | "-") term)*
+    term       := factor (("*" | "/") factor)*
+    factor     := "-" factor | NUMBER | leaf | FUNCTION "(" expression ")" | "(" expression ")"
+    leaf       := SOURCE ":" SYMBOL
+
+Sources:
+    fred:SERIES_ID       a FRED series, e.g. fred:DGS10
+    yahoo:TICKER         a Yahoo Finance ticker, e.g. yahoo:GC=F
+    indicator:ID         another configured indicator (composite, FRED or Yahoo backed)
+
+Functions:
+    yoy(x)               12-month % change of x on month-end values
+    log(x)               natural logarithm of x
+
+Examples:
+    "yahoo:GC=F / yahoo:HG=F"
+    "fred:DGS10 - fred:DGS2"
+    "fred:DGS5 - yoy(fred:CPIAUCSL)"
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Tuple, Union
+
+LEAF_SOURCES = ("fred", "yahoo", "indicator")
+FUNCTIONS = ("yoy", "log")
+_OPERATORS = "+-*/()"
+_SYMBOL_PATTERN = re.compile(r"^[A-Za-z0-9_.=^\-]+$")
+
+
+class CompositeExpressionError(ValueError):
+    """Raised when a composite expression cannot be parsed or resolved."""
+
+
+@dataclass(frozen=True)
+class Number:
+    value: float
+
+
+@dataclass(frozen=True)
+class Leaf:
+    source: str
+    symbol: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.source}:{self.symbol}"
+
+
+@dataclass(frozen=True)
+class Negate:
+    operand: "Node"
+
+
+@dataclass(frozen=True)
+class BinaryOp:
+    operator: str
+    left: "Node"
+    right: "Node"
+
+
+@dataclass(frozen=True)
+class Call:
+    function: str
+    argument: "Node"
+
+
+Node = Union[Number, Leaf, Negate, BinaryOp, Call]
+
+
+def _tokenize(expression: str) -> List[str]:
+    tokens: List[str] = []
+    position = 0
+    length = len(expression)
+    while position < length:
+        char = expression[position]
+        if char.isspace():
+            position += 1
+        elif char in _OPERATORS:
+            tokens.append(char)
+            position += 1
+        else:
+            # A word runs until whitespace or a parenthesis, so leaf symbols may contain '-', '=', '.', '^'
+            start = position
+            while position < length and not expression[position].isspace() and expression[position] not in "()":
+                position += 1
+            tokens.append(expression[start:position])
+    return tokens
+
+
+class _Parser:
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.position = 0
+
+    def _peek(self) -> str:
+        return self.tokens[self.position] if self.position < len(self.tokens) else ""
+
+    def _next(self) -> str:
+        token = self._peek()
+        if not token:
+            raise CompositeExpressionError(f"Unexpected end of expression: '{self.expression}'")
+        self.position += 1
+        return token
+
+    def _expect(self, token: str) -> None:
+        actual = self._next()
+        if actual != token:
+            raise CompositeExpressionError(f"Expected '{token}' but found '{actual}' in '{self.expression}'")
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise CompositeExpressionError("Composite expression is empty")
+        node = self._expression()
+        if self._peek():
+            raise CompositeExpressionError(f"Unexpected token '{self._peek()}' in '{self.expression}'")
+        return node
+
+    def _expression(self) -> Node:
+        node = self._term()
+        while self._peek() in ("+", "-"):
+            operator = self._next()
+            node = BinaryOp(operator, node, self._term())
+        return node
+
+    def _term(self) -> Node:
+        node = self._factor()
+        while self._peek() in ("*", "/"):
+            operator = self._next()
+            node = BinaryOp(operator, node, self._factor())
+        return node
+
+    def _factor(self) -> Node:
+        token = self._next()
+        if token == "-":
+            return Negate(self._factor())
+        if token == "(":
+            node = self._expression()
+            self._expect(")")
+            return node
+        if token in FUNCTIONS:
+            self._expect("(")
+            argument = self._expression()
+            self._expect(")")
+            return Call(token, argument)
+        if ":" in token:
+            source, _, symbol = token.partition(":")
+            if source not in LEAF_SOURCES or not _SYMBOL_PATTERN.match(symbol):
+                raise CompositeExpressionError(
+                    f"Invalid series reference '{token}'. Use one of: {', '.join(s + ':<id>' for s in LEAF_SOURCES)}."
+                )
+            return Leaf(source, symbol)
+        try:
+            return Number(float(token))
+        except ValueError:
+            raise CompositeExpressionError(f"Unrecognised token '{token}' in '{self.expression}'")
+
+
+def parse_expression(expression: str) -> Node:
+    """Parse a composite expression into an expression tree."""
+    return _Parser(expression).parse()
+
+
+def collect_leaves(node: Node) -> Tuple[Leaf, ...]:
+    """Unique leaf references of an expression tree, in first-seen order."""
+    seen = {}
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, Leaf):
+            seen.setdefault(current.key, current)
+        elif isinstance(current, Negate):
+            stack.append(current.operand)
+        elif isinstance(current, Call):
+            stack.append(current.argument)
+        elif isinstance(current, BinaryOp):
+            stack.extend((current.right, current.left))
+    return tuple(seen.values())
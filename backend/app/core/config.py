@@ -13,6 +13,104 @@ class Settings(BaseSettings):
     # External API keys
     FRED_API_KEY: str = os.getenv("FRED_API_KEY", "")
     
+    # Local series store settings
+    HISTORY_START_DATE: str = os.getenv("HISTORY_START_DATE", "1990-01-01")
+    SERIES_CACHE_TTL_SECONDS: int = int(os.getenv("SERIES_CACHE_TTL_SECONDS", 3600))
+    # An expired indicator history is topped up from its last point, re-reading this many days for revisions
+    HISTORY_TOPUP_OVERLAP_DAYS: int = int(os.getenv("HISTORY_TOPUP_OVERLAP_DAYS", 366))
+    # ...and refetched in full once its last full fetch is older than this
+    HISTORY_FULL_REFRESH_SECONDS: int = int(os.getenv("HISTORY_FULL_REFRESH_SECONDS", 7 * 86400))
+
+    # Cache shared by all worker processes: "none", "memory" (in-process stand-in), "sqlite"
+    # or "mmap" (a memory-mapped columnar file per series in SHARED_CACHE_DIR)
+    SHARED_CACHE_BACKEND: str = os.getenv("SHARED_CACHE_BACKEND", "none")
+    SHARED_CACHE_PATH: str = os.getenv(
+        "SHARED_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "cache", "series.sqlite3")
+    )
+    SHARED_CACHE_DIR: str = os.getenv(
+        "SHARED_CACHE_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "cache", "series")
+    )
+    # A refresh lease expires after this long, so a crashed worker cannot block a series
+    SHARED_CACHE_LEASE_SECONDS: float = float(os.getenv("SHARED_CACHE_LEASE_SECONDS", 120))
+    # How long other workers wait for the lease holder's result before fetching themselves
+    SHARED_CACHE_WAIT_SECONDS: float = float(os.getenv("SHARED_CACHE_WAIT_SECONDS", 60))
+    SHARED_CACHE_POLL_SECONDS: float = float(os.getenv("SHARED_CACHE_POLL_SECONDS", 0.2))
+
+    # Indicator and category definitions, reloaded when the file changes (checked at most this often; 0 disables)
+    INDICATOR_REGISTRY_PATH: str = os.getenv(
+        "INDICATOR_REGISTRY_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "indicators.toml")
+    )
+    INDICATOR_REGISTRY_RELOAD_SECONDS: float = float(os.getenv("INDICATOR_REGISTRY_RELOAD_SECONDS", 2))
+
+    # Derived results (composites, market status, dashboard bundles) are recomputed in the background
+    # once a series they depend on changes; changes within this many seconds are handled together
+    DEPENDENCY_REFRESH_DELAY_SECONDS: float = float(os.getenv("DEPENDENCY_REFRESH_DELAY_SECONDS", 1.0))
+
+    # Snapshot bundle (see app/services/snapshot_service.py) loaded into the series store at startup
+    SNAPSHOT_PATH: str = os.getenv("SNAPSHOT_PATH", "")
+
+    # Load every indicator's history into the series store in the background at startup
+    PREWARM_ON_STARTUP: bool = os.getenv("PREWARM_ON_STARTUP", "false").lower() == "true"
+
+    # Upstream access mode: "live", "record" (live + write responses to disk) or "replay" (disk only)
+    UPSTREAM_MODE: str = os.getenv("UPSTREAM_MODE", "live")
+    UPSTREAM_RECORDINGS_DIR: str = os.getenv(
+        "UPSTREAM_RECORDINGS_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "recordings")
+    )
+    # Injected latency and error profile for upstream calls (load testing)
+    UPSTREAM_LATENCY_MS: float = float(os.getenv("UPSTREAM_LATENCY_MS", 0))
+    UPSTREAM_LATENCY_JITTER_MS: float = float(os.getenv("UPSTREAM_LATENCY_JITTER_MS", 0))
+    UPSTREAM_ERROR_RATE: float = float(os.getenv("UPSTREAM_ERROR_RATE", 0))
+    UPSTREAM_FAULT_SEED: int = int(os.getenv("UPSTREAM_FAULT_SEED", 0))
+
+    # Upper bound on every upstream call
+    UPSTREAM_TIMEOUT_SECONDS: float = float(os.getenv("UPSTREAM_TIMEOUT_SECONDS", 10))
+    # Keep-alive connections per upstream source
+    UPSTREAM_POOL_SIZE: int = int(os.getenv("UPSTREAM_POOL_SIZE", 10))
+    # FRED fetch planner: series fetched concurrently for one dashboard view, and series info lifetime
+    FRED_MAX_CONCURRENCY: int = int(os.getenv("FRED_MAX_CONCURRENCY", 4))
+    FRED_SERIES_INFO_TTL_SECONDS: int = int(os.getenv("FRED_SERIES_INFO_TTL_SECONDS", 86400))
+    # Per-source circuit breaker (see app/services/circuit_breaker.py)
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5))
+    CIRCUIT_RESET_SECONDS: float = float(os.getenv("CIRCUIT_RESET_SECONDS", 30))
+    CIRCUIT_MAX_RESET_SECONDS: float = float(os.getenv("CIRCUIT_MAX_RESET_SECONDS", 300))
+
+    # Upstream rate limits per source and API key (see app/services/rate_governor.py); 0 disables
+    FRED_REQUESTS_PER_MINUTE: float = float(os.getenv("FRED_REQUESTS_PER_MINUTE", 120))
+    FRED_BURST: float = float(os.getenv("FRED_BURST", 20))
+    YAHOO_REQUESTS_PER_MINUTE: float = float(os.getenv("YAHOO_REQUESTS_PER_MINUTE", 60))
+    YAHOO_BURST: float = float(os.getenv("YAHOO_BURST", 5))
+    DBNOMICS_REQUESTS_PER_MINUTE: float = float(os.getenv("DBNOMICS_REQUESTS_PER_MINUTE", 300))
+    DBNOMICS_BURST: float = float(os.getenv("DBNOMICS_BURST", 20))
+    # How long a call may wait for a token before stale data is served instead
+    RATE_LIMIT_INTERACTIVE_WAIT_SECONDS: float = float(os.getenv("RATE_LIMIT_INTERACTIVE_WAIT_SECONDS", 5))
+    RATE_LIMIT_BACKGROUND_WAIT_SECONDS: float = float(os.getenv("RATE_LIMIT_BACKGROUND_WAIT_SECONDS", 120))
+    # Share of each bucket that background refreshes leave for interactive requests
+    RATE_LIMIT_BACKGROUND_RESERVE: float = float(os.getenv("RATE_LIMIT_BACKGROUND_RESERVE", 0.25))
+
+    # Directory that relative IndicatorMetadata.backfill paths resolve against (defaults to backend/)
+    BACKFILL_DATA_DIR: str = os.getenv(
+        "BACKFILL_DATA_DIR",
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+
+    # Logging (see app/core/logging_config.py)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # "text" or "json"
+    LOG_ASYNC: bool = os.getenv("LOG_ASYNC", "true").lower() == "true"
+    LOG_SAMPLE_BURST: int = int(os.getenv("LOG_SAMPLE_BURST", 0))  # 0 disables sampling
+    LOG_SAMPLE_WINDOW_SECONDS: float = float(os.getenv("LOG_SAMPLE_WINDOW_SECONDS", 60))
+
+    # Report per-request timing spans in a Server-Timing response header
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+
+    # Backtest settings
+    BACKTEST_REPORT_TTL_SECONDS: int = int(os.getenv("BACKTEST_REPORT_TTL_SECONDS", 86400))
+    
     # Database settings can be added later
     
     # CORS settings
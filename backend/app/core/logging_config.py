@@ -0,0 +1,152 @@
+# backend/app/core/logging_config.py
+
+"""
+Process-wide logging setup.
+
+Settings:
+    LOG_LEVEL                 root level (default INFO)
+    LOG_FORMAT                "text" (human readable) or "json" (one object per line)
+    LOG_ASYNC                 hand records to a background thread through a queue, so request
+                              threads never block on, or pay for, formatting and stdout writes
+    LOG_SAMPLE_BURST          when > 0, each INFO/DEBUG message template is emitted at most this
+                              many times per LOG_SAMPLE_WINDOW_SECONDS (per logger); the number of
+                              suppressed records is reported with the next emitted one.
+                              WARNING and above are never sampled.
+
+Log with %-style arguments (logger.info("Fetched %s points", n)) rather than f-strings: the
+message is then only formatted if a handler actually emits it, and sampling can recognise
+repeated messages by their template.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is emitted as a field
+_RESERVED_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "suppressed"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, level, logger, message, plus any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "suppressed", 0):
+            payload["suppressed"] = record.suppressed
+        for key, value in vars(record).items():
+            if key not in _RESERVED_RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_text or record.exc_info:
+            payload["exc"] = record.exc_text or self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        return f"{text} [{suppressed} similar suppressed]" if suppressed else text
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limits repetitive INFO/DEBUG records by (logger, message template): at most `burst`
+    records per template per `window_seconds`. Runs before the record is queued or formatted.
+    """
+
+    def __init__(self, burst: int, window_seconds: float):
+        super().__init__()
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        # {(logger name, template): (window start, emitted in window, suppressed in window)}
+        self._windows: Dict[Tuple[str, str], Tuple[float, int, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window_start, emitted, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - window_start >= self.window_seconds:
+                window_start, emitted = now, 0
+            if emitted >= self.burst:
+                self._windows[key] = (window_start, emitted, suppressed + 1)
+                return False
+            self._windows[key] = (window_start, emitted + 1, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues the record without formatting it, so message formatting
+    happens on the listener thread. Exception text is rendered eagerly because tracebacks
+    refer to frames of the calling thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        return record
+
+
+def configure_logging() -> None:
+    """Install the root handlers described by the LOG_* settings. Safe to call more than once."""
+    global _listener
+
+    formatter: logging.Formatter = JsonFormatter() if settings.LOG_FORMAT == "json" else TextFormatter(TEXT_FORMAT)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    if settings.LOG_ASYNC:
+        handler: logging.Handler = DeferredQueueHandler(queue.SimpleQueue())
+        _listener = logging.handlers.QueueListener(handler.queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        handler = stream_handler
+
+    if settings.LOG_SAMPLE_BURST > 0:
+        handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_BURST, settings.LOG_SAMPLE_WINDOW_SECONDS))
+
+    root.addHandler(handler)
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,195 @@
+# backend/app/core/metrics.py
+
+"""
+In-process metrics: counters, latency histograms and per-request timing spans.
+
+    with span("upstream", source="fred"):
+        ...                                  # recorded in macro_span_seconds{span="upstream",source="fred"}
+    record_cache("series_store", hit=True)   # macro_cache_requests_total{cache="series_store",result="hit"}
+
+Spans opened while a request is being handled are also collected for that request
+(see app/api/timing.py) and returned in its Server-Timing header. The registry is
+rendered in the Prometheus text exposition format by GET /metrics.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+LatencyBuckets = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+# Spans of the request currently being handled: list of (name, seconds)
+_request_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("request_spans", default=None)
+
+
+class _Histogram:
+    __slots__ = ("bucket_counts", "count", "total")
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LatencyBuckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        for index, bound in enumerate(LatencyBuckets):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+
+
+class MetricsRegistry:
+    """Thread-safe store of labelled counters, gauges and histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelSet, float]] = {}
+        self._gauges: Dict[str, Dict[LabelSet, float]] = {}
+        self._histograms: Dict[str, Dict[LabelSet, _Histogram]] = {}
+        self._help: Dict[str, str] = {}
+
+    @staticmethod
+    def _labels(labels: Dict[str, str]) -> LabelSet:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram()
+            histogram.observe(value)
+
+    def counter_value(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(self._labels(labels), 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    @staticmethod
+    def _format_labels(labels: LabelSet, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = labels + extra
+        if not pairs:
+            return ""
+        escaped = (
+            key + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+            for key, value in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{self._format_labels(labels)} {value:g}")
+
+            for name in sorted(self._gauges):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} gauge")
+                for labels, value in sorted(self._gauges[name].items()):
+                    lines.append(f"{name}{self._format_labels(labels)} {value:g}")
+
+            for name in sorted(self._histograms):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    for bound, count in zip(LatencyBuckets, histogram.bucket_counts):
+                        lines.append(f"{name}_bucket{self._format_labels(labels, (('le', f'{bound:g}'),))} {count}")
+                    lines.append(f"{name}_bucket{self._format_labels(labels, (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.total:.6f}")
+                    lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+metrics.describe("macro_span_seconds", "Duration of timed processing phases")
+metrics.describe("macro_http_request_duration_seconds", "Duration of API requests by route")
+metrics.describe("macro_cache_requests_total", "Cache lookups by cache and result")
+metrics.describe("macro_upstream_requests_total", "Upstream calls by source and outcome")
+metrics.describe("macro_upstream_retries_total", "Upstream call retries by source")
+metrics.describe("macro_rate_limit_tokens", "Tokens left in each upstream rate-limit bucket")
+metrics.describe("macro_rate_limit_waiting", "Upstream calls queued for a rate-limit token by priority")
+metrics.describe("macro_rate_limit_wait_seconds", "Time upstream calls waited for a rate-limit token")
+metrics.describe("macro_rate_limit_rejections_total", "Upstream calls refused because no token became available in time")
+metrics.describe("macro_series_store_series", "Series held in the in-process series store")
+metrics.describe("macro_series_store_points", "Data points held in the in-process series store")
+metrics.describe("macro_series_store_bytes", "Bytes of date/value buffers held in the in-process series store")
+metrics.describe("macro_circuit_state", "Circuit breaker state per source (0 closed, 1 open, 2 half-open)")
+metrics.describe("macro_circuit_transitions_total", "Circuit breaker state changes by source and new state")
+metrics.describe("macro_stale_served_total", "Expired cached series served because a refresh returned no data")
+
+
+@contextmanager
+def span(name: str, **labels: str) -> Iterator[None]:
+    """Time a block, recording it in macro_span_seconds and in the current request's spans."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        metrics.observe("macro_span_seconds", elapsed, span=name, **labels)
+        request_spans = _request_spans.get()
+        if request_spans is not None:
+            label = "-".join([name, *labels.values()]) if labels else name
+            request_spans.append((label, elapsed))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    metrics.increment("macro_cache_requests_total", cache=cache, result="hit" if hit else "miss")
+
+
+def record_upstream(source: str, outcome: str) -> None:
+    metrics.increment("macro_upstream_requests_total", source=source, outcome=outcome)
+
+
+def start_request_spans() -> List[Tuple[str, float]]:
+    """Begin collecting spans for the current request; returns the (mutable) span list."""
+    request_spans: List[Tuple[str, float]] = []
+    _request_spans.set(request_spans)
+    return request_spans
+
+
+def current_request_spans() -> Optional[List[Tuple[str, float]]]:
+    return _request_spans.get()
+
+
+def server_timing_header(request_spans: List[Tuple[str, float]]) -> str:
+    """Server-Timing header value, summing repeated spans (e.g. one per upstream call)."""
+    totals: Dict[str, Tuple[float, int]] = {}
+    for name, seconds in request_spans:
+        total, count = totals.get(name, (0.0, 0))
+        totals[name] = (total + seconds, count + 1)
+    return ", ".join(
+        f'{name};dur={total * 1000:.1f}' + (f';desc="x{count}"' if count > 1 else "")
+        for name, (total, count) in totals.items()
+    )
@@ -27,6 +27,13 @@ class IndicatorSignal(BaseModel):
     chart_data: List[TimeSeriesPoint]
     metadata: Optional[dict] = None
 
+class SignalInterval(BaseModel):
+    """A run of consecutive data points that share the same signal status."""
+    start_date: datetime
+    end_date: datetime
+    signal: SignalStatus
+    points: int
+
 class EnrichedIndicatorData(BaseModel):
     """Enriched indicator data with transformations, signals, and metadata."""
     indicator_id: str
@@ -43,6 +50,9 @@ class EnrichedIndicatorData(BaseModel):
     last_updated: Optional[datetime] = None
     y_axis_domain: Optional[List[float]] = None
     ma_series_data: Optional[List[TimeSeriesPoint]] = None # New field for MA line data
+    signal_series: Optional[List[SignalInterval]] = None # Run-length encoded per-point signal history
+    stale: bool = False # True when served from a last-known-good copy (source down or rate limited)
+    as_of: Optional[datetime] = None # When the underlying data was fetched from its source
 
 class IndicatorMetadataResponse(BaseModel):
     """Response model for indicator metadata."""
@@ -78,3 +88,94 @@ class IndicatorsByTypeResponse(BaseModel):
     indicator_type: str
     indicators: List[EnrichedIndicatorData]
     categories: List[CategoryInfo]
+
+class HorizonHitRate(BaseModel):
+    """Share of bullish/bearish signals followed by a benchmark move in the same direction."""
+    horizon_months: int
+    hit_rate: Optional[float] = None
+    bullish_hit_rate: Optional[float] = None
+    bearish_hit_rate: Optional[float] = None
+    observations: int
+
+class ForwardReturnDistribution(BaseModel):
+    """Distribution of benchmark forward returns conditional on the indicator's signal."""
+    horizon_months: int
+    signal: SignalStatus
+    count: int
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    p10: Optional[float] = None
+    p90: Optional[float] = None
+
+class IndicatorBacktestResult(BaseModel):
+    """Backtest statistics for a single indicator."""
+    indicator_id: str
+    name: str
+    category: str
+    indicator_type: str
+    months_evaluated: int
+    first_date: Optional[datetime] = None
+    last_date: Optional[datetime] = None
+    hit_rates: List[HorizonHitRate]
+    forward_returns: List[ForwardReturnDistribution]
+    return_lead_lag_correlation: List[Optional[float]] # Index is the lag in months
+    best_return_lag_months: Optional[int] = None
+    best_return_correlation: Optional[float] = None
+    recession_lead_lag_correlation: List[Optional[float]] # Bearish signal vs recession k months later
+    best_recession_lag_months: Optional[int] = None
+    recessions_evaluated: int = 0
+    recessions_signalled: int = 0
+    median_recession_lead_months: Optional[float] = None
+
+class BacktestReport(BaseModel):
+    """Backtest report across all evaluated indicators."""
+    generated_at: datetime
+    benchmark_indicator_id: str
+    recession_series_id: str
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    horizons_months: List[int]
+    lags_months: List[int]
+    indicators: List[IndicatorBacktestResult]
+
+class AlignedPanelResponse(BaseModel):
+    """Date-aligned panel of several indicators in columnar form."""
+    frequency: str
+    transformed: bool
+    dates: List[datetime]
+    indicator_ids: List[str]
+    values: List[List[Optional[float]]] # values[i][t] is indicator_ids[i] at dates[t]
+    missing_indicators: List[str] = []
+
+class CorrelationMatrixResponse(BaseModel):
+    """Pairwise correlations over the latest rolling window, suitable for a heatmap."""
+    frequency: str
+    window: int
+    as_of: datetime
+    indicator_ids: List[str]
+    matrix: List[List[Optional[float]]]
+    observations: List[List[int]]
+
+class RollingCorrelationResponse(BaseModel):
+    """Rolling correlation history between two indicators."""
+    indicator_a: str
+    indicator_b: str
+    frequency: str
+    window: int
+    data: List[TimeSeriesPoint]
+
+class RegimeInterval(BaseModel):
+    """A run of consecutive periods classified into the same regime."""
+    start_date: datetime
+    end_date: datetime
+    regime: str
+    periods: int
+
+class RegimeResponse(BaseModel):
+    """Current and historical market regime derived from the composite signal vector."""
+    frequency: str
+    as_of: datetime
+    regime: str # "expansion", "slowdown", "contraction" or "recovery"
+    leading_score: float
+    coincident_score: float
+    history: List[RegimeInterval]
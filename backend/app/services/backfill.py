@@ -0,0 +1,221 @@
+# backend/app/services/backfill.py
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.core.indicator_config import BackfillConfig, BackfillPrecedence
+from app.core.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_DATES = np.array([], dtype="datetime64[ns]")
+_EMPTY_VALUES = np.array([], dtype=np.float64)
+
+
+class BackfillService:
+    """
+    Attaches local historical datasets (CSV, JSON or Parquet) to indicators as a second source.
+
+    Each dataset is parsed once into sorted datetime64/float64 arrays and reloaded only when the
+    file changes on disk. Merging with the live source is a single vectorised sort, and the merged
+    series is cached per indicator until either the live data or the dataset changes.
+    """
+
+    def __init__(self, data_dir: Optional[str] = None):
+        self.data_dir = data_dir or settings.BACKFILL_DATA_DIR
+        # {(path, series_key, date_column, value_column): (mtime_ns, dates, values)}
+        self._datasets: Dict[Tuple, Tuple[int, np.ndarray, np.ndarray]] = {}
+        # {indicator_id: (fingerprint, dates, values)}
+        self._merged: Dict[str, Tuple[Tuple, np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def resolve_path(self, config: BackfillConfig) -> str:
+        if os.path.isabs(config.path):
+            return config.path
+        return os.path.join(self.data_dir, config.path)
+
+    def _dataset_key(self, config: BackfillConfig) -> Tuple:
+        return (self.resolve_path(config), config.series_key, config.date_column, config.value_column)
+
+    # --- Loading ---
+
+    @staticmethod
+    def _read_json(path: str, config: BackfillConfig) -> pd.DataFrame:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            if not config.series_key:
+                raise ValueError(f"Backfill file {path} is keyed by series; set series_key (one of: {', '.join(data)})")
+            data = data.get(config.series_key, [])
+        return pd.DataFrame.from_records(data, columns=[config.date_column, config.value_column])
+
+    @staticmethod
+    def _read_csv(path: str, config: BackfillConfig) -> pd.DataFrame:
+        # memory_map avoids an extra buffered copy of the file while parsing
+        return pd.read_csv(path, usecols=[config.date_column, config.value_column], memory_map=True)
+
+    @staticmethod
+    def _read_parquet(path: str, config: BackfillConfig) -> pd.DataFrame:
+        # Only the two needed columns are read; pyarrow memory-maps the file
+        return pd.read_parquet(path, columns=[config.date_column, config.value_column], memory_map=True)
+
+    def _parse(self, path: str, config: BackfillConfig) -> Tuple[np.ndarray, np.ndarray]:
+        readers = {"csv": self._read_csv, "json": self._read_json, "parquet": self._read_parquet}
+        frame = readers[config.resolved_format](path, config)
+
+        dates = pd.to_datetime(frame[config.date_column], errors="coerce").to_numpy(dtype="datetime64[ns]")
+        values = pd.to_numeric(frame[config.value_column], errors="coerce").to_numpy(dtype=np.float64)
+        valid = ~(np.isnat(dates) | np.isnan(values))
+        if not valid.all():
+            logger.warning(f"Skipping {int((~valid).sum())} invalid rows in backfill file {path}")
+        dates, values = dates[valid], values[valid]
+
+        # Sort once; on duplicate dates the last row in the file wins
+        order = np.argsort(dates, kind="stable")
+        dates, values = dates[order], values[order]
+        keep_last = np.append(dates[1:] != dates[:-1], True) if len(dates) else np.array([], dtype=bool)
+        return dates[keep_last], values[keep_last]
+
+    def load(self, config: BackfillConfig) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorted (dates, values) arrays of a backfill dataset.
+        Re-parsed only when the file's modification time changes; a missing or unreadable file yields empty arrays.
+        """
+        path = self.resolve_path(config)
+        cache_key = self._dataset_key(config)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            logger.error(f"Backfill file not found: {path}")
+            return _EMPTY_DATES, _EMPTY_VALUES
+
+        with self._lock:
+            cached = self._datasets.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                record_cache("backfill_dataset", hit=True)
+                return cached[1], cached[2]
+        record_cache("backfill_dataset", hit=False)
+
+        try:
+            dates, values = self._parse(path, config)
+        except ImportError as e:
+            logger.error(f"Cannot read backfill file {path}: {e}")
+            return _EMPTY_DATES, _EMPTY_VALUES
+        except Exception as e:
+            logger.error(f"Error loading backfill file {path}: {e}", exc_info=True)
+            return _EMPTY_DATES, _EMPTY_VALUES
+
+        with self._lock:
+            self._datasets[cache_key] = (mtime_ns, dates, values)
+        logger.info("Loaded backfill dataset %s (%s): %s points", path, config.series_key or config.value_column, len(dates))
+        return dates, values
+
+    # --- Merging ---
+
+    @staticmethod
+    def merge_arrays(
+        backfill_dates: np.ndarray,
+        backfill_values: np.ndarray,
+        live_dates: np.ndarray,
+        live_values: np.ndarray,
+        precedence: BackfillPrecedence
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Union of two sorted series. On dates present in both, the source named by precedence wins.
+        """
+        if len(backfill_dates) == 0:
+            return live_dates, live_values
+        if len(live_dates) == 0:
+            return backfill_dates, backfill_values
+
+        # The preferred source goes last so that a stable sort followed by "keep last" picks it
+        if precedence == BackfillPrecedence.LIVE:
+            dates = np.concatenate((backfill_dates, live_dates))
+            values = np.concatenate((backfill_values, live_values))
+        else:
+            dates = np.concatenate((live_dates, backfill_dates))
+            values = np.concatenate((live_values, backfill_values))
+
+        order = np.argsort(dates, kind="stable")
+        dates, values = dates[order], values[order]
+        keep_last = np.append(dates[1:] != dates[:-1], True)
+        return dates[keep_last], values[keep_last]
+
+    @staticmethod
+    def _fingerprint(dates: np.ndarray, values: np.ndarray) -> Tuple:
+        """Cheap identity of a live series, used to detect when the merged series must be rebuilt."""
+        return (len(dates), hash(dates.tobytes()), hash(values.tobytes()))
+
+    def live_start_date(self, config: BackfillConfig, start_date: Optional[str]) -> Optional[str]:
+        """
+        Start date to request from the live source. When the local dataset takes precedence, the
+        history it already covers is not requested from upstream again.
+        """
+        if config.precedence != BackfillPrecedence.BACKFILL:
+            return start_date
+        dates, _ = self.load(config)
+        if len(dates) == 0:
+            return start_date
+        day_after_backfill = (pd.Timestamp(dates[-1]) + pd.Timedelta(days=1))
+        if start_date and pd.to_datetime(start_date) >= day_after_backfill:
+            return start_date
+        return day_after_backfill.strftime("%Y-%m-%d")
+
+    def apply(
+        self,
+        indicator_id: str,
+        config: BackfillConfig,
+        live_df: pd.DataFrame,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Merge an indicator's live data with its backfill dataset and slice the result to [start_date, end_date].
+
+        Args:
+            indicator_id: Indicator the backfill is attached to (merged-series cache key)
+            config: The indicator's backfill configuration
+            live_df: DataFrame with date and value columns from the live source
+            start_date: Optional start date (YYYY-MM-DD); open when omitted
+            end_date: Optional end date (YYYY-MM-DD); open when omitted
+
+        Returns:
+            pandas.DataFrame: DataFrame with date and value columns
+        """
+        backfill_dates, backfill_values = self.load(config)
+
+        if live_df.empty:
+            live_dates, live_values = _EMPTY_DATES, _EMPTY_VALUES
+        else:
+            live_df = live_df.dropna(subset=["value"]).sort_values("date")
+            live_dates = pd.to_datetime(live_df["date"]).to_numpy(dtype="datetime64[ns]")
+            live_values = live_df["value"].to_numpy(dtype=np.float64)
+
+        with self._lock:
+            dataset_mtime = self._datasets.get(self._dataset_key(config), (None,))[0]
+            cached = self._merged.get(indicator_id)
+        fingerprint = (self._fingerprint(live_dates, live_values), dataset_mtime, config.precedence)
+        if cached is not None and cached[0] == fingerprint:
+            dates, values = cached[1], cached[2]
+        else:
+            dates, values = self.merge_arrays(backfill_dates, backfill_values, live_dates, live_values, config.precedence)
+            with self._lock:
+                self._merged[indicator_id] = (fingerprint, dates, values)
+
+        lo = int(np.searchsorted(dates, np.datetime64(pd.to_datetime(start_date), "ns"), side="left")) if start_date else 0
+        hi = int(np.searchsorted(dates, np.datetime64(pd.to_datetime(end_date), "ns"), side="right")) if end_date else len(dates)
+        logger.info(
+            "Backfill for %s: %s live + %s local points -> %s points in window", indicator_id, len(live_dates), len(backfill_dates), hi - lo
+        )
+        return pd.DataFrame({"date": dates[lo:hi], "value": values[lo:hi]})
+
+
+# Process-wide instance shared by the indicator services
+backfill_service = BackfillService()
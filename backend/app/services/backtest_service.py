@@ -0,0 +1,331 @@
+# backend/app/services/backtest_service.py
+
+import threading
+import time
+import logging
+import warnings
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.core.indicator_config import get_all_indicators, get_indicator_metadata, SignalStatus
+from app.services.indicator_processing_service import (
+    SIGNAL_CODE_BULLISH,
+    SIGNAL_CODE_NEUTRAL,
+    SIGNAL_CODE_BEARISH,
+)
+from app.services.unified_indicator_service import UnifiedIndicatorService
+from app.services.panel_service import IndicatorPanelService
+from app.models.indicators import (
+    BacktestReport,
+    IndicatorBacktestResult,
+    HorizonHitRate,
+    ForwardReturnDistribution,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _optional_float(value, digits: int = 4) -> Optional[float]:
+    if value is None or not np.isfinite(value):
+        return None
+    return round(float(value), digits)
+
+
+class IndicatorBacktestService:
+    """
+    Measures how well each indicator's historical signal anticipated SP500 forward
+    returns and NBER recessions (FRED USREC).
+
+    All statistics are computed on a month-end grid as matrix operations across
+    every indicator, horizon and lag at once. Signals are placed at their publication
+    date (IndicatorPanelService.release_offset), so each month only scores what was
+    known at its end.
+    """
+
+    BENCHMARK_INDICATOR_ID = "SP500"
+    RECESSION_SERIES_ID = "USREC"
+    FORWARD_HORIZONS_MONTHS = (1, 3, 6, 12)
+    MAX_LAG_MONTHS = 24
+    RECESSION_LOOKBACK_MONTHS = 24
+    # Monthly/quarterly signals persist until the next release
+    SIGNAL_FORWARD_FILL_MONTHS = 3
+    MIN_CORRELATION_OBSERVATIONS = 24
+
+    def __init__(self, unified_service: Optional[UnifiedIndicatorService] = None):
+        self.unified_service = unified_service or UnifiedIndicatorService()
+        self.panel_service = IndicatorPanelService(self.unified_service)
+        self._report: Optional[BacktestReport] = None
+        self._report_generated_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def get_report(self, refresh: bool = False) -> BacktestReport:
+        """Return the cached backtest report, recomputing it when stale or on request."""
+        with self._lock:
+            is_fresh = (
+                self._report is not None
+                and time.time() - self._report_generated_at < settings.BACKTEST_REPORT_TTL_SECONDS
+            )
+            if is_fresh and not refresh:
+                record_cache("backtest_report", hit=True)
+                return self._report
+
+            record_cache("backtest_report", hit=False)
+            self._report = self.run_backtest()
+            self._report_generated_at = time.time()
+            return self._report
+
+    def get_indicator_result(self, indicator_id: str, refresh: bool = False) -> IndicatorBacktestResult:
+        if not get_indicator_metadata(indicator_id):
+            raise ValueError(f"Indicator '{indicator_id}' not found")
+        for result in self.get_report(refresh).indicators:
+            if result.indicator_id == indicator_id:
+                return result
+        raise ValueError(f"No backtest result available for indicator '{indicator_id}'")
+
+    # --- Data preparation ---
+
+    def _load_benchmark(self) -> pd.Series:
+        df = self.unified_service.get_raw_history(self.BENCHMARK_INDICATOR_ID)
+        if df.empty:
+            return pd.Series(dtype=np.float64)
+        return pd.Series(df["value"].to_numpy(), index=pd.DatetimeIndex(df["date"])).resample('ME').last()
+
+    def _load_recessions(self) -> pd.Series:
+        try:
+            df = self.unified_service.get_fred_history(self.RECESSION_SERIES_ID)
+        except Exception as e:
+            logger.error(f"Backtest: failed to load recession series: {e}", exc_info=True)
+            return pd.Series(dtype=np.float64)
+        if df.empty:
+            return pd.Series(dtype=np.float64)
+        return pd.Series(df["value"].to_numpy(), index=pd.DatetimeIndex(df["date"])).resample('ME').max()
+
+    # --- Vectorised statistics ---
+
+    @staticmethod
+    def _forward_returns(prices: np.ndarray, horizons: Tuple[int, ...]) -> np.ndarray:
+        """(months x horizons) matrix of simple forward returns; NaN where the horizon runs past the data."""
+        result = np.full((len(prices), len(horizons)), np.nan)
+        for column, horizon in enumerate(horizons):
+            if horizon < len(prices):
+                result[:-horizon, column] = prices[horizon:] / prices[:-horizon] - 1.0
+        return result
+
+    @staticmethod
+    def _lagged_matrix(values: np.ndarray, max_lag: int) -> np.ndarray:
+        """(months x lags) view where column k holds values[t + k]."""
+        padded = np.concatenate((values, np.full(max_lag, np.nan)))
+        return sliding_window_view(padded, max_lag + 1)[:len(values)]
+
+    @staticmethod
+    def _nan_correlation(x: np.ndarray, y: np.ndarray, min_observations: int) -> np.ndarray:
+        """
+        Pairwise Pearson correlation between every column of x (T x N) and every
+        column of y (T x K), using only rows where both values are present.
+        """
+        x_valid = ~np.isnan(x)
+        y_valid = ~np.isnan(y)
+        x0 = np.where(x_valid, x, 0.0)
+        y0 = np.where(y_valid, y, 0.0)
+        xm = x_valid.astype(np.float64)
+        ym = y_valid.astype(np.float64)
+
+        n = xm.T @ ym
+        sum_x = x0.T @ ym
+        sum_y = xm.T @ y0
+        sum_xy = x0.T @ y0
+        sum_xx = (x0 * x0).T @ ym
+        sum_yy = xm.T @ (y0 * y0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = sum_xy - sum_x * sum_y / n
+            variance_x = sum_xx - sum_x * sum_x / n
+            variance_y = sum_yy - sum_y * sum_y / n
+            correlation = covariance / np.sqrt(variance_x * variance_y)
+
+        invalid = (n < min_observations) | (variance_x <= 1e-12) | (variance_y <= 1e-12)
+        correlation[invalid] = np.nan
+        return correlation
+
+    @staticmethod
+    def _hit_rates(signals: np.ndarray, forward: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Bullish/bearish hit counts per (indicator x horizon)."""
+        forward_valid = ~np.isnan(forward)
+        with np.errstate(invalid="ignore"):
+            up = (forward > 0) & forward_valid
+            down = (forward < 0) & forward_valid
+        bullish = (signals == SIGNAL_CODE_BULLISH).astype(np.float64)
+        bearish = (signals == SIGNAL_CODE_BEARISH).astype(np.float64)
+
+        bullish_n = bullish.T @ forward_valid
+        bullish_hits = bullish.T @ up
+        bearish_n = bearish.T @ forward_valid
+        bearish_hits = bearish.T @ down
+        return bullish_n, bullish_hits, bearish_n, bearish_hits
+
+    @staticmethod
+    def _forward_return_distributions(signals: np.ndarray, forward: np.ndarray, code: int) -> Tuple[np.ndarray, ...]:
+        """Count, mean, median, p10 and p90 of forward returns per (indicator x horizon) for one signal code."""
+        mask = (signals == code)[:, :, None] & ~np.isnan(forward)[:, None, :]
+        conditional = np.where(mask, forward[:, None, :], np.nan)
+        count = mask.sum(axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            mean = np.nanmean(conditional, axis=0)
+            p10, median, p90 = np.nanpercentile(conditional, [10, 50, 90], axis=0)
+        return count, mean, median, p10, p90
+
+    @staticmethod
+    def _recession_leads(signals: np.ndarray, recessions: np.ndarray, lookback: int) -> Tuple[np.ndarray, ...]:
+        """
+        For every recession start, how many months before it each indicator first
+        turned bearish within the lookback window.
+        Returns (evaluated, signalled, median_lead) arrays per indicator.
+        """
+        indicator_count = signals.shape[1]
+        with np.errstate(invalid="ignore"):
+            in_recession = recessions > 0.5
+        starts = np.flatnonzero(in_recession[1:] & ~in_recession[:-1]) + 1
+        if len(starts) == 0:
+            zeros = np.zeros(indicator_count, dtype=int)
+            return zeros, zeros, np.full(indicator_count, np.nan)
+
+        bearish = (signals == SIGNAL_CODE_BEARISH)
+        has_data = ~np.isnan(signals)
+        pad_bearish = np.concatenate((np.zeros((lookback, indicator_count), dtype=bool), bearish))
+        pad_data = np.concatenate((np.zeros((lookback, indicator_count), dtype=bool), has_data))
+
+        # Windows of shape (recessions x indicators x lookback+1); the last element is the start month
+        bearish_windows = sliding_window_view(pad_bearish, lookback + 1, axis=0)[starts]
+        data_windows = sliding_window_view(pad_data, lookback + 1, axis=0)[starts]
+
+        evaluated = data_windows.any(axis=-1)
+        signalled = bearish_windows.any(axis=-1) & evaluated
+        leads = np.where(signalled, lookback - np.argmax(bearish_windows, axis=-1), np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            median_leads = np.nanmedian(leads, axis=0)
+        return evaluated.sum(axis=0), signalled.sum(axis=0), median_leads
+
+    # --- Report assembly ---
+
+    def run_backtest(self, indicator_ids: Optional[List[str]] = None) -> BacktestReport:
+        started = time.perf_counter()
+        if indicator_ids is None:
+            indicator_ids = list(get_all_indicators().keys())
+
+        benchmark = self._load_benchmark()
+        if benchmark.empty:
+            raise ValueError(f"No benchmark data available for {self.BENCHMARK_INDICATOR_ID}")
+
+        grid = benchmark.index
+        signal_frame = self.panel_service.build_signal_panel(
+            indicator_ids, "monthly", self.SIGNAL_FORWARD_FILL_MONTHS, as_published=True
+        ).reindex(grid)
+        recession_series = self._load_recessions()
+        recessions = recession_series.reindex(grid).to_numpy(dtype=np.float64)
+
+        signals = signal_frame.to_numpy(dtype=np.float64)
+        prices = benchmark.to_numpy(dtype=np.float64)
+        horizons = self.FORWARD_HORIZONS_MONTHS
+        lags = list(range(self.MAX_LAG_MONTHS + 1))
+
+        forward = self._forward_returns(prices, horizons)
+        one_month_ahead = self._forward_returns(prices, (1,))[:, 0]
+        return_correlation = self._nan_correlation(
+            signals, self._lagged_matrix(one_month_ahead, self.MAX_LAG_MONTHS), self.MIN_CORRELATION_OBSERVATIONS
+        )
+        bearish_indicator = np.where(np.isnan(signals), np.nan, (signals == SIGNAL_CODE_BEARISH).astype(np.float64))
+        recession_correlation = self._nan_correlation(
+            bearish_indicator, self._lagged_matrix(recessions, self.MAX_LAG_MONTHS), self.MIN_CORRELATION_OBSERVATIONS
+        )
+
+        bullish_n, bullish_hits, bearish_n, bearish_hits = self._hit_rates(signals, forward)
+        distributions = {
+            status: self._forward_return_distributions(signals, forward, code)
+            for status, code in (
+                (SignalStatus.BULLISH, SIGNAL_CODE_BULLISH),
+                (SignalStatus.NEUTRAL, SIGNAL_CODE_NEUTRAL),
+                (SignalStatus.BEARISH, SIGNAL_CODE_BEARISH),
+            )
+        }
+        recessions_evaluated, recessions_signalled, median_leads = self._recession_leads(
+            signals, recessions, self.RECESSION_LOOKBACK_MONTHS
+        )
+        months_evaluated = (~np.isnan(signals)).sum(axis=0)
+
+        results: List[IndicatorBacktestResult] = []
+        for column, indicator_id in enumerate(signal_frame.columns):
+            metadata = get_indicator_metadata(indicator_id)
+            valid_dates = signal_frame.index[~np.isnan(signals[:, column])]
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                hit_rates = [
+                    HorizonHitRate(
+                        horizon_months=horizon,
+                        hit_rate=_optional_float(
+                            (bullish_hits[column, h] + bearish_hits[column, h]) / (bullish_n[column, h] + bearish_n[column, h])
+                        ),
+                        bullish_hit_rate=_optional_float(bullish_hits[column, h] / bullish_n[column, h]),
+                        bearish_hit_rate=_optional_float(bearish_hits[column, h] / bearish_n[column, h]),
+                        observations=int(bullish_n[column, h] + bearish_n[column, h])
+                    )
+                    for h, horizon in enumerate(horizons)
+                ]
+
+            forward_returns = [
+                ForwardReturnDistribution(
+                    horizon_months=horizon,
+                    signal=status,
+                    count=int(count[column, h]),
+                    mean=_optional_float(mean[column, h]),
+                    median=_optional_float(median[column, h]),
+                    p10=_optional_float(p10[column, h]),
+                    p90=_optional_float(p90[column, h])
+                )
+                for status, (count, mean, median, p10, p90) in distributions.items()
+                for h, horizon in enumerate(horizons)
+            ]
+
+            return_row = return_correlation[column]
+            recession_row = recession_correlation[column]
+            best_return_lag = int(np.nanargmax(return_row)) if np.isfinite(return_row).any() else None
+            best_recession_lag = int(np.nanargmax(recession_row)) if np.isfinite(recession_row).any() else None
+
+            results.append(IndicatorBacktestResult(
+                indicator_id=indicator_id,
+                name=metadata.name,
+                category=metadata.category,
+                indicator_type=metadata.indicator_type.value,
+                months_evaluated=int(months_evaluated[column]),
+                first_date=valid_dates[0].to_pydatetime() if len(valid_dates) else None,
+                last_date=valid_dates[-1].to_pydatetime() if len(valid_dates) else None,
+                hit_rates=hit_rates,
+                forward_returns=forward_returns,
+                return_lead_lag_correlation=[_optional_float(value) for value in return_row],
+                best_return_lag_months=best_return_lag,
+                best_return_correlation=_optional_float(return_row[best_return_lag]) if best_return_lag is not None else None,
+                recession_lead_lag_correlation=[_optional_float(value) for value in recession_row],
+                best_recession_lag_months=best_recession_lag,
+                recessions_evaluated=int(recessions_evaluated[column]),
+                recessions_signalled=int(recessions_signalled[column]),
+                median_recession_lead_months=_optional_float(median_leads[column], 1)
+            ))
+
+        logger.info("Backtest completed for %s indicators over %s months in %.2fs", len(results), len(grid), time.perf_counter() - started)
+        return BacktestReport(
+            generated_at=datetime.now(),
+            benchmark_indicator_id=self.BENCHMARK_INDICATOR_ID,
+            recession_series_id=self.RECESSION_SERIES_ID,
+            start_date=grid[0].to_pydatetime(),
+            end_date=grid[-1].to_pydatetime(),
+            horizons_months=list(horizons),
+            lags_months=lags,
+            indicators=results
+        )
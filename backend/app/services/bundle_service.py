@@ -0,0 +1,174 @@
+# backend/app/services/bundle_service.py
+
+import gzip
+import hashlib
+import threading
+import time
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from app.core.config import settings
+from app.core.indicator_config import IndicatorType, get_indicators_by_type
+from app.core.metrics import record_cache, span
+from app.services.rate_governor import Priority, upstream_priority
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResponseBundle:
+    """A complete /type/{type} response for one default window, serialised and gzipped once."""
+    indicator_type: str
+    window: str
+    body: bytes  # gzip-compressed JSON
+    etag: str  # Strong ETag of the uncompressed JSON
+    size: int  # Uncompressed size in bytes
+    built_at: float
+    built_on: date
+    versions: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def gzip_etag(self) -> str:
+        """Strong ETag of the gzip-encoded body; a strong validator differs between content-codings."""
+        return f'{self.etag[:-1]}-gzip"'
+
+
+class BundleService:
+    """
+    Precomputed dashboard responses for every IndicatorType and default window.
+
+    The dashboard pages load the same windows over and over, so each (type, window) response
+    is built once, serialised and compressed, and then served as static bytes with a strong
+    ETag. A bundle is rebuilt when any of its indicators' stored series changed version, when
+    it is older than settings.SERIES_CACHE_TTL_SECONDS (so expired series get refreshed; a
+    negative TTL never expires), or when the day rolls over (windows are relative to today).
+    Custom windows keep using the dynamic path.
+    """
+
+    # Window name -> months back from today; the dashboard's date ranges (DATE_RANGES in
+    # frontend/src/services/DashboardConfig.ts, default 4Y), kept in step with them
+    WINDOWS: Dict[str, int] = {
+        "1Y": 12,
+        "2Y": 24,
+        "3Y": 36,
+        "4Y": 48,
+        "5Y": 60,
+        "10Y": 120,
+        "20Y": 240,
+    }
+
+    def __init__(self, unified_service):
+        self.unified_service = unified_service
+        self._bundles: Dict[Tuple[str, str], ResponseBundle] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def window_start(cls, window: str) -> str:
+        """
+        First date of a default window, as the frontend computes it.
+
+        Raises:
+            ValueError: If the window is not one of WINDOWS
+        """
+        if window not in cls.WINDOWS:
+            raise ValueError(f"Invalid window '{window}'. Valid windows are: {', '.join(cls.WINDOWS)}.")
+        return (pd.Timestamp(date.today()) - pd.DateOffset(months=cls.WINDOWS[window])).strftime("%Y-%m-%d")
+
+    def _versions(self, indicator_type: IndicatorType) -> Dict[str, int]:
+        store = self.unified_service.series_store
+        return {indicator_id: store.version(indicator_id) for indicator_id in get_indicators_by_type(indicator_type)}
+
+    def _is_current(self, bundle: ResponseBundle, indicator_type: IndicatorType) -> bool:
+        # A negative TTL (--offline) never expires, as in the series store
+        ttl = settings.SERIES_CACHE_TTL_SECONDS
+        return (
+            bundle.built_on == date.today()
+            and (ttl < 0 or time.time() - bundle.built_at < ttl)
+            and bundle.versions == self._versions(indicator_type)
+        )
+
+    def get(self, indicator_type: IndicatorType, window: str) -> ResponseBundle:
+        """
+        The current bundle for a type and window, built on demand if missing or out of date.
+
+        Raises:
+            ValueError: If the window is not one of WINDOWS
+        """
+        self.window_start(window)
+        key = (indicator_type.value, window)
+        bundle = self._bundles.get(key)
+        if bundle is not None and self._is_current(bundle, indicator_type):
+            record_cache("response_bundle", hit=True)
+            return bundle
+        record_cache("response_bundle", hit=False)
+
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            # Another request may have rebuilt it while we waited
+            bundle = self._bundles.get(key)
+            if bundle is not None and self._is_current(bundle, indicator_type):
+                return bundle
+            return self.build(indicator_type, window)
+
+    def build(self, indicator_type: IndicatorType, window: str) -> ResponseBundle:
+        """Build, serialise and compress the bundle for a type and window, replacing the old one."""
+        with span("bundle_build"):
+            response = self.unified_service.get_enriched_indicators_by_type(indicator_type, self.window_start(window))
+            # Versions after the build: the build itself refreshes expired series
+            versions = self._versions(indicator_type)
+            payload = response.model_dump_json().encode("utf-8")
+            bundle = ResponseBundle(
+                indicator_type=indicator_type.value,
+                window=window,
+                body=gzip.compress(payload, compresslevel=6),
+                etag=f'"{hashlib.sha256(payload).hexdigest()[:32]}"',
+                size=len(payload),
+                built_at=time.time(),
+                built_on=date.today(),
+                versions=versions
+            )
+        self._bundles[(indicator_type.value, window)] = bundle
+        logger.info(
+            "Built %s/%s bundle: %s indicators, %s bytes (%s gzipped)",
+            indicator_type.value, window, len(response.indicators), bundle.size, len(bundle.body)
+        )
+        return bundle
+
+    def refresh(self, indicator_type: IndicatorType, window: str) -> bool:
+        """
+        Rebuild one bundle at background priority if it has been built before and is now out
+        of date (called when one of its series changed). Returns whether it was rebuilt.
+        """
+        bundle = self._bundles.get((indicator_type.value, window))
+        if bundle is None or self._is_current(bundle, indicator_type):
+            return False
+        with upstream_priority(Priority.BACKGROUND):
+            self.get(indicator_type, window)
+        return True
+
+    def rebuild(self) -> List[str]:
+        """
+        Rebuild every out-of-date bundle, at background priority (called after a refresh).
+
+        Returns:
+            List of "type/window" bundles that were rebuilt
+        """
+        rebuilt = []
+        for indicator_type in IndicatorType:
+            for window in self.WINDOWS:
+                bundle = self._bundles.get((indicator_type.value, window))
+                if bundle is not None and self._is_current(bundle, indicator_type):
+                    continue
+                try:
+                    with upstream_priority(Priority.BACKGROUND):
+                        self.get(indicator_type, window)
+                    rebuilt.append(f"{indicator_type.value}/{window}")
+                except Exception as e:
+                    logger.error(f"Failed to build the {indicator_type.value}/{window} bundle: {e}", exc_info=True)
+        return rebuilt
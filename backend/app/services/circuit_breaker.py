@@ -0,0 +1,156 @@
+# backend/app/services/circuit_breaker.py
+
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+import requests
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+_STATE_GAUGE = {CircuitState.CLOSED: 0, CircuitState.OPEN: 1, CircuitState.HALF_OPEN: 2}
+
+
+class CircuitOpen(requests.exceptions.RequestException):
+    """Raised instead of calling a source whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker.
+
+    After `failure_threshold` consecutive outage failures the circuit opens: calls fail at
+    once with CircuitOpen (and callers serve their last-known-good copy) instead of each
+    waiting out the upstream timeout. While open, a background thread re-runs the most
+    recent failed call as a half-open probe, first after `reset_seconds` and then with
+    doubling delays up to `max_reset_seconds`; the first successful probe closes the circuit.
+    User requests never act as probes, so their latency stays bounded during an outage.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        failure_threshold: Optional[int] = None,
+        reset_seconds: Optional[float] = None,
+        max_reset_seconds: Optional[float] = None
+    ):
+        self.source = source
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_seconds = reset_seconds or settings.CIRCUIT_RESET_SECONDS
+        self.max_reset_seconds = max_reset_seconds or settings.CIRCUIT_MAX_RESET_SECONDS
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._delay = self.reset_seconds
+        self._probe: Optional[Callable[[], object]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._publish()
+
+    def before_call(self) -> None:
+        """
+        Raises:
+            CircuitOpen: If the circuit is open or a probe is in flight
+        """
+        if self.state != CircuitState.CLOSED:
+            raise CircuitOpen(f"{self.source} circuit is {self.state.value}; serving cached data")
+
+    def record_success(self) -> None:
+        if self.failures or self.state != CircuitState.CLOSED:
+            with self._lock:
+                self.failures = 0
+                if self.state != CircuitState.CLOSED:
+                    self._transition(CircuitState.CLOSED)
+
+    def record_failure(self, probe: Callable[[], object]) -> None:
+        """Count an outage failure; probe re-runs the failed call and is used while the circuit is open."""
+        with self._lock:
+            self._probe = probe
+            self.failures += 1
+            if self.state == CircuitState.CLOSED and self.failures >= self.failure_threshold:
+                self._delay = self.reset_seconds
+                self._transition(CircuitState.OPEN)
+                self._schedule_probe()
+
+    def _schedule_probe(self) -> None:
+        self._timer = threading.Timer(self._delay, self._run_probe)
+        self._timer.name = f"circuit-probe-{self.source}"
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _run_probe(self) -> None:
+        with self._lock:
+            if self.state != CircuitState.OPEN or self._probe is None:
+                return
+            self._transition(CircuitState.HALF_OPEN)
+            probe = self._probe
+        try:
+            probe()
+        except Exception as e:
+            with self._lock:
+                self._delay = min(self._delay * 2, self.max_reset_seconds)
+                self._transition(CircuitState.OPEN)
+                self._schedule_probe()
+            logger.warning(f"{self.source} probe failed ({e}); next probe in {self._delay:g}s")
+            return
+        with self._lock:
+            self.failures = 0
+            self._transition(CircuitState.CLOSED)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        previous, self.state = self.state, state
+        if state == CircuitState.OPEN and previous == CircuitState.CLOSED:
+            self.opened_at = time.time()
+            logger.warning(f"{self.source} circuit opened after {self.failures} consecutive failures")
+        elif state == CircuitState.CLOSED:
+            logger.warning(f"{self.source} circuit closed; upstream calls resumed")
+            self.opened_at = None
+        metrics.increment("macro_circuit_transitions_total", source=self.source, state=state.value)
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.set_gauge("macro_circuit_state", _STATE_GAUGE[self.state], source=self.source)
+
+    def reset(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self.failures = 0
+            self._transition(CircuitState.CLOSED)
+
+
+def is_outage(error: Exception) -> bool:
+    """Whether an upstream error indicates the source is unavailable (rather than a bad request)."""
+    if isinstance(error, CircuitOpen):
+        return False
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        return response is None or response.status_code >= 500 or response.status_code == 429
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(source: str) -> CircuitBreaker:
+    """The process-wide breaker for a source, shared by every client of that source."""
+    with _breakers_lock:
+        breaker = _breakers.get(source)
+        if breaker is None:
+            breaker = _breakers[source] = CircuitBreaker(source)
+        return breaker
@@ -0,0 +1,110 @@
+# backend/app/services/compact_series.py
+
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+DateLike = Union[str, pd.Timestamp, np.datetime64, None]
+
+
+def _as_datetime64(value: DateLike) -> Optional[np.datetime64]:
+    if value is None or value == "":
+        return None
+    return pd.Timestamp(value).to_datetime64().astype("datetime64[ns]")
+
+
+class CompactSeries:
+    """
+    Immutable, array-backed date/value series: two contiguous buffers, datetime64[ns]
+    dates (an int64 per point) and float64 values, sorted by date with unique dates.
+
+    16 bytes per point, against several hundred for a list of TimeSeriesPoint models
+    (a model instance, a datetime and a float object each). Both buffers are read-only, so
+    window() can hand out zero-copy views, and to_frame() wraps the buffers in a DataFrame
+    without copying them.
+    """
+
+    __slots__ = ("dates", "values")
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray):
+        if len(dates) != len(values):
+            raise ValueError(f"Dates and values differ in length ({len(dates)} != {len(values)})")
+        self.dates = dates
+        self.values = values
+        self.dates.flags.writeable = False
+        self.values.flags.writeable = False
+
+    @classmethod
+    def empty(cls) -> "CompactSeries":
+        return cls(np.empty(0, dtype="datetime64[ns]"), np.empty(0, dtype=np.float64))
+
+    @classmethod
+    def from_arrays(cls, dates: np.ndarray, values: np.ndarray) -> "CompactSeries":
+        """Wrap already normalised arrays (sorted, unique dates); int64 dates are nanoseconds since the epoch."""
+        if dates.dtype == np.int64:
+            dates = dates.view("datetime64[ns]")
+        return cls(np.ascontiguousarray(dates, dtype="datetime64[ns]"), np.ascontiguousarray(values, dtype=np.float64))
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "CompactSeries":
+        """Normalise a 'date'/'value' frame: numeric values, no NaNs, sorted, last value per date."""
+        if data.empty:
+            return cls.empty()
+        dates = pd.to_datetime(data["date"]).to_numpy(dtype="datetime64[ns]")
+        values = pd.to_numeric(data["value"], errors="coerce").to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        dates, values = dates[valid], values[valid]
+
+        order = np.argsort(dates, kind="stable")
+        dates, values = dates[order], values[order]
+        # Keep the last of each run of equal dates
+        keep = np.ones(len(dates), dtype=bool)
+        if len(dates) > 1:
+            keep[:-1] = dates[1:] != dates[:-1]
+        return cls(np.ascontiguousarray(dates[keep]), np.ascontiguousarray(values[keep]))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.values.nbytes
+
+    @property
+    def first_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self.dates[0]) if len(self) else None
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self.dates[-1]) if len(self) else None
+
+    def window(self, start: DateLike = None, end: DateLike = None) -> "CompactSeries":
+        """Points with start <= date <= end (either bound optional), as zero-copy views."""
+        start_dt, end_dt = _as_datetime64(start), _as_datetime64(end)
+        lo = 0 if start_dt is None else int(np.searchsorted(self.dates, start_dt, side="left"))
+        hi = len(self) if end_dt is None else int(np.searchsorted(self.dates, end_dt, side="right"))
+        if lo == 0 and hi == len(self):
+            return self
+        return CompactSeries(self.dates[lo:hi], self.values[lo:hi])
+
+    def combine(self, newer: "CompactSeries") -> "CompactSeries":
+        """This series updated with another; where both have a date, newer's value wins."""
+        if not len(newer):
+            return self
+        if not len(self):
+            return newer
+        dates = np.concatenate([self.dates, newer.dates])
+        values = np.concatenate([self.values, newer.values])
+        order = np.argsort(dates, kind="stable")
+        dates, values = dates[order], values[order]
+        keep = np.ones(len(dates), dtype=bool)
+        keep[:-1] = dates[1:] != dates[:-1]
+        return CompactSeries(np.ascontiguousarray(dates[keep]), np.ascontiguousarray(values[keep]))
+
+    def to_frame(self) -> pd.DataFrame:
+        """'date'/'value' DataFrame backed by this series' (read-only) buffers."""
+        return pd.DataFrame({"date": self.dates, "value": self.values}, copy=False)
+
+    def __repr__(self) -> str:
+        return f"CompactSeries({len(self)} points, {self.first_date} .. {self.last_date})"
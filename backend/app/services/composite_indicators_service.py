@@ -1,129 +1,400 @@
 # backend/app/services/composite_indicators_service.py
 
+import numpy as np
 import pandas as pd
-from datetime import datetime
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from app.core.composite_expression import (
+    Node,
+    Number,
+    Leaf,
+    Negate,
+    BinaryOp,
+    Call,
+    CompositeExpressionError,
+    parse_expression,
+    collect_leaves,
+)
+from app.core.indicator_config import (
+    IndicatorMetadata,
+    DataSourceType,
+    TransformationType,
+    get_all_indicators,
+    get_registry,
+)
 from app.services.yahoo_finance_service import YahooFinanceService
+from app.services.fred_service import FredService
+from app.services.indicator_processing_service import IndicatorProcessingService
+from app.services.series_store import series_store
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class CompiledComposite:
+    """A parsed composite definition with its resolved position in the dependency DAG."""
+    indicator_id: str
+    expression: str
+    tree: Node
+    dependencies: Tuple[str, ...]  # Composite indicators referenced via "indicator:<id>"
+    leaves: Tuple[str, ...]  # Transitive upstream leaf keys, e.g. ("yahoo:GC=F", "yahoo:HG=F")
+
+
+def _resolve_indicator_leaf(leaf: Leaf, definitions: Dict[str, IndicatorMetadata]) -> Union[str, Tuple[str, str]]:
+    """
+    Resolve an "indicator:<id>" reference to either a composite indicator ID (str)
+    or the (source, series_id) of the indicator's raw upstream series.
+    """
+    metadata = definitions.get(leaf.symbol)
+    if metadata is None:
+        raise CompositeExpressionError(f"Composite references unknown indicator '{leaf.symbol}'")
+    if metadata.data_source == DataSourceType.CUSTOM_COMPOSITE:
+        return leaf.symbol
+    if metadata.data_source == DataSourceType.FRED and metadata.series_id:
+        return ("fred", metadata.series_id)
+    if metadata.data_source == DataSourceType.YAHOO and metadata.series_id:
+        return ("yahoo", metadata.series_id)
+    raise CompositeExpressionError(
+        f"Indicator '{leaf.symbol}' (source {metadata.data_source.value}) cannot be used inside a composite expression"
+    )
+
+
+def compile_composite_graph(definitions: Dict[str, IndicatorMetadata]) -> Dict[str, CompiledComposite]:
+    """
+    Compile every composite definition into a dependency DAG.
+
+    Returns the compiled composites in topological order (dependencies first) and
+    raises CompositeExpressionError on unknown references or cycles.
+    """
+    trees: Dict[str, Node] = {}
+    for indicator_id, metadata in definitions.items():
+        if metadata.data_source != DataSourceType.CUSTOM_COMPOSITE:
+            continue
+        if not metadata.composite_expression:
+            raise CompositeExpressionError(f"Composite indicator '{indicator_id}' has no composite_expression")
+        trees[indicator_id] = parse_expression(metadata.composite_expression)
+
+    compiled: Dict[str, CompiledComposite] = {}
+    visiting: List[str] = []
+
+    def visit(indicator_id: str) -> CompiledComposite:
+        if indicator_id in compiled:
+            return compiled[indicator_id]
+        if indicator_id in visiting:
+            cycle = " -> ".join(visiting[visiting.index(indicator_id):] + [indicator_id])
+            raise CompositeExpressionError(f"Composite dependency cycle: {cycle}")
+        visiting.append(indicator_id)
+
+        dependencies: List[str] = []
+        leaf_keys: Dict[str, None] = {}
+        for leaf in collect_leaves(trees[indicator_id]):
+            if leaf.source != "indicator":
+                leaf_keys[leaf.key] = None
+                continue
+            resolved = _resolve_indicator_leaf(leaf, definitions)
+            if isinstance(resolved, str):
+                dependencies.append(resolved)
+                leaf_keys.update(dict.fromkeys(visit(resolved).leaves))
+            else:
+                leaf_keys[f"{resolved[0]}:{resolved[1]}"] = None
+
+        visiting.pop()
+        compiled[indicator_id] = CompiledComposite(
+            indicator_id=indicator_id,
+            expression=definitions[indicator_id].composite_expression,
+            tree=trees[indicator_id],
+            dependencies=tuple(dependencies),
+            leaves=tuple(leaf_keys)
+        )
+        return compiled[indicator_id]
+
+    for indicator_id in trees:
+        visit(indicator_id)
+    return compiled
+
+
 class CompositeIndicatorsService:
-    """Service for creating composite indicators from multiple data sources."""
-    
-    def __init__(self):
+    """
+    Service for creating composite indicators from multiple data sources.
+
+    Composites are declared in the indicator registry (indicators.toml) via
+    composite_expression and compiled into a dependency DAG, again whenever the registry
+    is reloaded. Evaluation fetches each distinct upstream leaf once (full history, via the
+    local series store) and computes the expression vectorised on date-aligned series.
+    """
+
+    def __init__(
+        self,
+        yahoo_service: Optional[YahooFinanceService] = None,
+        fred_service: Optional[FredService] = None
+    ):
         """Initialize the composite indicators service."""
-        self.yahoo_finance = YahooFinanceService()
-        logger.info("CompositeIndicatorsService initialized")
-    
+        self.yahoo_finance = yahoo_service or YahooFinanceService()
+        self.fred_service = fred_service or FredService()
+        self.series_store = series_store
+        registry = get_registry()
+        self._graph = compile_composite_graph(registry.indicators)
+        self._graph_generation = registry.generation
+        logger.info("CompositeIndicatorsService initialized with %s composite definitions", len(self._graph))
+
+    @property
+    def graph(self) -> Dict[str, CompiledComposite]:
+        """Compiled composite DAG, recompiled when the indicator registry is reloaded."""
+        registry = get_registry()
+        if registry.generation != self._graph_generation:
+            try:
+                self._graph = compile_composite_graph(registry.indicators)
+                logger.info("Recompiled %s composite definitions for registry generation %s", len(self._graph), registry.generation)
+            except CompositeExpressionError as e:
+                logger.error(f"Reloaded composite definitions are invalid; keeping the previous graph: {e}")
+            self._graph_generation = registry.generation
+        return self._graph
+
+    # --- Leaf resolution ---
+
+    def _fetch_leaf(self, source: str, symbol: str, start_date: Optional[str], end_date: Optional[str] = None) -> pd.DataFrame:
+        if source == "fred":
+            return self.fred_service.get_series_data(symbol, start_date, end_date)
+        if source == "yahoo":
+            return self.yahoo_finance.get_ticker_data(symbol, start_date, end_date)
+        raise CompositeExpressionError(f"Unsupported leaf source '{source}'")
+
+    def _leaf_series(
+        self,
+        source: str,
+        symbol: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> pd.Series:
+        """
+        Full-history leaf series from the local series store, extended back to an earlier
+        start_date (history fetches subtract the YoY/MA buffers) and topped up incrementally
+        rather than refetched (SeriesStore.get_history).
+        """
+        if source == "yahoo":
+            df = self.yahoo_finance.get_ticker_history(symbol, start_date).data
+        else:
+            df = self.series_store.get_history(
+                f"{source}:{symbol}",
+                start_date,
+                lambda start, end: self._fetch_leaf(source, symbol, start, end)
+            ).data
+        if df.empty:
+            return pd.Series(dtype=np.float64, index=pd.DatetimeIndex([]))
+        series = pd.Series(
+            pd.to_numeric(df["value"], errors="coerce").to_numpy(dtype=np.float64),
+            index=pd.DatetimeIndex(pd.to_datetime(df["date"]))
+        )
+        return series[~series.index.duplicated(keep="last")].sort_index().dropna()
+
+    # --- Vectorised evaluation ---
+
+    # Leaf frequency classes by median spacing between observations (days)
+    FREQUENCY_SPACING_DAYS: Tuple[Tuple[str, float], ...] = (
+        ("daily", 4),
+        ("weekly", 10),
+        ("monthly", 45),
+        ("quarterly", float("inf")),
+    )
+    # A sparser leg's value is carried onto the denser leg's dates for at most this many of its own periods
+    MAX_STALE_PERIODS = 2
+
+    @staticmethod
+    def _spacing(series: pd.Series) -> Optional[pd.Timedelta]:
+        if len(series) < 2:
+            return None
+        return pd.Timedelta(np.median(np.diff(series.index.asi8)), unit="ns")
+
+    @classmethod
+    def _frequency_class(cls, spacing: Optional[pd.Timedelta]) -> Optional[str]:
+        if spacing is None:
+            return None
+        days = spacing / pd.Timedelta(days=1)
+        return next(name for name, limit in cls.FREQUENCY_SPACING_DAYS if days <= limit)
+
+    @classmethod
+    def _align(cls, left: pd.Series, right: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Align two series. Legs of the same frequency are joined on their common dates, so a
+        day on which only one market traded yields no value. A sparser leg (monthly against
+        daily) is aligned as of the denser leg's dates: each date takes the sparser leg's last
+        value on or before it, but only while that value is at most MAX_STALE_PERIODS of the
+        sparser leg's own spacing old, so a leg that stops updating is not carried forward forever.
+        """
+        if left.index.equals(right.index):
+            return left, right
+        left_spacing, right_spacing = cls._spacing(left), cls._spacing(right)
+        left_class, right_class = cls._frequency_class(left_spacing), cls._frequency_class(right_spacing)
+        if left_class is None or right_class is None or left_class == right_class:
+            common = left.index.intersection(right.index)
+            return left.reindex(common), right.reindex(common)
+
+        grid, spacing = (left.index, right_spacing) if len(left) >= len(right) else (right.index, left_spacing)
+        max_age = spacing * cls.MAX_STALE_PERIODS
+
+        def as_of(series: pd.Series) -> pd.Series:
+            if series.index.equals(grid):
+                return series
+            positions = series.index.searchsorted(grid, side="right") - 1
+            clipped = np.maximum(positions, 0)
+            values = series.to_numpy()[clipped]
+            stale = (positions < 0) | (grid - series.index[clipped] > max_age)
+            return pd.Series(np.where(stale, np.nan, values), index=grid)
+
+        return as_of(left), as_of(right)
+
+    def _evaluate(
+        self,
+        node: Node,
+        leaf_cache: Dict[str, pd.Series],
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Union[float, pd.Series]:
+        if isinstance(node, Number):
+            return node.value
+
+        if isinstance(node, Leaf):
+            if node.key not in leaf_cache:
+                if node.source == "indicator":
+                    resolved = _resolve_indicator_leaf(node, get_all_indicators())
+                    if isinstance(resolved, str):
+                        leaf_cache[node.key] = self._evaluate(self.graph[resolved].tree, leaf_cache, start_date, end_date)
+                    else:
+                        leaf_cache[node.key] = self._leaf_series(resolved[0], resolved[1], start_date, end_date)
+                else:
+                    leaf_cache[node.key] = self._leaf_series(node.source, node.symbol, start_date, end_date)
+            return leaf_cache[node.key]
+
+        if isinstance(node, Negate):
+            return -self._evaluate(node.operand, leaf_cache, start_date, end_date)
+
+        if isinstance(node, Call):
+            argument = self._evaluate(node.argument, leaf_cache, start_date, end_date)
+            if not isinstance(argument, pd.Series):
+                raise CompositeExpressionError(f"{node.function}() expects a series argument")
+            if node.function == "yoy":
+                return IndicatorProcessingService.transform_series(argument, TransformationType.YOY)
+            if node.function == "log":
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    return np.log(argument)
+            raise CompositeExpressionError(f"Unsupported function '{node.function}'")
+
+        if isinstance(node, BinaryOp):
+            left = self._evaluate(node.left, leaf_cache, start_date, end_date)
+            right = self._evaluate(node.right, leaf_cache, start_date, end_date)
+            if isinstance(left, pd.Series) and isinstance(right, pd.Series):
+                left, right = self._align(left, right)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if node.operator == "+":
+                    return left + right
+                if node.operator == "-":
+                    return left - right
+                if node.operator == "*":
+                    return left * right
+                if node.operator == "/":
+                    return left / right
+            raise CompositeExpressionError(f"Unsupported operator '{node.operator}'")
+
+        raise CompositeExpressionError(f"Unsupported expression node: {node!r}")
+
+    def _to_frame(self, result: Union[float, pd.Series], start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        if not isinstance(result, pd.Series):
+            raise CompositeExpressionError("Composite expression must reference at least one series")
+        result = result.replace([np.inf, -np.inf], np.nan).dropna()
+        if start_date:
+            result = result[result.index >= pd.to_datetime(start_date)]
+        if end_date:
+            result = result[result.index <= pd.to_datetime(end_date)]
+        return pd.DataFrame({"date": result.index, "value": result.to_numpy()})
+
+    def get_composite_data(
+        self,
+        indicator_id: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Evaluate a configured composite indicator.
+
+        Args:
+            indicator_id (str): ID of a CUSTOM_COMPOSITE indicator
+            start_date (str, optional): Start date in YYYY-MM-DD format
+            end_date (str, optional): End date in YYYY-MM-DD format
+
+        Returns:
+            pandas.DataFrame: DataFrame with date and value columns
+        """
+        compiled = self.graph.get(indicator_id)
+        if compiled is None:
+            logger.error(f"No composite definition found for indicator {indicator_id}")
+            return pd.DataFrame(columns=["date", "value"])
+
+        logger.info("Evaluating composite %s = '%s' with start_date=%s, end_date=%s", indicator_id, compiled.expression, start_date, end_date)
+        try:
+            df = self._to_frame(self._evaluate(compiled.tree, {}, start_date, end_date), start_date, end_date)
+            logger.info("Generated %s data points for composite %s", len(df), indicator_id)
+            return df
+        except Exception as e:
+            logger.error(f"Error evaluating composite {indicator_id}: {e}", exc_info=True)
+            return pd.DataFrame(columns=["date", "value"])
+
+    def evaluate_expression(
+        self,
+        expression: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Evaluate an ad-hoc composite expression (raises CompositeExpressionError if invalid)."""
+        return self._to_frame(self._evaluate(parse_expression(expression), {}, start_date, end_date), start_date, end_date)
+
     def get_gold_copper_ratio(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
         """
         Calculate the gold/copper ratio, a key indicator of economic sentiment.
-        A rising ratio indicates risk-off sentiment (gold gaining vs copper), 
+        A rising ratio indicates risk-off sentiment (gold gaining vs copper),
         while a falling ratio indicates risk-on sentiment (copper gaining vs gold).
-        
+        Kept for the legacy endpoint; the definition lives in indicators.toml.
+
         Args:
             start_date (str, optional): Start date in YYYY-MM-DD format
             end_date (str, optional): End date in YYYY-MM-DD format
-            
+
         Returns:
             pandas.DataFrame: DataFrame with date and ratio value columns
         """
-        logger.info(f"Calculating gold/copper ratio with start_date={start_date}, end_date={end_date}")
-        
-        # Gold and copper tickers in Yahoo Finance
-        gold_ticker = "GC=F"  # Gold Futures
-        copper_ticker = "HG=F"  # Copper Futures
-        
-        try:
-            # Get gold and copper prices using the Yahoo Finance service
-            gold_df = self.yahoo_finance.get_ticker_data(gold_ticker, start_date, end_date)
-            copper_df = self.yahoo_finance.get_ticker_data(copper_ticker, start_date, end_date)
-            
-            logger.info(f"Gold data shape: {gold_df.shape}, Copper data shape: {copper_df.shape}")
-            
-            if gold_df.empty:
-                logger.warning("No gold price data returned from Yahoo Finance")
-                return pd.DataFrame(columns=["date", "value"])
-            
-            if copper_df.empty:
-                logger.warning("No copper price data returned from Yahoo Finance")
-                return pd.DataFrame(columns=["date", "value"])
-            
-            # If we only have one row each, we can calculate a single ratio point
-            if len(gold_df) == 1 and len(copper_df) == 1:
-                logger.info("Calculating ratio from single data points")
-                gold_price = gold_df.iloc[0]["value"]
-                copper_price = copper_df.iloc[0]["value"]
-                ratio = gold_price / copper_price
-                
-                logger.info(f"Gold price: {gold_price}, Copper price: {copper_price}, Ratio: {ratio}")
-                
-                return pd.DataFrame({
-                    "date": [datetime.now()],
-                    "value": [ratio]
-                })
-            
-            # For multiple data points, merge on date and calculate ratio
-            logger.info("Calculating ratio from multiple data points")
-            
-            # Merge the two DataFrames on date
-            merged_df = pd.merge(gold_df, copper_df, on="date", suffixes=("_gold", "_copper"))
-            
-            # Calculate the ratio
-            merged_df["value"] = merged_df["value_gold"] / merged_df["value_copper"]
-            
-            # Create the result DataFrame
-            result_df = pd.DataFrame({
-                "date": merged_df["date"],
-                "value": merged_df["value"]
-            })
-            
-            logger.info(f"Generated {len(result_df)} gold/copper ratio data points")
-            if not result_df.empty:
-                logger.debug(f"Ratio data sample: {result_df.head(3).to_dict('records')}")
-            
-            return result_df
-            
-        except Exception as e:
-            logger.error(f"Error calculating gold/copper ratio: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            # Return empty DataFrame
-            return pd.DataFrame(columns=["date", "value"])
-    
+        return self.get_composite_data("GOLD-COPPER-RATIO", start_date, end_date)
+
     def get_sp500_performance(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
         """
         Get S&P 500 index performance.
-        
+
         Args:
             start_date (str, optional): Start date in YYYY-MM-DD format
             end_date (str, optional): End date in YYYY-MM-DD format
-            
+
         Returns:
             pandas.DataFrame: DataFrame with date and value columns
         """
-        logger.info(f"Fetching S&P 500 performance with start_date={start_date}, end_date={end_date}")
-        
+        logger.info("Fetching S&P 500 performance with start_date=%s, end_date=%s", start_date, end_date)
+
         # S&P 500 ticker in Yahoo Finance
         sp500_ticker = "^GSPC"
-        
+
         try:
             # Get S&P 500 data directly from Yahoo Finance service
-            sp500_df = self.yahoo_finance.get_ticker_data(sp500_ticker, start_date, end_date)
-            
+            sp500_df = self.yahoo_finance.get_ticker_window(sp500_ticker, start_date, end_date)
+
             if sp500_df.empty:
                 logger.warning("No S&P 500 data returned from Yahoo Finance")
                 return pd.DataFrame(columns=["date", "value"])
-            
-            logger.info(f"Retrieved {len(sp500_df)} S&P 500 data points")
+
+            logger.info("Retrieved %s S&P 500 data points", len(sp500_df))
             return sp500_df
-            
+
         except Exception as e:
             logger.error(f"Error fetching S&P 500 data: {e}")
             import traceback
             traceback.print_exc()
-            
+
             # Return empty DataFrame
-            return pd.DataFrame(columns=["date", "value"])
\ No newline at end of file
+            return pd.DataFrame(columns=["date", "value"])
@@ -0,0 +1,143 @@
+# backend/app/services/container.py
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """
+    Process-wide, lazily constructed service instances shared by all routers.
+
+    Nothing is imported or constructed until first use, so importing the API (and forking
+    workers) does not pay for pandas, numpy or the upstream clients. The app lifespan calls
+    build() once at startup, and prewarm() when settings.PREWARM_ON_STARTUP is set; prewarm()
+    ends by rebuilding the precomputed dashboard bundles. Once built, the dependency graph
+    recomputes composites, the market status and built bundles when a series they use changes.
+    Every service shares one UnifiedIndicatorService and its FRED/Yahoo/DBNomics/composite
+    sub-services.
+    """
+
+    def __init__(self):
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = factory()
+                    self._instances[name] = instance
+        return instance
+
+    @property
+    def unified(self):
+        def factory():
+            from app.services.unified_indicator_service import UnifiedIndicatorService
+            return UnifiedIndicatorService()
+        return self._get("unified", factory)
+
+    @property
+    def fred(self):
+        return self.unified.fred_service
+
+    @property
+    def yahoo(self):
+        return self.unified.yahoo_service
+
+    @property
+    def dbnomics(self):
+        return self.unified.dbnom_service
+
+    @property
+    def composite(self):
+        return self.unified.composite_service
+
+    @property
+    def backtest(self):
+        def factory():
+            from app.services.backtest_service import IndicatorBacktestService
+            return IndicatorBacktestService(self.unified)
+        return self._get("backtest", factory)
+
+    @property
+    def panel(self):
+        def factory():
+            from app.services.panel_service import IndicatorPanelService
+            return IndicatorPanelService(self.unified)
+        return self._get("panel", factory)
+
+    @property
+    def correlation(self):
+        def factory():
+            from app.services.correlation_service import CorrelationService
+            return CorrelationService(self.unified)
+        return self._get("correlation", factory)
+
+    @property
+    def bundles(self):
+        def factory():
+            from app.services.bundle_service import BundleService
+            return BundleService(self.unified)
+        return self._get("bundles", factory)
+
+    @property
+    def dependencies(self):
+        def factory():
+            from app.core.indicator_config import IndicatorType
+            from app.services.dependency_graph import DependencyGraph
+            graph = DependencyGraph(self.composite)
+            graph.register("series", self.unified.refresh_composite_history)
+            graph.register("market_status", lambda _: self.unified.refresh_market_status())
+
+            def refresh_bundle(name: str) -> None:
+                indicator_type, window = name.split("/", 1)
+                self.bundles.refresh(IndicatorType(indicator_type), window)
+
+            graph.register("bundle", refresh_bundle)
+            self.unified.series_store.add_listener(graph.series_changed)
+            return graph
+        return self._get("dependencies", factory)
+
+    def build(self) -> None:
+        """Construct every service now rather than on the first request."""
+        for name in ("unified", "backtest", "panel", "correlation", "bundles", "dependencies"):
+            getattr(self, name)
+        logger.info("Service container built")
+
+    def prewarm(self, indicator_ids: Optional[List[str]] = None) -> List[str]:
+        """
+        Load the full history of every (or the given) indicator into the series store, at
+        background priority so upstream rate limits favour interactive requests.
+
+        Returns:
+            List of indicator IDs for which no data could be loaded
+        """
+        from app.core.indicator_config import get_all_indicators
+        from app.services.rate_governor import Priority, upstream_priority
+
+        failed = []
+        for indicator_id in indicator_ids or list(get_all_indicators().keys()):
+            try:
+                with upstream_priority(Priority.BACKGROUND):
+                    history = self.unified.get_raw_history(indicator_id)
+                if history.empty:
+                    failed.append(indicator_id)
+            except Exception as e:
+                logger.error(f"Prewarm failed for {indicator_id}: {e}", exc_info=True)
+                failed.append(indicator_id)
+        logger.info("Prewarm finished: %s indicators, %s without data", len(indicator_ids or get_all_indicators()), len(failed))
+        # Default dashboard windows are then served as precomputed bundles
+        self.bundles.rebuild()
+        return failed
+
+    def reset(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+
+services = ServiceContainer()
@@ -0,0 +1,333 @@
+# backend/app/services/correlation_service.py
+
+import threading
+import logging
+import warnings
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.indicator_config import get_all_indicators, get_indicator_metadata, IndicatorType
+from app.services.unified_indicator_service import UnifiedIndicatorService
+from app.services.panel_service import IndicatorPanelService
+from app.core.metrics import record_cache
+from app.models.indicators import (
+    TimeSeriesPoint,
+    CorrelationMatrixResponse,
+    RollingCorrelationResponse,
+    RegimeInterval,
+    RegimeResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CorrelationCacheEntry:
+    """Rolling correlations for one (frequency, window) pair, plus the inputs they were computed from."""
+    dates: pd.DatetimeIndex  # End date of each rolling window
+    indicator_ids: List[str]
+    panel: np.ndarray  # (periods x indicators) aligned values used for the computation
+    correlations: np.ndarray  # (windows x indicators x indicators)
+    observations: np.ndarray  # (windows x indicators x indicators) pairwise observation counts
+    versions: Dict[str, int] = field(default_factory=dict)
+
+
+class CorrelationService:
+    """
+    Rolling pairwise correlations and a simple regime classification across all
+    configured indicators.
+
+    Correlations are computed from windowed cumulative sums over the aligned panel
+    (one pass for all pairs and windows), cached per (frequency, window), and only the
+    rows/columns of indicators whose stored series changed are recomputed on refresh.
+    """
+
+    DEFAULT_WINDOWS: Dict[str, int] = {
+        "daily": 252,
+        "weekly": 52,
+        "monthly": 36,
+        "quarterly": 12,
+    }
+    # Number of rolling windows retained per cache entry; bounds memory for daily panels
+    MAX_HISTORY_WINDOWS = 520
+
+    REGIME_EXPANSION = "expansion"
+    REGIME_SLOWDOWN = "slowdown"
+    REGIME_CONTRACTION = "contraction"
+    REGIME_RECOVERY = "recovery"
+
+    def __init__(self, unified_service: Optional[UnifiedIndicatorService] = None):
+        self.unified_service = unified_service or UnifiedIndicatorService()
+        self.panel_service = IndicatorPanelService(self.unified_service)
+        self._cache: Dict[Tuple[str, int], _CorrelationCacheEntry] = {}
+        self._lock = threading.Lock()
+
+    # --- Vectorised rolling statistics ---
+
+    @staticmethod
+    def _windowed_sum(values: np.ndarray, window: int) -> np.ndarray:
+        """Sum over each trailing window along axis 0 using cumulative sums."""
+        cumulative = np.cumsum(values, axis=0)
+        cumulative = np.concatenate((np.zeros((1,) + values.shape[1:]), cumulative), axis=0)
+        return cumulative[window:] - cumulative[:-window]
+
+    @staticmethod
+    def rolling_correlation(
+        left: np.ndarray,
+        right: np.ndarray,
+        window: int,
+        min_periods: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rolling Pearson correlation between every column of left (T x A) and every
+        column of right (T x B), using rows where both values are present.
+
+        Returns:
+            Tuple of ((T-window+1) x A x B correlations, matching observation counts)
+        """
+        # Centre each column first; correlation is shift-invariant and this keeps the
+        # cumulative sums well conditioned for large-valued series such as index levels.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            left = left - np.nanmean(left, axis=0)
+            right = right - np.nanmean(right, axis=0)
+
+        left_valid = (~np.isnan(left)).astype(np.float64)
+        right_valid = (~np.isnan(right)).astype(np.float64)
+        left0 = np.nan_to_num(left)
+        right0 = np.nan_to_num(right)
+
+        n = CorrelationService._windowed_sum(left_valid[:, :, None] * right_valid[:, None, :], window)
+        sum_x = CorrelationService._windowed_sum(left0[:, :, None] * right_valid[:, None, :], window)
+        sum_y = CorrelationService._windowed_sum(left_valid[:, :, None] * right0[:, None, :], window)
+        sum_xy = CorrelationService._windowed_sum(left0[:, :, None] * right0[:, None, :], window)
+        sum_xx = CorrelationService._windowed_sum((left0 * left0)[:, :, None] * right_valid[:, None, :], window)
+        sum_yy = CorrelationService._windowed_sum(left_valid[:, :, None] * (right0 * right0)[:, None, :], window)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = sum_xy - sum_x * sum_y / n
+            variance_x = sum_xx - sum_x * sum_x / n
+            variance_y = sum_yy - sum_y * sum_y / n
+            correlation = covariance / np.sqrt(variance_x * variance_y)
+
+        invalid = (n < min_periods) | (variance_x <= 1e-12) | (variance_y <= 1e-12)
+        correlation[invalid] = np.nan
+        return np.clip(correlation, -1.0, 1.0), n.round().astype(np.int32)
+
+    # --- Cache management ---
+
+    def _resolve_window(self, frequency: str, window: Optional[int]) -> int:
+        if frequency not in self.DEFAULT_WINDOWS:
+            raise ValueError(
+                f"Invalid frequency '{frequency}'. Valid frequencies are: {', '.join(self.DEFAULT_WINDOWS)}."
+            )
+        window = window or self.DEFAULT_WINDOWS[frequency]
+        if window < 3:
+            raise ValueError("Correlation window must be at least 3 periods")
+        return window
+
+    def _current_versions(self) -> Dict[str, int]:
+        """Store versions of every indicator, refreshing expired series on the way."""
+        versions = {}
+        for indicator_id in get_all_indicators().keys():
+            try:
+                self.unified_service.get_raw_history(indicator_id)
+            except Exception as e:
+                logger.error(f"Correlation cache: failed to refresh {indicator_id}: {e}", exc_info=True)
+            versions[indicator_id] = self.unified_service.series_store.version(indicator_id)
+        return versions
+
+    def _current_panel(self, frequency: str, window: int) -> pd.DataFrame:
+        panel, _ = self.panel_service.build_panel(list(get_all_indicators().keys()), frequency)
+        return panel.iloc[-(window + self.MAX_HISTORY_WINDOWS - 1):]
+
+    def _compute_entry(self, panel: pd.DataFrame, versions: Dict[str, int], window: int) -> Optional[_CorrelationCacheEntry]:
+        values = panel.to_numpy(dtype=np.float64)
+        if len(values) < window:
+            return None
+        correlations, observations = self.rolling_correlation(values, values, window, max(3, window // 2))
+        return _CorrelationCacheEntry(
+            dates=panel.index[window - 1:],
+            indicator_ids=list(panel.columns),
+            panel=values,
+            correlations=correlations,
+            observations=observations,
+            versions=versions
+        )
+
+    def _refresh_entry(
+        self,
+        entry: _CorrelationCacheEntry,
+        panel: pd.DataFrame,
+        versions: Dict[str, int],
+        window: int
+    ) -> _CorrelationCacheEntry:
+        """Recompute only the rows/columns of indicators whose data changed."""
+        values = panel.to_numpy(dtype=np.float64)
+        same_shape = (
+            list(panel.columns) == entry.indicator_ids
+            and values.shape == entry.panel.shape
+            and panel.index[window - 1:].equals(entry.dates)
+        )
+        if not same_shape:
+            logger.info("Correlation cache: panel grid changed, recomputing all pairs")
+            return self._compute_entry(panel, versions, window)
+
+        changed = [
+            column for column, indicator_id in enumerate(entry.indicator_ids)
+            if versions.get(indicator_id) != entry.versions.get(indicator_id)
+            or not np.array_equal(values[:, column], entry.panel[:, column], equal_nan=True)
+        ]
+        if not changed:
+            entry.versions = versions
+            return entry
+
+        logger.info("Correlation cache: recomputing %s of %s indicators", len(changed), len(entry.indicator_ids))
+        partial, partial_n = self.rolling_correlation(values[:, changed], values, window, max(3, window // 2))
+        entry.correlations[:, changed, :] = partial
+        entry.correlations[:, :, changed] = partial.transpose(0, 2, 1)
+        entry.observations[:, changed, :] = partial_n
+        entry.observations[:, :, changed] = partial_n.transpose(0, 2, 1)
+        entry.panel = values
+        entry.versions = versions
+        return entry
+
+    def _get_entry(self, frequency: str, window: int) -> Optional[_CorrelationCacheEntry]:
+        with self._lock:
+            key = (frequency, window)
+            versions = self._current_versions()
+            entry = self._cache.get(key)
+            if entry is not None and entry.versions == versions:
+                record_cache("correlation", hit=True)
+                return entry
+
+            record_cache("correlation", hit=False)
+            panel = self._current_panel(frequency, window)
+            if entry is None:
+                entry = self._compute_entry(panel, versions, window)
+            else:
+                entry = self._refresh_entry(entry, panel, versions, window)
+            if entry is None:
+                self._cache.pop(key, None)
+            else:
+                self._cache[key] = entry
+            return entry
+
+    # --- Public API ---
+
+    def get_correlation_matrix(
+        self,
+        frequency: str = "monthly",
+        window: Optional[int] = None,
+        indicator_ids: Optional[List[str]] = None
+    ) -> CorrelationMatrixResponse:
+        """Latest rolling-window correlation matrix (heatmap) across the requested indicators."""
+        window = self._resolve_window(frequency, window)
+        entry = self._get_entry(frequency, window)
+        if entry is None:
+            raise ValueError(f"Not enough {frequency} history for a {window}-period correlation window")
+
+        selected = indicator_ids or entry.indicator_ids
+        unknown = [indicator_id for indicator_id in selected if indicator_id not in entry.indicator_ids]
+        if unknown:
+            raise ValueError(f"Unknown indicator IDs: {', '.join(unknown)}")
+        positions = [entry.indicator_ids.index(indicator_id) for indicator_id in selected]
+
+        matrix = entry.correlations[-1][np.ix_(positions, positions)].round(4).astype(object)
+        matrix[pd.isna(matrix)] = None
+        return CorrelationMatrixResponse(
+            frequency=frequency,
+            window=window,
+            as_of=entry.dates[-1].to_pydatetime(),
+            indicator_ids=selected,
+            matrix=matrix.tolist(),
+            observations=entry.observations[-1][np.ix_(positions, positions)].tolist()
+        )
+
+    def get_rolling_correlation(
+        self,
+        indicator_a: str,
+        indicator_b: str,
+        frequency: str = "monthly",
+        window: Optional[int] = None
+    ) -> RollingCorrelationResponse:
+        """Rolling correlation history for one pair of indicators, served from the cached tensor."""
+        window = self._resolve_window(frequency, window)
+        entry = self._get_entry(frequency, window)
+        if entry is None:
+            raise ValueError(f"Not enough {frequency} history for a {window}-period correlation window")
+        for indicator_id in (indicator_a, indicator_b):
+            if indicator_id not in entry.indicator_ids:
+                raise ValueError(f"Unknown indicator ID: {indicator_id}")
+
+        series = entry.correlations[:, entry.indicator_ids.index(indicator_a), entry.indicator_ids.index(indicator_b)]
+        valid = ~np.isnan(series)
+        return RollingCorrelationResponse(
+            indicator_a=indicator_a,
+            indicator_b=indicator_b,
+            frequency=frequency,
+            window=window,
+            data=[
+                TimeSeriesPoint(date=date, value=round(float(value), 4))
+                for date, value in zip(entry.dates[valid].to_pydatetime(), series[valid])
+            ]
+        )
+
+    def get_regime(self, frequency: str = "monthly") -> RegimeResponse:
+        """
+        Classify each period from the composite signal vector: the average signal of
+        leading indicators (direction of travel) against that of coincident indicators
+        (current state of the cycle).
+        """
+        signals = self.panel_service.build_signal_panel(frequency=frequency)
+        if signals.empty:
+            raise ValueError("No indicator signals available for regime classification")
+
+        types = {
+            indicator_id: get_indicator_metadata(indicator_id).indicator_type
+            for indicator_id in signals.columns
+        }
+        leading_columns = [indicator_id for indicator_id, kind in types.items() if kind == IndicatorType.LEADING]
+        coincident_columns = [indicator_id for indicator_id, kind in types.items() if kind == IndicatorType.COINCIDENT]
+
+        leading = signals[leading_columns].mean(axis=1).to_numpy()
+        coincident = signals[coincident_columns].mean(axis=1).to_numpy()
+        known = ~np.isnan(leading) & ~np.isnan(coincident)
+        leading, coincident, dates = leading[known], coincident[known], signals.index[known]
+        if len(dates) == 0:
+            raise ValueError("Not enough overlapping leading and coincident signals for regime classification")
+
+        regimes = np.select(
+            [
+                (leading >= 0) & (coincident >= 0),
+                (leading < 0) & (coincident >= 0),
+                (leading < 0) & (coincident < 0),
+            ],
+            [self.REGIME_EXPANSION, self.REGIME_SLOWDOWN, self.REGIME_CONTRACTION],
+            self.REGIME_RECOVERY
+        )
+
+        change_points = np.flatnonzero(regimes[1:] != regimes[:-1]) + 1
+        starts = np.concatenate(([0], change_points))
+        ends = np.concatenate((change_points - 1, [len(regimes) - 1]))
+        history = [
+            RegimeInterval(
+                start_date=dates[start].to_pydatetime(),
+                end_date=dates[end].to_pydatetime(),
+                regime=str(regimes[start]),
+                periods=int(end - start + 1)
+            )
+            for start, end in zip(starts, ends)
+        ]
+
+        return RegimeResponse(
+            frequency=frequency,
+            as_of=dates[-1].to_pydatetime(),
+            regime=str(regimes[-1]),
+            leading_score=round(float(leading[-1]), 4),
+            coincident_score=round(float(coincident[-1]), 4),
+            history=history
+        )
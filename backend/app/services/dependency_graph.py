@@ -0,0 +1,150 @@
+# backend/app/services/dependency_graph.py
+
+import threading
+import time
+import logging
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.indicator_config import get_registry
+from app.services.bundle_service import BundleService
+
+logger = logging.getLogger(__name__)
+
+# (kind, name): ("series", store key), ("indicator", id), ("market_status", ""), ("bundle", "type/window")
+Node = Tuple[str, str]
+
+MARKET_STATUS: Node = ("market_status", "")
+
+
+class DependencyGraph:
+    """
+    Which derived results depend on which stored series, so a refresh of one series
+    recomputes only what it affects.
+
+    The graph is built from the indicator registry and the compiled composites:
+
+        series:<leaf key>  ->  series:<composite>      (a composite's leaves and composite inputs)
+        series:<id>        ->  indicator:<id>          (an indicator's signal)
+        indicator:<id>     ->  market_status, bundle:<type>/<window>
+
+    and rebuilt when the registry is reloaded. The series store reports every new series
+    version (series_changed); changes are collected for settings.DEPENDENCY_REFRESH_DELAY_SECONDS
+    and then the affected nodes are handed, in topological order, to the handler registered
+    for their kind, on a background thread. Handlers recompute only results that exist and
+    are out of date (each derived result records the versions it was computed from), so a
+    change reported again while recomputing costs a version comparison, not a recompute.
+    """
+
+    def __init__(self, composite_service):
+        self.composite_service = composite_service
+        self._handlers: Dict[str, Callable[[str], None]] = {}
+        self._edges: Dict[Node, Tuple[Node, ...]] = {}
+        self._order: Dict[Node, int] = {}
+        self._generation: Optional[int] = None
+        self._pending: Set[str] = set()
+        self._build_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def register(self, kind: str, handler: Callable[[str], None]) -> None:
+        """Recompute nodes of a kind with handler(name); kinds without a handler are passed through."""
+        self._handlers[kind] = handler
+
+    def _build(self) -> None:
+        registry = get_registry()
+        composites = self.composite_service.graph
+        edges: Dict[Node, Set[Node]] = {}
+
+        def link(source: Node, target: Node) -> None:
+            edges.setdefault(source, set()).add(target)
+            edges.setdefault(target, set())
+
+        for indicator_id, metadata in registry.indicators.items():
+            series: Node = ("series", indicator_id)
+            compiled = composites.get(indicator_id)
+            if compiled is not None:
+                for upstream in (*compiled.leaves, *compiled.dependencies):
+                    link(("series", upstream), series)
+            indicator: Node = ("indicator", indicator_id)
+            link(series, indicator)
+            link(indicator, MARKET_STATUS)
+            for window in BundleService.WINDOWS:
+                link(indicator, ("bundle", f"{metadata.indicator_type.value}/{window}"))
+
+        # Kahn's algorithm; composites were already checked for cycles when compiled
+        indegree = {node: 0 for node in edges}
+        for targets in edges.values():
+            for target in targets:
+                indegree[target] += 1
+        queue = deque(sorted(node for node, degree in indegree.items() if degree == 0))
+        order: Dict[Node, int] = {}
+        while queue:
+            node = queue.popleft()
+            order[node] = len(order)
+            for target in sorted(edges[node]):
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    queue.append(target)
+        if len(order) != len(edges):
+            raise ValueError("Indicator dependency graph has a cycle")
+
+        self._edges = {node: tuple(sorted(targets, key=order.__getitem__)) for node, targets in edges.items()}
+        self._order = order
+        self._generation = registry.generation
+        logger.info("Built dependency graph: %s nodes, %s edges", len(order), sum(map(len, edges.values())))
+
+    def _ensure_current(self) -> None:
+        if self._generation != get_registry().generation:
+            with self._build_lock:
+                if self._generation != get_registry().generation:
+                    self._build()
+
+    def downstream(self, keys: Iterable[str]) -> List[Node]:
+        """Every node affected by a change of the given series store keys, in topological order."""
+        self._ensure_current()
+        edges = self._edges
+        affected: Set[Node] = set()
+        queue = deque(("series", key) for key in keys)
+        while queue:
+            for target in edges.get(queue.popleft(), ()):
+                if target not in affected:
+                    affected.add(target)
+                    queue.append(target)
+        return sorted(affected, key=self._order.__getitem__)
+
+    def propagate(self, keys: Iterable[str]) -> List[Node]:
+        """Recompute everything downstream of the given series now, in topological order."""
+        nodes = self.downstream(keys)
+        for kind, name in nodes:
+            handler = self._handlers.get(kind)
+            if handler is None:
+                continue
+            try:
+                handler(name)
+            except Exception as e:
+                logger.error(f"Dependency refresh of {kind} {name} failed: {e}", exc_info=True)
+        return nodes
+
+    def series_changed(self, key: str, entry=None) -> None:
+        """Series store listener: queue a changed series for the background refresh."""
+        with self._lock:
+            self._pending.add(key)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="dependency-refresh", daemon=True)
+                self._worker.start()
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            # Let a burst of changes (a prefetch, a snapshot import) accumulate
+            time.sleep(settings.DEPENDENCY_REFRESH_DELAY_SECONDS)
+            self._wakeup.clear()
+            with self._lock:
+                changed, self._pending = self._pending, set()
+            if changed:
+                nodes = self.propagate(changed)
+                logger.debug("Dependency refresh: %s changed series, %s downstream nodes", len(changed), len(nodes))
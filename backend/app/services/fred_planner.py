@@ -0,0 +1,82 @@
+# backend/app/services/fred_planner.py
+
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.indicator_config import DataSourceType, get_indicator_metadata
+from app.core.metrics import span
+
+logger = logging.getLogger(__name__)
+
+
+class FredFetchPlanner:
+    """
+    Plans the FRED fetches a dashboard view needs and runs them together.
+
+    FRED has no multi-series endpoint, so a "batch" is the set of distinct FRED series behind
+    the requested indicators (direct FRED indicators plus FRED leaves of composites) that are
+    not already fresh in the series store. They are fetched as full histories into the store
+    over the FRED client's pooled connections, at most settings.FRED_MAX_CONCURRENCY at a
+    time, still subject to the rate governor. The per-indicator processing that follows then
+    serves every window from the store.
+    """
+
+    def __init__(self, unified_service, max_concurrency: Optional[int] = None):
+        self.unified_service = unified_service
+        self.max_concurrency = max_concurrency or settings.FRED_MAX_CONCURRENCY
+
+    def plan(self, indicator_ids: Iterable[str]) -> List[Tuple[str, Callable[[], object]]]:
+        """
+        Distinct FRED fetches still needed for the given indicators.
+
+        Returns:
+            List of (series store key, fetch callable) pairs
+        """
+        store = self.unified_service.series_store
+        composite_graph = self.unified_service.composite_service.graph
+        planned: Dict[str, Callable[[], object]] = {}
+
+        for indicator_id in indicator_ids:
+            metadata = get_indicator_metadata(indicator_id)
+            if metadata is None:
+                continue
+            if metadata.data_source == DataSourceType.FRED:
+                planned.setdefault(indicator_id, lambda i=indicator_id: self.unified_service.get_raw_history(i))
+            elif indicator_id in composite_graph:
+                for leaf_key in composite_graph[indicator_id].leaves:
+                    source, _, symbol = leaf_key.partition(":")
+                    if source == "fred":
+                        planned.setdefault(leaf_key, lambda s=symbol: self.unified_service.get_fred_history(s))
+
+        return [(key, fetch) for key, fetch in planned.items() if store.get(key) is None]
+
+    def prefetch(self, indicator_ids: Iterable[str]) -> int:
+        """
+        Fetch every planned FRED series into the series store concurrently.
+
+        Returns:
+            int: Number of series fetched
+        """
+        planned = self.plan(indicator_ids)
+        if not planned:
+            return 0
+
+        with span("fred_prefetch"):
+            # Each task runs in a copy of the caller's context, keeping its upstream priority
+            # and per-request timing spans
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(planned)), thread_name_prefix="fred-fetch") as pool:
+                futures = {
+                    key: pool.submit(contextvars.copy_context().run, fetch)
+                    for key, fetch in planned
+                }
+                for key, future in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"FRED prefetch of {key} failed: {e}", exc_info=True)
+
+        logger.info("Prefetched %s FRED series with concurrency %s", len(planned), self.max_concurrency)
+        return len(planned)
@@ -1,6 +1,10 @@
 import requests
 import pandas as pd
+import threading
+import time
 from app.core.config import settings
+from app.core.metrics import record_cache
+from app.services.upstream_client import UpstreamClient
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,16 +18,27 @@ class FredService:
         self.api_key = api_key or settings.FRED_API_KEY
         if not self.api_key:
             logger.warning("FRED API key not provided. Service will not function properly.")
+        self.client = UpstreamClient("fred")
+        # {series_id: (fetched_at, info)}; titles, units and frequencies practically never change
+        self._info_cache = {}
+        self._info_lock = threading.Lock()
 
-    def get_series_data(self, series_id, observation_start=None, observation_end=None):
+    def get_series_data(self, series_id, observation_start=None, observation_end=None, realtime_start=None, realtime_end=None):
         """
         Fetch time series data for a specific FRED series.
         Data will be fetched at its highest available frequency by default.
 
+        With realtime_start/realtime_end (ALFRED vintages), the observations are those that were
+        published during that real-time period; where an observation was revised within it, the
+        latest vintage in the period is returned. realtime_start == realtime_end gives the series
+        as it was known on that day, for point-in-time backtests.
+
         Args:
             series_id (str): The FRED series ID (e.g., "UNRATE" for unemployment rate)
             observation_start (str, optional): Start date in YYYY-MM-DD format
             observation_end (str, optional): End date in YYYY-MM-DD format
+            realtime_start (str, optional): Start of the real-time period in YYYY-MM-DD format
+            realtime_end (str, optional): End of the real-time period in YYYY-MM-DD format
 
         Returns:
             pandas.DataFrame: DataFrame with date and value columns
@@ -42,21 +57,26 @@ class FredService:
             params["observation_start"] = observation_start
         if observation_end:
             params["observation_end"] = observation_end
+        if realtime_start:
+            params["realtime_start"] = realtime_start
+        if realtime_end:
+            params["realtime_end"] = realtime_end
 
         try:
-            logger.info(f"Fetching FRED series {series_id} with params: {params}")
-            response = requests.get(endpoint, params=params)
-            response.raise_for_status() # Will raise an HTTPError for bad responses (4XX or 5XX)
-            data = response.json()
+            logger.info("Fetching FRED series %s with params: %s", series_id, params)
+            data = self.client.get_json(endpoint, params) # Raises an HTTPError for bad responses (4XX or 5XX)
 
             if "observations" in data and data["observations"]:
                 df = pd.DataFrame(data["observations"])
+                if (realtime_start or realtime_end) and "realtime_start" in df.columns:
+                    # One row per vintage of each observation: keep the latest vintage per date
+                    df = df.sort_values(["date", "realtime_start"], kind="stable").drop_duplicates(subset=["date"], keep="last")
                 # Ensure 'date' is datetime and 'value' is numeric, handling potential FRED non-numeric values like '.'
                 df["date"] = pd.to_datetime(df["date"])
                 df["value"] = pd.to_numeric(df["value"], errors="coerce") # Coerce non-numeric to NaN
                 df = df.dropna(subset=["value"]) # Remove rows where value became NaN
                 
-                logger.info(f"Successfully fetched {len(df)} observations for FRED series {series_id}")
+                logger.info("Successfully fetched %s observations for FRED series %s", len(df), series_id)
                 return df[["date", "value"]] # Ensure correct column order
             else:
                 logger.warning(f"No data ('observations' key missing or empty) returned for FRED series {series_id}")
@@ -74,7 +94,8 @@ class FredService:
 
     def get_series_info(self, series_id):
         """
-        Get metadata about a specific FRED series.
+        Get metadata about a specific FRED series. Results are cached for
+        settings.FRED_SERIES_INFO_TTL_SECONDS, so an indicator fetch costs one FRED call, not two.
 
         Args:
             series_id (str): The FRED series ID
@@ -82,6 +103,20 @@ class FredService:
         Returns:
             dict: Series metadata, or an empty dict if an error occurs or no info is found.
         """
+        with self._info_lock:
+            cached = self._info_cache.get(series_id)
+        if cached is not None and time.time() - cached[0] <= settings.FRED_SERIES_INFO_TTL_SECONDS:
+            record_cache("fred_series_info", hit=True)
+            return cached[1]
+        record_cache("fred_series_info", hit=False)
+
+        info = self._fetch_series_info(series_id)
+        if info:
+            with self._info_lock:
+                self._info_cache[series_id] = (time.time(), info)
+        return info
+
+    def _fetch_series_info(self, series_id):
         endpoint = f"{self.BASE_URL}/series"
 
         params = {
@@ -91,10 +126,8 @@ class FredService:
         }
 
         try:
-            logger.info(f"Fetching series info for FRED series {series_id}")
-            response = requests.get(endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
+            logger.info("Fetching series info for FRED series %s", series_id)
+            data = self.client.get_json(endpoint, params)
 
             if "seriess" in data and data["seriess"]: # Note: FRED API uses "seriess" for the list
                 return data["seriess"][0]
@@ -1,5 +1,6 @@
 # backend/app/services/indicator_processing_service.py
 
+import numpy as np
 import pandas as pd
 from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
@@ -12,10 +13,22 @@ from app.core.indicator_config import (
     MovingAverageThresholdConfig, 
     get_indicator_metadata
 )
-from app.models.indicators import TimeSeriesPoint, EnrichedIndicatorData 
+from app.models.indicators import TimeSeriesPoint, EnrichedIndicatorData, SignalInterval
+from app.core.metrics import span
 
 logger = logging.getLogger(__name__)
 
+# Integer encoding used for vectorised signal arrays
+SIGNAL_CODE_BULLISH = 1
+SIGNAL_CODE_NEUTRAL = 0
+SIGNAL_CODE_BEARISH = -1
+
+_SIGNAL_STATUS_BY_CODE = {
+    SIGNAL_CODE_BULLISH: SignalStatus.BULLISH,
+    SIGNAL_CODE_NEUTRAL: SignalStatus.NEUTRAL,
+    SIGNAL_CODE_BEARISH: SignalStatus.BEARISH,
+}
+
 class IndicatorProcessingService:
     """Service for processing and enriching indicator data with transformations and signals."""
 
@@ -53,27 +66,23 @@ class IndicatorProcessingService:
             logger.warning(f"IndicatorProcessingService ({indicator_id if indicator_id else 'Unknown'}): Insufficient data for {period}-period MA. Have {len(data)}, need {period}.")
             return []
 
-        df = pd.DataFrame([{"date": point.date, "value": point.value} for point in data])
-        if df.empty:
-            return []
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
-
-        if ma_type == "simple":
-            df['ma'] = df['value'].rolling(window=period, min_periods=period).mean()
-        else:
+        if ma_type != "simple":
             logger.warning(f"Unsupported MA type: {ma_type} for indicator {indicator_id if indicator_id else 'Unknown'}. Defaulting to simple moving average.")
-            df['ma'] = df['value'].rolling(window=period, min_periods=period).mean()
-            
-        result = []
-        for _, row in df.iterrows():
-            if pd.notna(row['ma']):
-                result.append(TimeSeriesPoint(date=row['date'], value=round(row['ma'], 2)))
+
+        # One rolling pass over arrays; only the points that have an MA become models
+        dates, values = IndicatorProcessingService.points_to_arrays(data)
+        order = np.argsort(dates, kind="stable")
+        ma = pd.Series(values[order]).rolling(window=period, min_periods=period).mean().to_numpy()
+        valid = ~np.isnan(ma)
+        result = [
+            TimeSeriesPoint(date=date, value=round(value, 2))
+            for date, value in zip(pd.DatetimeIndex(dates[order][valid]), ma[valid].tolist())
+        ]
         
-        logger.info(f"IndicatorProcessingService ({indicator_id if indicator_id else 'Unknown'}): Calculated {period}-period {ma_type} MA. Result length: {len(result)}. Input data length: {len(data)}")
-        if indicator_id == 'SP500' and len(result) > 0:
-            logger.debug(f"[SP500 MA DEBUG] First 3 MA points: {result[:3]}")
-            logger.debug(f"[SP500 MA DEBUG] Last 3 MA points: {result[-3:]}")
+        logger.debug("IndicatorProcessingService (%s): Calculated %s-period %s MA. Result length: %s. Input data length: %s", indicator_id if indicator_id else 'Unknown', period, ma_type, len(result), len(data))
+        if indicator_id == 'SP500' and result and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SP500 MA DEBUG] First 3 MA points: %s", result[:3])
+            logger.debug("[SP500 MA DEBUG] Last 3 MA points: %s", result[-3:])
         return result
 
     @staticmethod
@@ -184,6 +193,185 @@ class IndicatorProcessingService:
             if value <= bearish_threshold: return SignalStatus.BEARISH
         return SignalStatus.NEUTRAL
 
+    @staticmethod
+    def points_to_arrays(data: List[TimeSeriesPoint]) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert a list of points into (datetime64[ns] dates, float64 values) arrays."""
+        dates = np.array([point.date for point in data], dtype="datetime64[ns]")
+        values = np.array([point.value for point in data], dtype=np.float64)
+        return dates, values
+
+    @staticmethod
+    def static_signal_codes(
+        values: np.ndarray,
+        bullish_threshold: Optional[float],
+        bearish_threshold: Optional[float],
+        invert_logic: bool = False
+    ) -> np.ndarray:
+        """
+        Vectorised equivalent of _determine_static_signal_status.
+        Returns an int8 array of signal codes (1 bullish, -1 bearish, 0 neutral).
+        """
+        if bullish_threshold is None or bearish_threshold is None:
+            return np.zeros(len(values), dtype=np.int8)
+
+        with np.errstate(invalid="ignore"):
+            if invert_logic:
+                is_bullish = values <= bullish_threshold
+                is_bearish = values >= bearish_threshold
+            else:
+                is_bullish = values >= bullish_threshold
+                is_bearish = values <= bearish_threshold
+        # Bullish takes precedence, matching the scalar implementation
+        return np.select(
+            [is_bullish, is_bearish], [SIGNAL_CODE_BULLISH, SIGNAL_CODE_BEARISH], SIGNAL_CODE_NEUTRAL
+        ).astype(np.int8)
+
+    @staticmethod
+    def ma_crossover_signal_codes(
+        values: np.ndarray,
+        ma_values: np.ndarray,
+        invert_logic: bool = False
+    ) -> np.ndarray:
+        """
+        Vectorised MA crossover signal. Points without an MA value (NaN) are neutral.
+        Returns an int8 array of signal codes (1 bullish, -1 bearish, 0 neutral).
+        """
+        with np.errstate(invalid="ignore"):
+            above = values > ma_values
+            below = values < ma_values
+        bullish, bearish = (below, above) if invert_logic else (above, below)
+        return np.select(
+            [bullish, bearish], [SIGNAL_CODE_BULLISH, SIGNAL_CODE_BEARISH], SIGNAL_CODE_NEUTRAL
+        ).astype(np.int8)
+
+    @staticmethod
+    def run_length_encode_signals(dates: np.ndarray, codes: np.ndarray) -> List[SignalInterval]:
+        """Collapse a per-point signal code array into contiguous regime intervals."""
+        if len(codes) == 0:
+            return []
+
+        change_points = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        starts = np.concatenate(([0], change_points))
+        ends = np.concatenate((change_points - 1, [len(codes) - 1]))
+        start_dates = pd.to_datetime(dates[starts])
+        end_dates = pd.to_datetime(dates[ends])
+
+        return [
+            SignalInterval(
+                start_date=start_date.to_pydatetime(),
+                end_date=end_date.to_pydatetime(),
+                signal=_SIGNAL_STATUS_BY_CODE[int(code)],
+                points=int(end - start + 1)
+            )
+            for start_date, end_date, code, start, end in zip(start_dates, end_dates, codes[starts], starts, ends)
+        ]
+
+    @staticmethod
+    def _signal_rule(metadata: IndicatorMetadata) -> str:
+        """
+        Which rule process_indicator_data applies: "ma_crossover", "static" (no dynamic
+        threshold, or an MA crossover with an invalid config) or "neutral" (any other
+        dynamic threshold type, which has no signal implementation).
+        """
+        dynamic = metadata.dynamic_threshold
+        if dynamic is None:
+            return "static"
+        if dynamic.type != DynamicThresholdType.MOVING_AVERAGE_CROSSOVER:
+            return "neutral"
+        return "ma_crossover" if isinstance(dynamic.config, MovingAverageThresholdConfig) else "static"
+
+    @staticmethod
+    def calculate_signal_series(
+        metadata: IndicatorMetadata,
+        display_data: List[TimeSeriesPoint],
+        raw_data: Optional[List[TimeSeriesPoint]] = None,
+        ma_series: Optional[List[TimeSeriesPoint]] = None
+    ) -> List[SignalInterval]:
+        """
+        Compute the signal for every point in the requested range and return it
+        run-length encoded. Static thresholds are evaluated on the display data;
+        MA crossovers compare the raw values against the MA series, as the
+        last-point signal does. Other dynamic threshold types are neutral throughout,
+        as in process_indicator_data.
+        """
+        rule = IndicatorProcessingService._signal_rule(metadata)
+
+        if rule != "ma_crossover":
+            if not display_data:
+                return []
+            dates, values = IndicatorProcessingService.points_to_arrays(display_data)
+            if rule == "neutral":
+                codes = np.full(len(values), SIGNAL_CODE_NEUTRAL, dtype=np.int8)
+            else:
+                codes = IndicatorProcessingService.static_signal_codes(
+                    values, metadata.bullish_threshold, metadata.bearish_threshold, metadata.invert_logic
+                )
+            return IndicatorProcessingService.run_length_encode_signals(dates, codes)
+
+        if not raw_data or not display_data:
+            return []
+
+        # Restrict the raw series to the displayed window, then align the MA on dates
+        window_start = np.datetime64(display_data[0].date, "ns")
+        dates, values = IndicatorProcessingService.points_to_arrays(raw_data)
+        in_window = dates >= window_start
+        dates, values = dates[in_window], values[in_window]
+
+        ma_values = np.full(len(values), np.nan)
+        if ma_series:
+            ma_dates, ma_raw_values = IndicatorProcessingService.points_to_arrays(ma_series)
+            positions = np.searchsorted(ma_dates, dates)
+            clipped = np.minimum(positions, len(ma_dates) - 1)
+            matched = (positions < len(ma_dates)) & (ma_dates[clipped] == dates)
+            ma_values[matched] = ma_raw_values[clipped[matched]]
+
+        codes = IndicatorProcessingService.ma_crossover_signal_codes(values, ma_values, metadata.invert_logic)
+        return IndicatorProcessingService.run_length_encode_signals(dates, codes)
+
+    @staticmethod
+    def transform_series(series: pd.Series, transformation: TransformationType) -> pd.Series:
+        """
+        Vectorised counterpart of apply_transformation for a date-indexed Series.
+        Used by the analytics services, which work on full histories rather than point lists.
+        """
+        if series.empty:
+            return series
+        if transformation == TransformationType.YOY:
+            monthly = series.sort_index().resample('ME').last()
+            return (monthly.pct_change(periods=12, fill_method=None) * 100).dropna()
+        if transformation == TransformationType.INVERT:
+            return -series
+        return series
+
+    @staticmethod
+    def signal_codes_for_series(raw_series: pd.Series, metadata: IndicatorMetadata) -> pd.Series:
+        """
+        Per-point signal codes (1 bullish, -1 bearish, 0 neutral) for a full date-indexed
+        raw series, using the same rules as process_indicator_data. MA crossover points
+        before the first full MA period have no signal and are left out rather than coded neutral.
+        """
+        if raw_series.empty:
+            return pd.Series(dtype=np.int8)
+
+        dynamic = metadata.dynamic_threshold
+        rule = IndicatorProcessingService._signal_rule(metadata)
+        if rule == "ma_crossover":
+            raw_series = raw_series.sort_index()
+            ma = raw_series.rolling(window=dynamic.config.period, min_periods=dynamic.config.period).mean()
+            codes = IndicatorProcessingService.ma_crossover_signal_codes(
+                raw_series.to_numpy(dtype=np.float64), ma.round(2).to_numpy(dtype=np.float64), metadata.invert_logic
+            )
+            return pd.Series(codes, index=raw_series.index)[ma.notna().to_numpy()]
+
+        display_series = IndicatorProcessingService.transform_series(raw_series, metadata.transformation)
+        if rule == "neutral":
+            return pd.Series(SIGNAL_CODE_NEUTRAL, index=display_series.index, dtype=np.int8)
+        codes = IndicatorProcessingService.static_signal_codes(
+            display_series.to_numpy(dtype=np.float64),
+            metadata.bullish_threshold, metadata.bearish_threshold, metadata.invert_logic
+        )
+        return pd.Series(codes, index=display_series.index)
+
     @staticmethod
     def _calculate_moving_average_crossover_signal(
         indicator_id: str, 
@@ -241,11 +429,11 @@ class IndicatorProcessingService:
             elif last_value < ma_value:
                 signal = SignalStatus.BEARISH
         
-        logger.info(f"[{indicator_id}] MA Crossover: Last value {last_value}, MA({ma_config.period}) {ma_value}, Signal: {signal.value}, Invert: {invert_logic}. MA Series Length: {len(ma_series_data)} (trimmed from {len(ma_series_data_full)})")
-        if indicator_id == 'SP500':
-            logger.debug(f"[SP500 _calculate_moving_average_crossover_signal] Returning MA series of length: {len(ma_series_data)}")
+        logger.debug("[%s] MA Crossover: Last value %s, MA(%s) %s, Signal: %s, Invert: %s. MA Series Length: %s (trimmed from %s)", indicator_id, last_value, ma_config.period, ma_value, signal.value, invert_logic, len(ma_series_data), len(ma_series_data_full))
+        if indicator_id == 'SP500' and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SP500 _calculate_moving_average_crossover_signal] Returning MA series of length: %s", len(ma_series_data))
             if ma_series_data:
-                 logger.debug(f"[SP500 _calculate_moving_average_crossover_signal] First 3 MA points returned: {ma_series_data[:3]}")
+                 logger.debug("[SP500 _calculate_moving_average_crossover_signal] First 3 MA points returned: %s", ma_series_data[:3])
 
         return ma_value, ma_value, signal, ma_value, ma_series_data
 
@@ -256,7 +444,8 @@ class IndicatorProcessingService:
         original_title: str, 
         original_units: Optional[str] = None,
         original_frequency: Optional[str] = None,
-        original_start_date: Optional[str] = None  # New parameter
+        original_start_date: Optional[str] = None,  # New parameter
+        include_signal_series: bool = False
     ) -> EnrichedIndicatorData:
         metadata = get_indicator_metadata(indicator_id)
         if not metadata:
@@ -267,21 +456,22 @@ class IndicatorProcessingService:
                 signal_status=SignalStatus.NEUTRAL, description="Metadata not found."
             )
         
-        if indicator_id == 'SP500':
-            logger.debug(f"[SP500 process_indicator_data] Raw data length for SP500: {len(raw_data)} (includes buffer)")
+        if indicator_id == 'SP500' and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SP500 process_indicator_data] Raw data length for SP500: %s (includes buffer)", len(raw_data))
             if raw_data:
-                logger.debug(f"[SP500 process_indicator_data] First 3 raw_data points: {raw_data[:3]}")
-                logger.debug(f"[SP500 process_indicator_data] Last 3 raw_data points: {raw_data[-3:]}")
+                logger.debug("[SP500 process_indicator_data] First 3 raw_data points: %s", raw_data[:3])
+                logger.debug("[SP500 process_indicator_data] Last 3 raw_data points: %s", raw_data[-3:])
 
-        # Apply transformation to full dataset (including buffer)
-        display_data_full, processed_title, processed_units = IndicatorProcessingService.apply_transformation(
-            raw_data.copy(), metadata.transformation, metadata
-        )
+        with span("transform"):
+            # Apply transformation to full dataset (including buffer)
+            display_data_full, processed_title, processed_units = IndicatorProcessingService.apply_transformation(
+                raw_data.copy(), metadata.transformation, metadata
+            )
 
-        # Trim display data to requested range (remove buffer period)
-        display_data = IndicatorProcessingService.trim_data_to_requested_range(
-            display_data_full, original_start_date
-        )
+            # Trim display data to requested range (remove buffer period)
+            display_data = IndicatorProcessingService.trim_data_to_requested_range(
+                display_data_full, original_start_date
+            )
 
         if not display_data: 
             logger.warning(f"No data after transformation and trimming for {indicator_id}. Using raw data for display if available, or empty.")
@@ -302,25 +492,26 @@ class IndicatorProcessingService:
         ma_series_for_response: Optional[List[TimeSeriesPoint]] = None 
         
         if metadata.dynamic_threshold:
-            if indicator_id == 'SP500':
-                logger.debug(f"[SP500 process_indicator_data] Processing dynamic threshold for SP500.")
+            if indicator_id == 'SP500' and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SP500 process_indicator_data] Processing dynamic threshold for SP500.")
             if metadata.dynamic_threshold.type == DynamicThresholdType.MOVING_AVERAGE_CROSSOVER:
                 if isinstance(metadata.dynamic_threshold.config, MovingAverageThresholdConfig):
-                    bt, brt, sig, ma_val, calculated_ma_series = IndicatorProcessingService._calculate_moving_average_crossover_signal(
-                        indicator_id, 
-                        raw_data,  # Use full raw data (including buffer) for MA calculation
-                        metadata.dynamic_threshold.config,
-                        original_start_date,  # Pass original start date for trimming
-                        metadata.invert_logic  # Pass invert_logic flag
-                    )
+                    with span("moving_average"):
+                        bt, brt, sig, ma_val, calculated_ma_series = IndicatorProcessingService._calculate_moving_average_crossover_signal(
+                            indicator_id, 
+                            raw_data,  # Use full raw data (including buffer) for MA calculation
+                            metadata.dynamic_threshold.config,
+                            original_start_date,  # Pass original start date for trimming
+                            metadata.invert_logic  # Pass invert_logic flag
+                        )
                     bullish_thresh = ma_val 
                     bearish_thresh = ma_val
                     signal_status = sig
                     ma_series_for_response = calculated_ma_series 
-                    if indicator_id == 'SP500':
-                        logger.debug(f"[SP500 process_indicator_data] calculated_ma_series length: {len(calculated_ma_series if calculated_ma_series else [])}")
+                    if indicator_id == 'SP500' and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[SP500 process_indicator_data] calculated_ma_series length: %s", len(calculated_ma_series if calculated_ma_series else []))
                         if ma_series_for_response:
-                             logger.debug(f"[SP500 process_indicator_data] ma_series_for_response first 3: {ma_series_for_response[:3]}")
+                             logger.debug("[SP500 process_indicator_data] ma_series_for_response first 3: %s", ma_series_for_response[:3])
                 else:
                     logger.error(f"Invalid config for MOVING_AVERAGE_CROSSOVER on {indicator_id}")
                     signal_status = IndicatorProcessingService._determine_static_signal_status(
@@ -331,9 +522,16 @@ class IndicatorProcessingService:
                 last_display_value, bullish_thresh, bearish_thresh, metadata.invert_logic
             )
         
-        if indicator_id == 'SP500':
-            logger.debug(f"[SP500 process_indicator_data] Final ma_series_for_response length: {len(ma_series_for_response if ma_series_for_response else [])}")
-            logger.debug(f"[SP500 process_indicator_data] Final display_data length: {len(display_data)}")
+        signal_series: Optional[List[SignalInterval]] = None
+        if include_signal_series:
+            with span("signal"):
+                signal_series = IndicatorProcessingService.calculate_signal_series(
+                    metadata, display_data, raw_data, ma_series_for_response
+                )
+
+        if indicator_id == 'SP500' and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SP500 process_indicator_data] Final ma_series_for_response length: %s", len(ma_series_for_response if ma_series_for_response else []))
+            logger.debug("[SP500 process_indicator_data] Final display_data length: %s", len(display_data))
 
         return EnrichedIndicatorData(
             indicator_id=indicator_id,
@@ -349,5 +547,6 @@ class IndicatorProcessingService:
             last_value=last_display_value, 
             last_updated=last_updated_date,
             y_axis_domain=metadata.y_axis_domain,
-            ma_series_data=ma_series_for_response  # Trimmed MA data (without buffer)
+            ma_series_data=ma_series_for_response,  # Trimmed MA data (without buffer)
+            signal_series=signal_series
         )
\ No newline at end of file
@@ -0,0 +1,213 @@
+# backend/app/services/panel_service.py
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.indicator_config import get_all_indicators, get_indicator_metadata, DataSourceType, IndicatorMetadata
+from app.services.indicator_processing_service import IndicatorProcessingService
+from app.services.unified_indicator_service import UnifiedIndicatorService
+from app.models.indicators import AlignedPanelResponse
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorPanelService:
+    """
+    Builds date-aligned panels (one column per indicator) from the local series store,
+    so cross-indicator views do not need one round trip and client-side alignment per series.
+    """
+
+    # Public frequency names -> pandas resample rules (period end labels)
+    FREQUENCY_RULES: Dict[str, str] = {
+        "daily": "B",
+        "weekly": "W-FRI",
+        "monthly": "ME",
+        "quarterly": "QE",
+    }
+
+    # How many empty periods a value is carried forward before it is considered stale.
+    # Sized so that the slowest configured series (quarterly GDP) stays populated.
+    DEFAULT_FILL_LIMITS: Dict[str, int] = {
+        "daily": 66,
+        "weekly": 14,
+        "monthly": 3,
+        "quarterly": 1,
+    }
+
+    # One period of each registry frequency, for shifting observations to their publication date
+    PERIOD_OFFSETS: Dict[str, pd.DateOffset] = {
+        "daily": pd.DateOffset(days=1),
+        "weekly": pd.DateOffset(weeks=1),
+        "monthly": pd.DateOffset(months=1),
+        "quarterly": pd.DateOffset(months=3),
+    }
+
+    def __init__(self, unified_service: Optional[UnifiedIndicatorService] = None):
+        self.unified_service = unified_service or UnifiedIndicatorService()
+        self.processing_service = IndicatorProcessingService()
+
+    def _load_series(self, indicator_id: str, transformed: bool) -> pd.Series:
+        metadata = get_indicator_metadata(indicator_id)
+        raw_df = self.unified_service.get_raw_history(indicator_id)
+        if raw_df.empty:
+            return pd.Series(dtype=np.float64, index=pd.DatetimeIndex([]), name=indicator_id)
+
+        series = pd.Series(raw_df["value"].to_numpy(dtype=np.float64), index=pd.DatetimeIndex(raw_df["date"]))
+        if transformed:
+            series = self.processing_service.transform_series(series, metadata.transformation)
+        return series.rename(indicator_id)
+
+    def release_offset(self, indicator_id: str, metadata: IndicatorMetadata) -> Optional[pd.DateOffset]:
+        """
+        How long after its reference date an observation is published: metadata.release_lag
+        periods of the indicator's frequency. Without a configured lag, FRED and ISM releases
+        lag one period, Yahoo prices none, and composites one period if any leaf is not a Yahoo price.
+        """
+        lag = metadata.release_lag
+        if lag is None:
+            if metadata.data_source == DataSourceType.YAHOO:
+                lag = 0
+            elif metadata.data_source == DataSourceType.CUSTOM_COMPOSITE:
+                compiled = self.unified_service.composite_service.graph.get(indicator_id)
+                leaves = compiled.leaves if compiled else ()
+                lag = int(any(not leaf.startswith("yahoo:") for leaf in leaves))
+            else:
+                lag = 1
+        period = self.PERIOD_OFFSETS.get((metadata.frequency or "").lower())
+        if not lag or period is None:
+            return None
+        return period * lag
+
+    def build_panel(
+        self,
+        indicator_ids: Optional[List[str]] = None,
+        frequency: str = "monthly",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        transformed: bool = True,
+        fill_limit: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Resample every requested indicator onto one common period grid.
+
+        Each cell holds the last observation available at the end of the period (as-of rule);
+        periods without a new observation are forward-filled for at most fill_limit periods.
+
+        Returns:
+            Tuple of (panel DataFrame indexed by period end, list of indicators without data)
+        """
+        if frequency not in self.FREQUENCY_RULES:
+            raise ValueError(
+                f"Invalid frequency '{frequency}'. Valid frequencies are: {', '.join(self.FREQUENCY_RULES)}."
+            )
+        if indicator_ids is None:
+            indicator_ids = list(get_all_indicators().keys())
+        unknown = [indicator_id for indicator_id in indicator_ids if not get_indicator_metadata(indicator_id)]
+        if unknown:
+            raise ValueError(f"Unknown indicator IDs: {', '.join(unknown)}")
+
+        series_list: List[pd.Series] = []
+        missing: List[str] = []
+        for indicator_id in indicator_ids:
+            try:
+                series = self._load_series(indicator_id, transformed)
+            except Exception as e:
+                logger.error(f"Panel: failed to load {indicator_id}: {e}", exc_info=True)
+                series = pd.Series(dtype=np.float64, index=pd.DatetimeIndex([]), name=indicator_id)
+            if series.empty:
+                missing.append(indicator_id)
+            series_list.append(series)
+
+        if len(missing) == len(indicator_ids):
+            return pd.DataFrame(columns=indicator_ids, dtype=np.float64), missing
+
+        # Single pass over the union of all observation dates
+        combined = pd.concat(series_list, axis=1, keys=indicator_ids).sort_index()
+        limit = fill_limit if fill_limit is not None else self.DEFAULT_FILL_LIMITS[frequency]
+        panel = combined.resample(self.FREQUENCY_RULES[frequency]).last().ffill(limit=limit)
+
+        if start_date:
+            panel = panel[panel.index >= pd.to_datetime(start_date)]
+        if end_date:
+            panel = panel[panel.index <= pd.to_datetime(end_date)]
+
+        logger.info("Built %s panel: %s periods x %s indicators", frequency, panel.shape[0], panel.shape[1])
+        return panel, missing
+
+    def build_signal_panel(
+        self,
+        indicator_ids: Optional[List[str]] = None,
+        frequency: str = "monthly",
+        fill_limit: Optional[int] = None,
+        as_published: bool = False
+    ) -> pd.DataFrame:
+        """
+        Per-period signal codes (1 bullish, 0 neutral, -1 bearish, NaN where no data),
+        one column per indicator, aligned with the same as-of and forward-fill rules as build_panel.
+
+        With as_published, each signal is dated when its observation was published
+        (release_offset) rather than at its reference date, so a period only holds
+        signals that were known at its end.
+        """
+        if frequency not in self.FREQUENCY_RULES:
+            raise ValueError(
+                f"Invalid frequency '{frequency}'. Valid frequencies are: {', '.join(self.FREQUENCY_RULES)}."
+            )
+        if indicator_ids is None:
+            indicator_ids = list(get_all_indicators().keys())
+
+        columns: Dict[str, pd.Series] = {}
+        for indicator_id in indicator_ids:
+            metadata = get_indicator_metadata(indicator_id)
+            if not metadata:
+                continue
+            try:
+                raw_df = self.unified_service.get_raw_history(indicator_id)
+            except Exception as e:
+                logger.error(f"Signal panel: failed to load history for {indicator_id}: {e}", exc_info=True)
+                continue
+            if raw_df.empty:
+                logger.warning(f"Signal panel: no history available for {indicator_id}, skipping")
+                continue
+
+            raw_series = pd.Series(raw_df["value"].to_numpy(dtype=np.float64), index=pd.DatetimeIndex(raw_df["date"]))
+            codes = self.processing_service.signal_codes_for_series(raw_series, metadata)
+            if as_published:
+                offset = self.release_offset(indicator_id, metadata)
+                if offset is not None:
+                    codes.index = codes.index + offset
+            if not codes.empty:
+                columns[indicator_id] = codes.astype(np.float64)
+
+        if not columns:
+            return pd.DataFrame(dtype=np.float64)
+
+        combined = pd.concat(columns, axis=1).sort_index()
+        limit = fill_limit if fill_limit is not None else self.DEFAULT_FILL_LIMITS[frequency]
+        return combined.resample(self.FREQUENCY_RULES[frequency]).last().ffill(limit=limit)
+
+    def get_aligned_panel(
+        self,
+        indicator_ids: Optional[List[str]] = None,
+        frequency: str = "monthly",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        transformed: bool = True,
+        fill_limit: Optional[int] = None
+    ) -> AlignedPanelResponse:
+        panel, missing = self.build_panel(indicator_ids, frequency, start_date, end_date, transformed, fill_limit)
+
+        matrix = panel.to_numpy(dtype=np.float64).T.round(6).astype(object)
+        matrix[pd.isna(matrix)] = None
+
+        return AlignedPanelResponse(
+            frequency=frequency,
+            transformed=transformed,
+            dates=panel.index.to_pydatetime().tolist(),
+            indicator_ids=list(panel.columns),
+            values=matrix.tolist(),
+            missing_indicators=missing
+        )
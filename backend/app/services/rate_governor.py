@@ -0,0 +1,188 @@
+# backend/app/services/rate_governor.py
+
+import hashlib
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Lower values are served first."""
+    INTERACTIVE = 0  # A user is waiting on the response
+    BACKGROUND = 1   # Prewarm, snapshot collection and other refresh work
+
+
+_priority: ContextVar[Priority] = ContextVar("upstream_priority", default=Priority.INTERACTIVE)
+# Set while refreshing data the caller already holds a stale copy of: no point waiting for a token
+_stale_available: ContextVar[bool] = ContextVar("stale_available", default=False)
+
+
+@contextmanager
+def upstream_priority(priority: Priority) -> Iterator[None]:
+    """Run a block with the given priority for every upstream call it makes."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def stale_fallback(available: bool = True) -> Iterator[None]:
+    """
+    Mark a block as a refresh of data the caller can fall back to. Interactive calls in it
+    do not wait for a token: with the bucket empty they fail at once and the stale copy is served.
+    """
+    token = _stale_available.set(available)
+    try:
+        yield
+    finally:
+        _stale_available.reset(token)
+
+
+def key_label(api_key: Optional[str]) -> str:
+    """Non-reversible label for an API key, safe to use as a bucket name and metric label."""
+    if not api_key:
+        return "default"
+    return "key-" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:8]
+
+
+class RateLimited(requests.exceptions.RequestException):
+    """Raised when no rate-limit token became available within the caller's wait budget."""
+
+
+class TokenBucket:
+    """Classic token bucket: `capacity` tokens, refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def seconds_until(self, tokens: float) -> float:
+        return max(0.0, (tokens - self.tokens) / self.rate)
+
+
+class _BucketState:
+    __slots__ = ("bucket", "condition", "waiters")
+
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+        self.condition = threading.Condition()
+        self.waiters: List[Tuple[int, int]] = []  # heap of (priority, arrival sequence)
+
+
+class RateGovernor:
+    """
+    Central admission control for upstream calls: one token bucket per (source, API key).
+
+    Waiting callers are granted tokens strictly in priority order, then arrival order.
+    Background callers additionally leave settings.RATE_LIMIT_BACKGROUND_RESERVE of each
+    bucket's capacity untouched, so a refresh sweep never drains the tokens a dashboard
+    load needs. A caller that cannot get a token within its wait budget
+    (RATE_LIMIT_INTERACTIVE_WAIT_SECONDS / RATE_LIMIT_BACKGROUND_WAIT_SECONDS) gets
+    RateLimited, and the series store serves its stale copy instead.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        # {source: (requests per minute, burst capacity)}; sources without a limit are not throttled
+        self.limits = limits if limits is not None else {
+            "fred": (settings.FRED_REQUESTS_PER_MINUTE, settings.FRED_BURST),
+            "yahoo": (settings.YAHOO_REQUESTS_PER_MINUTE, settings.YAHOO_BURST),
+            "dbnomics": (settings.DBNOMICS_REQUESTS_PER_MINUTE, settings.DBNOMICS_BURST),
+        }
+        self._states: Dict[Tuple[str, str], _BucketState] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+    def _state(self, source: str, key: str) -> Optional[_BucketState]:
+        per_minute, burst = self.limits.get(source, (0, 0))
+        if per_minute <= 0:
+            return None
+        with self._lock:
+            state = self._states.get((source, key))
+            if state is None:
+                state = self._states[(source, key)] = _BucketState(TokenBucket(per_minute / 60.0, max(1.0, burst)))
+            return state
+
+    def acquire(self, source: str, key: str = "default", priority: Optional[Priority] = None) -> float:
+        """
+        Take one token for a call to source with the given API key label, waiting if needed.
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            RateLimited: If no token became available within the priority's wait budget
+        """
+        state = self._state(source, key)
+        if state is None:
+            return 0.0
+        priority = current_priority() if priority is None else priority
+        if priority == Priority.INTERACTIVE:
+            budget = 0.0 if _stale_available.get() else settings.RATE_LIMIT_INTERACTIVE_WAIT_SECONDS
+            floor = 0.0
+        else:
+            budget = settings.RATE_LIMIT_BACKGROUND_WAIT_SECONDS
+            floor = state.bucket.capacity * settings.RATE_LIMIT_BACKGROUND_RESERVE
+
+        started = time.monotonic()
+        deadline = started + budget
+        entry = (int(priority), next(self._sequence))
+        with state.condition:
+            heapq.heappush(state.waiters, entry)
+            self._publish(source, key, state)
+            try:
+                while True:
+                    now = time.monotonic()
+                    state.bucket.refill(now)
+                    if state.waiters[0] == entry and state.bucket.tokens >= floor + 1:
+                        state.bucket.tokens -= 1
+                        break
+                    if now >= deadline:
+                        metrics.increment("macro_rate_limit_rejections_total", source=source, priority=priority.name.lower())
+                        raise RateLimited(f"{source} rate limit: no token within {budget:g}s ({priority.name.lower()})")
+                    state.condition.wait(min(deadline - now, max(0.01, state.bucket.seconds_until(floor + 1))))
+            finally:
+                state.waiters.remove(entry)
+                heapq.heapify(state.waiters)
+                state.condition.notify_all()
+                self._publish(source, key, state)
+
+        waited = time.monotonic() - started
+        metrics.observe("macro_rate_limit_wait_seconds", waited, source=source, priority=priority.name.lower())
+        if waited > 0.5:
+            logger.info("Waited %.2fs for a %s rate-limit token (%s)", waited, source, priority.name.lower())
+        return waited
+
+    def _publish(self, source: str, key: str, state: _BucketState) -> None:
+        metrics.set_gauge("macro_rate_limit_tokens", round(state.bucket.tokens, 3), source=source, key=key)
+        for priority in Priority:
+            waiting = sum(1 for waiter_priority, _ in state.waiters if waiter_priority == priority)
+            metrics.set_gauge("macro_rate_limit_waiting", waiting, source=source, key=key, priority=priority.name.lower())
+
+
+# Process-wide governor shared by every upstream client
+rate_governor = RateGovernor()
@@ -0,0 +1,410 @@
+# backend/app/services/series_store.py
+
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from app.core.config import settings
+from app.core.metrics import metrics, record_cache
+from app.services.compact_series import CompactSeries
+from app.services.rate_governor import stale_fallback
+from app.services.shared_cache import SharedCacheBackend, SharedSeriesRecord, create_shared_backend, lease_owner
+
+logger = logging.getLogger(__name__)
+
+# history_start recorded for a history fetched with no start date (everything the source has)
+FULL_HISTORY = ""
+
+
+@dataclass
+class StoredSeries:
+    """A raw series held in the local store, with bookkeeping for freshness checks."""
+    key: str
+    series: CompactSeries  # Sorted, de-duplicated dates and values in read-only buffers
+    fetched_at: float
+    version: int
+    info: Dict[str, Any] = field(default_factory=dict)  # Source-reported title, units, frequency
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """'date' (datetime64) and 'value' (float) columns, sorted by date; a zero-copy view of series."""
+        return self.series.to_frame()
+
+    def age_seconds(self) -> float:
+        return time.time() - self.fetched_at
+
+
+@dataclass
+class DataFreshness:
+    """How current the stored series served within a track_freshness() block were."""
+    as_of: Optional[float] = None  # Fetch time of the oldest series served
+    stale: bool = False  # Whether any of them was past the store's max age
+
+    def note(self, fetched_at: float, stale: bool) -> None:
+        self.as_of = fetched_at if self.as_of is None else min(self.as_of, fetched_at)
+        self.stale = self.stale or stale
+
+
+_freshness: ContextVar[Optional[DataFreshness]] = ContextVar("data_freshness", default=None)
+
+
+@contextmanager
+def track_freshness() -> Iterator[DataFreshness]:
+    """Collect the age of every stored series served while the block runs."""
+    freshness = DataFreshness()
+    token = _freshness.set(freshness)
+    try:
+        yield freshness
+    finally:
+        _freshness.reset(token)
+
+
+class SeriesStore:
+    """
+    Thread-safe in-process store of raw series histories.
+
+    Keys are indicator IDs for configured indicators (e.g. "SP500") and
+    "source:series_id" for auxiliary series (e.g. "fred:USREC"). Every put bumps
+    the series version so derived results can tell when their inputs changed.
+
+    With a shared backend (settings.SHARED_CACHE_BACKEND), the in-process entries act as a
+    first level in front of it: puts are written through, and a local miss or stale entry
+    is answered from the backend when another worker has already fetched the series.
+    lease() lets exactly one worker refresh a series while the others wait for its result.
+    """
+
+    def __init__(self, max_age_seconds: Optional[int] = None, backend: Optional[SharedCacheBackend] = None):
+        self.max_age_seconds = max_age_seconds if max_age_seconds is not None else settings.SERIES_CACHE_TTL_SECONDS
+        self.backend = backend
+        self._entries: Dict[str, StoredSeries] = {}
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[str, StoredSeries], None]] = []
+
+    @staticmethod
+    def _is_fresh(fetched_at: float, max_age: Optional[int]) -> bool:
+        return max_age is None or max_age < 0 or time.time() - fetched_at <= max_age
+
+    def add_listener(self, listener: Callable[[str, StoredSeries], None]) -> None:
+        """Call listener(key, entry) whenever a series gets a new version (put, or adopted from the shared cache)."""
+        self._listeners.append(listener)
+
+    def _notify(self, key: str, entry: StoredSeries) -> None:
+        for listener in self._listeners:
+            try:
+                listener(key, entry)
+            except Exception as e:
+                logger.error(f"SeriesStore: change listener failed for {key}: {e}", exc_info=True)
+
+    def is_fresh(self, entry: StoredSeries) -> bool:
+        """Whether an entry is within the store's max age."""
+        return self._is_fresh(entry.fetched_at, self.max_age_seconds)
+
+    def peek(self, key: str) -> Optional[StoredSeries]:
+        """The stored entry of any age, local or shared, without counting a cache lookup."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.backend is not None:
+            entry = self._load_shared(key, -1, None)
+        return entry
+
+    def _served(self, entry: StoredSeries) -> StoredSeries:
+        freshness = _freshness.get()
+        if freshness is not None:
+            freshness.note(entry.fetched_at, stale=not self._is_fresh(entry.fetched_at, self.max_age_seconds))
+        return entry
+
+    def get(self, key: str, max_age_seconds: Optional[int] = None) -> Optional[StoredSeries]:
+        """Return the stored series if present and fresh enough, otherwise None."""
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self._is_fresh(entry.fetched_at, max_age):
+            record_cache("series_store", hit=True)
+            return self._served(entry)
+        record_cache("series_store", hit=False)
+        if self.backend is None:
+            return None
+        entry = self._load_shared(key, max_age, entry)
+        return self._served(entry) if entry is not None else None
+
+    def _load_shared(self, key: str, max_age: Optional[int], local: Optional[StoredSeries]) -> Optional[StoredSeries]:
+        """Adopt the backend's copy of a series if it is newer than ours and fresh enough."""
+        record = self.backend.read(key)
+        if record is None or not self._is_fresh(record.fetched_at, max_age):
+            record_cache("shared_cache", hit=False)
+            return None
+        record_cache("shared_cache", hit=True)
+        if local is not None and local.version >= record.version and local.fetched_at >= record.fetched_at:
+            return local
+        entry = StoredSeries(
+            key=key,
+            series=record.to_series(),
+            fetched_at=record.fetched_at,
+            version=record.version,
+            info=record.info
+        )
+        with self._lock:
+            self._entries[key] = entry
+        logger.debug("SeriesStore: loaded %s from the shared cache (version %d)", key, entry.version)
+        self._notify(key, entry)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        data: Union[pd.DataFrame, CompactSeries],
+        fetched_at: Optional[float] = None,
+        version: Optional[int] = None,
+        info: Optional[Dict[str, Any]] = None
+    ) -> StoredSeries:
+        """
+        Store a series. A 'date'/'value' DataFrame is normalised to a sorted, de-duplicated
+        CompactSeries; a CompactSeries is stored as is.
+        An explicit version (e.g. from a snapshot) is honoured unless it would move the version backwards.
+        """
+        series = self._as_series(data)
+
+        shared_version = self.backend.version(key) if self.backend is not None else 0
+        with self._lock:
+            previous = self._entries.get(key)
+            next_version = max(previous.version if previous else 0, shared_version) + 1
+            entry = StoredSeries(
+                key=key,
+                series=series,
+                fetched_at=fetched_at if fetched_at is not None else time.time(),
+                version=max(next_version, version or 0),
+                info=dict(info or {})
+            )
+            self._entries[key] = entry
+            self._publish_footprint()
+        self._served(entry)
+        if self.backend is not None:
+            self.backend.write(SharedSeriesRecord.from_series(key, series, entry.fetched_at, entry.version, entry.info))
+        self._notify(key, entry)
+        logger.debug("SeriesStore: stored %s (%d points, version %d)", key, len(series), entry.version)
+        return entry
+
+    def has_copy(self, key: str) -> bool:
+        """Whether any copy of key, however old, is available locally or in the shared cache."""
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.backend is not None and self.backend.version(key) > 0
+
+    def refresh(self, key: str, data: Union[pd.DataFrame, CompactSeries], info: Optional[Dict[str, Any]] = None) -> StoredSeries:
+        """
+        Store freshly fetched data. An empty fetch (upstream error or rate limiting) does not
+        replace an existing copy: the stale copy is returned and served instead.
+        """
+        if len(data) == 0:
+            stale = self.get(key, max_age_seconds=-1)
+            if stale is not None and len(stale.series):
+                metrics.increment("macro_stale_served_total", cache="series_store")
+                logger.warning(f"SeriesStore: refresh of {key} returned no data; serving copy from {time.ctime(stale.fetched_at)}")
+                return stale
+        return self.put(key, data, info=info)
+
+    @contextmanager
+    def lease(self, key: str, max_age_seconds: Optional[int] = None) -> Iterator[Optional[StoredSeries]]:
+        """
+        Coordinate a refresh of key across workers.
+
+        Yields a fresh entry if another worker stored one while we waited for its lease; the
+        caller should use it instead of fetching. Yields None when the caller holds the lease
+        (or waited settings.SHARED_CACHE_WAIT_SECONDS in vain) and should fetch and put().
+        Without a shared backend this always yields None immediately.
+        """
+        if self.backend is None:
+            yield None
+            return
+
+        owner = lease_owner()
+        deadline = time.monotonic() + settings.SHARED_CACHE_WAIT_SECONDS
+        acquired = False
+        try:
+            while True:
+                if self.backend.acquire_lease(key, owner, settings.SHARED_CACHE_LEASE_SECONDS):
+                    acquired = True
+                    # The previous holder may have finished between our miss and the lease
+                    yield self.get(key, max_age_seconds)
+                    return
+                entry = self.get(key, max_age_seconds)
+                if entry is not None:
+                    yield entry
+                    return
+                if time.monotonic() >= deadline:
+                    logger.warning(f"SeriesStore: gave up waiting for the refresh lease on {key}; fetching it here")
+                    yield None
+                    return
+                time.sleep(settings.SHARED_CACHE_POLL_SECONDS)
+        finally:
+            if acquired:
+                self.backend.release_lease(key, owner)
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetcher: Callable[[], pd.DataFrame],
+        max_age_seconds: Optional[int] = None
+    ) -> StoredSeries:
+        """Return a fresh stored series, calling fetcher() and storing the result on a miss."""
+        entry = self.get(key, max_age_seconds)
+        if entry is not None:
+            return entry
+        with self.lease(key, max_age_seconds) as entry:
+            if entry is not None:
+                return entry
+            with stale_fallback(self.has_copy(key)):
+                data = fetcher()
+            return self.refresh(key, data)
+
+    @staticmethod
+    def history_start(entry: StoredSeries) -> str:
+        """
+        Earliest date a stored history was fetched from: FULL_HISTORY if fetched without a start
+        date (snapshots and older entries: settings.HISTORY_START_DATE).
+        """
+        history_start = entry.info.get("history_start")
+        return settings.HISTORY_START_DATE if history_start is None else history_start
+
+    def get_history(
+        self,
+        key: str,
+        start_date: Optional[str],
+        fetch_range: Callable[[str, Optional[str]], Union[pd.DataFrame, CompactSeries]],
+        full_refresh_seconds: Optional[float] = None,
+        is_current: Optional[Callable[[StoredSeries], bool]] = None,
+        annotate: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> StoredSeries:
+        """
+        A stored history from settings.HISTORY_START_DATE (or the earlier start_date; FULL_HISTORY
+        for everything the source has) through today, fetched with fetch_range(start, end)
+        (start FULL_HISTORY: from the first observation; end None: through today).
+        Only what the stored copy lacks is fetched:
+
+        - nothing stored, last full fetch older than full_refresh_seconds, or is_current(entry)
+          false (e.g. a derived series whose inputs changed): the whole history
+        - start_date before the stored history: just the earlier range
+        - stored copy past its max age: just the tail after its last point, re-reading
+          settings.HISTORY_TOPUP_OVERLAP_DAYS before it to pick up revisions
+
+        annotate() returns info recorded with every new copy, after its fetches (e.g. the input
+        versions a derived series was computed from). A fetch that returns nothing keeps (and
+        serves) the existing copy.
+        """
+        required_start = settings.HISTORY_START_DATE
+        if start_date is not None and start_date < required_start:
+            required_start = start_date
+
+        def covers(entry: Optional[StoredSeries]) -> bool:
+            return (
+                entry is not None
+                and self.history_start(entry) <= required_start
+                and (is_current is None or is_current(entry))
+            )
+
+        def annotated(info: Dict[str, Any]) -> Dict[str, Any]:
+            if annotate is not None:
+                info.update(annotate())
+            return info
+
+        entry = self.get(key)
+        if covers(entry):
+            return entry
+
+        # With a shared cache, only the lease holder fetches; other workers get its result
+        with self.lease(key) as entry:
+            if covers(entry):
+                return entry
+
+            current = self.peek(key)
+            now = time.time()
+            full_fetched_at = current.info.get("full_fetched_at", current.fetched_at) if current is not None else 0
+            if (
+                current is None
+                or not len(current.series)
+                or (full_refresh_seconds is not None and now - full_fetched_at > full_refresh_seconds)
+                or (is_current is not None and not is_current(current))
+            ):
+                history_start = min(required_start, self.history_start(current)) if current is not None else required_start
+                with stale_fallback(self.has_copy(key)):
+                    data = fetch_range(history_start, None)
+                info = dict(current.info) if current is not None else {}
+                info.update(history_start=history_start, full_fetched_at=now)
+                return self.refresh(key, data, info=annotated(info))
+
+            series, info, fetched_at = current.series, dict(current.info), current.fetched_at
+            changed = False
+            history_start = self.history_start(current)
+            if required_start < history_start:
+                head = self._as_series(fetch_range(required_start, history_start))
+                logger.info("SeriesStore: extended %s back to %s (%s points)", key, required_start, len(head))
+                series = head.combine(series)
+                # Recorded as covered even if empty (the series may start later); a full
+                # refresh re-reads it in any case
+                info["history_start"] = required_start
+                changed = True
+
+            if not self.is_fresh(current):
+                topup_start = (current.series.last_date - timedelta(days=settings.HISTORY_TOPUP_OVERLAP_DAYS)).strftime("%Y-%m-%d")
+                with stale_fallback(True):
+                    tail = self._as_series(fetch_range(topup_start, None))
+                if len(tail):
+                    logger.info("SeriesStore: topped up %s from %s (%s points)", key, topup_start, len(tail))
+                    series = series.combine(tail)
+                    fetched_at = now
+                    changed = True
+                else:
+                    metrics.increment("macro_stale_served_total", cache="series_store")
+                    logger.warning(f"SeriesStore: top-up of {key} returned no data; serving copy from {time.ctime(current.fetched_at)}")
+
+            if not changed:
+                return self._served(current)
+            return self.put(key, series, fetched_at=fetched_at, info=annotated(info))
+
+    @staticmethod
+    def _as_series(data: Union[pd.DataFrame, CompactSeries]) -> CompactSeries:
+        return data if isinstance(data, CompactSeries) else CompactSeries.from_frame(data)
+
+    def version(self, key: str) -> int:
+        """Current version of a series: the local copy's, else the shared cache's (0 if stored nowhere)."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            return entry.version
+        return self.backend.version(key) if self.backend is not None else 0
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            keys = list(self._entries.keys())
+        if self.backend is not None:
+            keys.extend(key for key in self.backend.keys() if key not in self._entries)
+        return keys
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Bytes held by each locally stored series (date and value buffers)."""
+        with self._lock:
+            return {key: entry.series.nbytes for key, entry in self._entries.items()}
+
+    def _publish_footprint(self) -> None:
+        metrics.set_gauge("macro_series_store_series", len(self._entries))
+        metrics.set_gauge("macro_series_store_points", sum(len(entry.series) for entry in self._entries.values()))
+        metrics.set_gauge("macro_series_store_bytes", sum(entry.series.nbytes for entry in self._entries.values()))
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._publish_footprint()
+        if self.backend is not None:
+            self.backend.delete(key)
+
+
+# Process-wide store shared by all service instances (and, with a shared backend, all workers)
+series_store = SeriesStore(backend=create_shared_backend())
@@ -0,0 +1,364 @@
+# backend/app/services/shared_cache.py
+
+import json
+import logging
+import mmap
+import os
+import socket
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from urllib.parse import quote, unquote
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.compact_series import CompactSeries
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_BACKENDS = ("none", "memory", "sqlite", "mmap")
+
+
+@dataclass
+class SharedSeriesRecord:
+    """A series as held by a shared cache backend: plain typed arrays plus bookkeeping."""
+    key: str
+    dates: np.ndarray  # int64 nanoseconds since the epoch
+    values: np.ndarray  # float64
+    fetched_at: float
+    version: int
+    info: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_series(cls, key: str, series: CompactSeries, fetched_at: float, version: int, info: Dict[str, Any]):
+        return cls(
+            key=key,
+            dates=series.dates.view(np.int64),
+            values=series.values,
+            fetched_at=fetched_at,
+            version=version,
+            info=dict(info or {})
+        )
+
+    def to_series(self) -> CompactSeries:
+        return CompactSeries.from_arrays(self.dates, self.values)
+
+
+def lease_owner() -> str:
+    """Identifies the calling thread across all workers on all hosts sharing a backend."""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class SharedCacheBackend(ABC):
+    """
+    Series storage shared by every worker process, plus short-lived refresh leases so that
+    only one worker fetches a given series from upstream at a time.
+    """
+
+    @abstractmethod
+    def read(self, key: str) -> Optional[SharedSeriesRecord]:
+        ...
+
+    @abstractmethod
+    def write(self, record: SharedSeriesRecord) -> None:
+        ...
+
+    def version(self, key: str) -> int:
+        record = self.read(key)
+        return record.version if record else 0
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def keys(self) -> List[str]:
+        ...
+
+    @abstractmethod
+    def acquire_lease(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        """Take the refresh lease for key unless another owner holds an unexpired one."""
+
+    @abstractmethod
+    def release_lease(self, key: str, owner: str) -> None:
+        ...
+
+
+class InMemoryCacheBackend(SharedCacheBackend):
+    """Process-local stand-in with the same semantics, for tests and single-worker runs."""
+
+    def __init__(self):
+        self._records: Dict[str, SharedSeriesRecord] = {}
+        self._leases: Dict[str, tuple] = {}  # {key: (owner, expires_at)}
+        self._lock = threading.Lock()
+
+    def read(self, key: str) -> Optional[SharedSeriesRecord]:
+        with self._lock:
+            return self._records.get(key)
+
+    def write(self, record: SharedSeriesRecord) -> None:
+        with self._lock:
+            self._records[record.key] = record
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._records.pop(key, None)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._records.keys())
+
+    def acquire_lease(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            holder = self._leases.get(key)
+            if holder is not None and holder[0] != owner and holder[1] > now:
+                return False
+            self._leases[key] = (owner, now + ttl_seconds)
+            return True
+
+    def release_lease(self, key: str, owner: str) -> None:
+        with self._lock:
+            holder = self._leases.get(key)
+            if holder is not None and holder[0] == owner:
+                del self._leases[key]
+
+
+class SQLiteCacheBackend(SharedCacheBackend):
+    """
+    Shared cache in a local SQLite database (WAL mode), usable by every uvicorn worker on
+    the host. Series are stored as raw int64/float64 array blobs, so reading one back is a
+    single row fetch and two zero-parse buffer conversions.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS series ("
+                " key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, version INTEGER NOT NULL,"
+                " info TEXT NOT NULL, dates BLOB NOT NULL, vals BLOB NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                " key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def read(self, key: str) -> Optional[SharedSeriesRecord]:
+        row = self._connection().execute(
+            "SELECT fetched_at, version, info, dates, vals FROM series WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        fetched_at, version, info, dates, values = row
+        return SharedSeriesRecord(
+            key=key,
+            dates=np.frombuffer(dates, dtype=np.int64),
+            values=np.frombuffer(values, dtype=np.float64),
+            fetched_at=fetched_at,
+            version=version,
+            info=json.loads(info)
+        )
+
+    def write(self, record: SharedSeriesRecord) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO series (key, fetched_at, version, info, dates, vals) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    record.key,
+                    record.fetched_at,
+                    record.version,
+                    json.dumps(record.info, default=str),
+                    np.ascontiguousarray(record.dates, dtype=np.int64).tobytes(),
+                    np.ascontiguousarray(record.values, dtype=np.float64).tobytes(),
+                )
+            )
+
+    def version(self, key: str) -> int:
+        row = self._connection().execute("SELECT version FROM series WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def delete(self, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM series WHERE key = ?", (key,))
+
+    def keys(self) -> List[str]:
+        return [row[0] for row in self._connection().execute("SELECT key FROM series")]
+
+    def acquire_lease(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._connection() as conn:
+            # Upsert only replaces an expired lease or our own; the SELECT tells us who won
+            conn.execute(
+                "INSERT INTO leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE leases.expires_at <= ? OR leases.owner = excluded.owner",
+                (key, owner, now + ttl_seconds, now)
+            )
+            row = conn.execute("SELECT owner FROM leases WHERE key = ?", (key,)).fetchone()
+        return row is not None and row[0] == owner
+
+    def release_lease(self, key: str, owner: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+
+
+class MmapCacheBackend(SharedCacheBackend):
+    """
+    Shared cache of one memory-mapped columnar file per series in a directory:
+
+        header   magic, point count, version, fetched_at, info length (little-endian, 64 bytes)
+        info     JSON, padded to a multiple of 8 bytes
+        dates    int64[count], nanoseconds since the epoch
+        values   float64[count]
+
+    A read maps the file and wraps the two columns with np.frombuffer, so nothing is parsed or
+    copied: a cold read of a 25k-point series costs an open, an mmap and a 64-byte header
+    parse, and every worker on the host shares the same pages through the OS page cache.
+    Windows are sliced straight out of the mapping.
+
+    A write (a refresh, or a top-up appending new points) builds the complete new file next to
+    the old one and swaps it in with os.replace, so readers see either the old or the new
+    series, never a partial one; mappings taken before the swap keep reading the old file.
+    Refresh leases are kept in a small SQLite database in the same directory.
+
+    Relies on POSIX rename semantics (replacing a file other processes have mapped), so it is
+    not available on Windows.
+    """
+
+    MAGIC = b"MDSERIE1"
+    HEADER = struct.Struct("<8sqqdq")
+    HEADER_SIZE = 64
+    SUFFIX = ".series"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._leases = SQLiteCacheBackend(os.path.join(directory, "leases.sqlite3"))
+        self._paths: Dict[str, str] = {}
+
+    def _path(self, key: str) -> str:
+        path = self._paths.get(key)
+        if path is None:
+            # Keys such as "fred:USREC" are not valid file names everywhere
+            path = self._paths[key] = os.path.join(self.directory, quote(key, safe="-_.^") + self.SUFFIX)
+        return path
+
+    def _read_header(self, buffer) -> Optional[tuple]:
+        magic, count, version, fetched_at, info_length = self.HEADER.unpack_from(buffer)
+        if magic != self.MAGIC:
+            return None
+        return count, version, fetched_at, info_length
+
+    def read(self, key: str) -> Optional[SharedSeriesRecord]:
+        try:
+            with open(self._path(key), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None  # Missing, or empty (mmap cannot map zero bytes)
+        header = self._read_header(mapped)
+        if header is None:
+            logger.error(f"Ignoring {self._path(key)}: not a series file")
+            return None
+        count, version, fetched_at, info_length = header
+        offset = self.HEADER_SIZE + _padded(info_length)
+        info = json.loads(mapped[self.HEADER_SIZE:self.HEADER_SIZE + info_length]) if info_length else {}
+        # Read-only views of the mapping; it stays open for as long as they are referenced
+        dates = np.frombuffer(mapped, dtype="<i8", count=count, offset=offset)
+        values = np.frombuffer(mapped, dtype="<f8", count=count, offset=offset + 8 * count)
+        return SharedSeriesRecord(key=key, dates=dates, values=values, fetched_at=fetched_at, version=version, info=info)
+
+    def write(self, record: SharedSeriesRecord) -> None:
+        info = json.dumps(record.info, default=str).encode("utf-8")
+        count = len(record.values)
+        header = self.HEADER.pack(self.MAGIC, count, record.version, record.fetched_at, len(info))
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header.ljust(self.HEADER_SIZE, b"\0"))
+                f.write(info.ljust(_padded(len(info)), b" "))
+                f.write(np.ascontiguousarray(record.dates, dtype="<i8").tobytes())
+                f.write(np.ascontiguousarray(record.values, dtype="<f8").tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path(record.key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def version(self, key: str) -> int:
+        try:
+            with open(self._path(key), "rb") as f:
+                header = self._read_header(f.read(self.HEADER.size).ljust(self.HEADER.size, b"\0"))
+        except FileNotFoundError:
+            return 0
+        return header[1] if header else 0
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def keys(self) -> List[str]:
+        return [
+            unquote(name[:-len(self.SUFFIX)])
+            for name in os.listdir(self.directory) if name.endswith(self.SUFFIX)
+        ]
+
+    def acquire_lease(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        return self._leases.acquire_lease(key, owner, ttl_seconds)
+
+    def release_lease(self, key: str, owner: str) -> None:
+        self._leases.release_lease(key, owner)
+
+
+def _padded(length: int) -> int:
+    """length rounded up to a multiple of 8, keeping the columns after it aligned."""
+    return (length + 7) // 8 * 8
+
+
+def create_shared_backend(kind: Optional[str] = None, path: Optional[str] = None) -> Optional[SharedCacheBackend]:
+    """
+    Build the backend selected by settings.SHARED_CACHE_BACKEND ("none", "memory", "sqlite" or "mmap").
+
+    Raises:
+        ValueError: If the backend name is not supported
+    """
+    kind = (kind or settings.SHARED_CACHE_BACKEND).lower()
+    if kind not in SHARED_CACHE_BACKENDS:
+        raise ValueError(f"Invalid shared cache backend '{kind}'. Valid backends are: {', '.join(SHARED_CACHE_BACKENDS)}.")
+    if kind == "memory":
+        return InMemoryCacheBackend()
+    if kind == "sqlite":
+        path = path or settings.SHARED_CACHE_PATH
+        logger.info("Using shared series cache at %s", path)
+        return SQLiteCacheBackend(path)
+    if kind == "mmap":
+        if os.name == "nt":
+            raise ValueError("The 'mmap' shared cache backend is not supported on Windows; use 'sqlite'.")
+        path = path or settings.SHARED_CACHE_DIR
+        logger.info("Using memory-mapped series files in %s", path)
+        return MmapCacheBackend(path)
+    return None
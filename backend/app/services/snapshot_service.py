@@ -0,0 +1,146 @@
+# backend/app/services/snapshot_service.py
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.indicator_config import get_all_indicators
+from app.services.rate_governor import Priority, upstream_priority
+from app.services.compact_series import CompactSeries
+from app.services.series_store import SeriesStore, series_store
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class SnapshotService:
+    """
+    Exports the local series store to a single compressed bundle and loads it back.
+
+    Bundle layout (numpy .npz, zip-deflated):
+        manifest        UTF-8 JSON: format version, creation time, history start and, per series,
+                        its key, version, fetch timestamp, point count and source info
+        dates_<n>       int64 nanoseconds since the epoch for series n
+        values_<n>      float64 values for series n
+
+    Loading decompresses plain typed arrays straight into the store, so a node can start
+    from a bundle in seconds and serve every indicator without upstream calls.
+    """
+
+    def __init__(self, unified_service=None, store: Optional[SeriesStore] = None):
+        self._unified_service = unified_service
+        self.store = store or series_store
+
+    @property
+    def unified_service(self):
+        # Imported lazily: importing only to load a bundle should not construct the upstream clients
+        if self._unified_service is None:
+            from app.services.unified_indicator_service import UnifiedIndicatorService
+            self._unified_service = UnifiedIndicatorService()
+        return self._unified_service
+
+    def collect(self) -> List[str]:
+        """Fetch the full raw history of every configured indicator into the store; returns failed IDs."""
+        failed = []
+        for indicator_id in get_all_indicators():
+            try:
+                with upstream_priority(Priority.BACKGROUND):
+                    history = self.unified_service.get_raw_history(indicator_id)
+                if history.empty:
+                    failed.append(indicator_id)
+            except Exception as e:
+                logger.error(f"Snapshot: failed to collect {indicator_id}: {e}", exc_info=True)
+                failed.append(indicator_id)
+        return failed
+
+    def export_snapshot(self, path: str, collect: bool = True) -> Dict[str, Any]:
+        """
+        Write every series held in the store (configured indicators plus auxiliary and
+        composite input series) to a compressed bundle.
+
+        Args:
+            path: Destination file; numpy appends ".npz" if the name has no such suffix
+            collect: Fetch all configured indicators into the store first
+
+        Returns:
+            dict: The bundle manifest
+        """
+        failed = self.collect() if collect else []
+
+        arrays: Dict[str, np.ndarray] = {}
+        series_manifest = []
+        for index, key in enumerate(sorted(self.store.keys())):
+            entry = self.store.get(key, max_age_seconds=-1)
+            if entry is None:
+                continue
+            arrays[f"dates_{index}"] = entry.series.dates.view(np.int64)
+            arrays[f"values_{index}"] = entry.series.values
+            series_manifest.append({
+                "key": key,
+                "index": index,
+                "version": entry.version,
+                "fetched_at": entry.fetched_at,
+                "points": len(entry.series),
+                "info": entry.info,
+            })
+
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "history_start_date": settings.HISTORY_START_DATE,
+            "failed_indicators": failed,
+            "series": series_manifest,
+        }
+        arrays["manifest"] = np.frombuffer(json.dumps(manifest, default=str).encode("utf-8"), dtype=np.uint8)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(path, **arrays)
+        logger.info("Exported snapshot with %s series to %s (%s indicators failed)", len(series_manifest), path, len(failed))
+        return manifest
+
+    def import_snapshot(self, path: str) -> Dict[str, Any]:
+        """
+        Load a bundle written by export_snapshot into the store, keeping the recorded
+        versions and fetch timestamps.
+
+        Returns:
+            dict: The bundle manifest
+
+        Raises:
+            FileNotFoundError: If the bundle does not exist
+            ValueError: If the bundle format is not supported
+        """
+        started = time.perf_counter()
+        with np.load(path, allow_pickle=False) as bundle:
+            manifest = json.loads(bundle["manifest"].tobytes().decode("utf-8"))
+            if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"Unsupported snapshot format version: {manifest.get('format_version')}")
+            if manifest.get("history_start_date") != settings.HISTORY_START_DATE:
+                logger.warning(
+                    f"Snapshot history starts at {manifest.get('history_start_date')}, "
+                    f"but HISTORY_START_DATE is {settings.HISTORY_START_DATE}"
+                )
+
+            for series in manifest["series"]:
+                index = series["index"]
+                data = CompactSeries.from_arrays(bundle[f"dates_{index}"], bundle[f"values_{index}"])
+                self.store.put(
+                    series["key"],
+                    data,
+                    fetched_at=series["fetched_at"],
+                    version=series["version"],
+                    info=series.get("info")
+                )
+
+        logger.info(
+            "Imported snapshot %s: %s series created %s in %.2fs", path, len(manifest['series']), manifest.get('created_at'), time.perf_counter() - started
+        )
+        return manifest
@@ -1,8 +1,9 @@
 # backend/app/services/unified_indicator_service.py
 
-from typing import List, Optional, Dict, Set, Tuple
+from typing import Any, List, Optional, Dict, Set, Tuple
 from datetime import datetime, timedelta
 import logging
+import time
 import pandas as pd
 from app.core.indicator_config import (
     get_indicator_metadata,
@@ -10,10 +11,12 @@ from app.core.indicator_config import (
     get_sorted_categories, 
     get_category_by_name,
     get_indicators_by_type,
+    get_indicators_by_category_name,
     DataSourceType,
     TransformationType,
     IndicatorType,
     CategoryDefinition,
+    IndicatorMetadata,
     SignalStatus 
 )
 from app.services.fred_service import FredService
@@ -21,6 +24,13 @@ from app.services.yahoo_finance_service import YahooFinanceService
 from app.services.dbnom_service import DBNomicsService
 from app.services.composite_indicators_service import CompositeIndicatorsService
 from app.services.indicator_processing_service import IndicatorProcessingService
+from app.services.series_store import FULL_HISTORY, StoredSeries, series_store, track_freshness
+from app.services.compact_series import CompactSeries
+from app.services.backfill import backfill_service
+from app.services.fred_planner import FredFetchPlanner
+from app.services.rate_governor import Priority, stale_fallback, upstream_priority
+from app.core.config import settings
+from app.core.metrics import metrics, record_cache
 from app.models.indicators import (
     TimeSeriesPoint,
     EnrichedIndicatorData,
@@ -39,8 +49,13 @@ class UnifiedIndicatorService:
         self.fred_service = FredService()
         self.yahoo_service = YahooFinanceService()
         self.dbnom_service = DBNomicsService()
-        self.composite_service = CompositeIndicatorsService()
+        self.composite_service = CompositeIndicatorsService(self.yahoo_service, self.fred_service)
         self.processing_service = IndicatorProcessingService()
+        self.series_store = series_store
+        self.backfill_service = backfill_service
+        self.fred_planner = FredFetchPlanner(self)
+        # Default market status, with the indicator versions it was calculated from
+        self._market_status: Optional[Tuple[MarketStatusResponse, Dict[str, int], float]] = None
 
     def _adjust_start_date_for_transformation(
         self,
@@ -77,6 +92,9 @@ class UnifiedIndicatorService:
         if not metadata:
             return start_date, end_date, start_date
 
+        if not start_date and metadata.data_source == DataSourceType.YAHOO:
+            # Yahoo has no "everything" default: show its default window (the buffers below are added to it)
+            start_date = self.yahoo_service.default_start()
         original_start_date = start_date
         
         # First, adjust for YoY transformation if needed
@@ -90,7 +108,7 @@ class UnifiedIndicatorService:
             transformation_adjusted_start, ma_buffer_days
         )
         
-        logger.info(f"[{indicator_id}] Date calculations: original='{original_start_date}' -> transformation_adjusted='{transformation_adjusted_start}' -> final_fetch='{final_fetch_start}' (buffer_days={ma_buffer_days})")
+        logger.debug("[%s] Date calculations: original='%s' -> transformation_adjusted='%s' -> final_fetch='%s' (buffer_days=%s)", indicator_id, original_start_date, transformation_adjusted_start, final_fetch_start, ma_buffer_days)
         
         return final_fetch_start, end_date, original_start_date
 
@@ -98,10 +116,11 @@ class UnifiedIndicatorService:
         self,
         indicator_id: str,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        use_store: bool = True
     ) -> Tuple[List[TimeSeriesPoint], str, Optional[str], Optional[str]]:
         
-        logger.info(f"[_fetch_raw_data for {indicator_id}] Received params -> start_date: '{start_date}', end_date: '{end_date}'")
+        logger.debug("[_fetch_raw_data for %s] Received params -> start_date: '%s', end_date: '%s'", indicator_id, start_date, end_date)
         
         metadata = get_indicator_metadata(indicator_id)
         if not metadata:
@@ -113,63 +132,280 @@ class UnifiedIndicatorService:
             indicator_id, start_date, end_date
         )
         
-        logger.info(f"[_fetch_raw_data for {indicator_id}] Using fetch dates -> start: '{fetch_start_date}', end: '{fetch_end_date}'")
+        logger.debug("[_fetch_raw_data for %s] Using fetch dates -> start: '%s', end: '%s'", indicator_id, fetch_start_date, fetch_end_date)
+
+        if use_store:
+            # One full history per indicator answers every window (buffers included) by slicing;
+            # only ranges it does not cover yet are fetched upstream. No start date means the
+            # source's whole history, as an upstream call without one returns
+            entry = self._ensure_history(indicator_id, fetch_start_date or FULL_HISTORY)
+            if entry is not None and len(entry.series):
+                return self._window_points(indicator_id, entry, fetch_start_date, fetch_end_date)
+
+        # History already covered by a higher-precedence local dataset is not requested upstream
+        live_start_date = fetch_start_date
+        if metadata.backfill:
+            live_start_date = self.backfill_service.live_start_date(metadata.backfill, fetch_start_date)
 
         df = pd.DataFrame()
         data_points: List[TimeSeriesPoint] = []
         title = metadata.name 
         units = metadata.units
         frequency = metadata.frequency
+        # An expired stored copy means callers can be served stale data instead of waiting on rate limits
+        stale_available = self.series_store.has_copy(indicator_id)
 
         try:
-            # When calling specific services, pass the calculated fetch dates
-            if metadata.data_source == DataSourceType.FRED:
-                df = self.fred_service.get_series_data(metadata.series_id, fetch_start_date, fetch_end_date)
-                series_info = self.fred_service.get_series_info(metadata.series_id)
-                title = series_info.get("title", metadata.name) 
-                units = series_info.get("units", metadata.units)
-                frequency = series_info.get("frequency", metadata.frequency)
-            elif metadata.data_source == DataSourceType.YAHOO:
-                logger.info(f"[_fetch_raw_data for {indicator_id}] Calling Yahoo with series_id: '{metadata.series_id}', start: '{fetch_start_date}', end: '{fetch_end_date}'")
-                df = self.yahoo_service.get_ticker_data(metadata.series_id, fetch_start_date, fetch_end_date)
-            elif metadata.data_source == DataSourceType.DBNOMICS_ISM:
-                logger.info(f"[_fetch_raw_data for {indicator_id}] Calling DBNOMICS_ISM with start: '{fetch_start_date}', end: '{fetch_end_date}'")
-                if indicator_id == "ISM-PMI":
-                    df = self.dbnom_service.get_ism_pmi(fetch_start_date, fetch_end_date)
-                elif indicator_id == "ISM-NEW-ORDERS":
-                    df = self.dbnom_service.get_ism_new_orders(fetch_start_date, fetch_end_date)
-                else: 
-                    logger.error(f"Unknown indicator ID: {indicator_id} for DataSourceType.DBNOMICS_ISM")
-            elif metadata.data_source == DataSourceType.CUSTOM_COMPOSITE:
-                logger.info(f"[_fetch_raw_data for {indicator_id}] Calling CUSTOM_COMPOSITE with start: '{fetch_start_date}', end: '{fetch_end_date}'")
-                if indicator_id == "GOLD-COPPER-RATIO":
-                    df = self.composite_service.get_gold_copper_ratio(fetch_start_date, fetch_end_date)
-                else:
-                    logger.error(f"Unknown CUSTOM_COMPOSITE indicator ID: {indicator_id}")
-            else:
-                logger.error(f"Unsupported data source: {metadata.data_source} for indicator {indicator_id}")
+            with stale_fallback(stale_available):
+                df, title, units, frequency = self._fetch_from_source(
+                    indicator_id, metadata, live_start_date, fetch_end_date, title, units, frequency
+                )
+
+            if metadata.backfill:
+                df = self.backfill_service.apply(indicator_id, metadata.backfill, df, fetch_start_date, fetch_end_date)
 
             if not df.empty:
+                valid = df["value"].notna()
                 data_points = [
-                    TimeSeriesPoint(date=row["date"], value=row["value"])
-                    for _, row in df.iterrows() if pd.notna(row["value"])
+                    TimeSeriesPoint(date=date, value=value)
+                    for date, value in zip(df["date"][valid], df["value"][valid])
                 ]
             else:
                  logger.warning(f"No data returned from source for indicator {indicator_id}")
         except Exception as e:
             logger.error(f"Error fetching raw data for {indicator_id} from {metadata.data_source}: {e}", exc_info=True)
+
+        if not data_points and use_store and stale_available:
+            # Upstream failed or is rate limited: serve the expired stored copy rather than nothing
+            stored = self._get_stored_window(indicator_id, fetch_start_date, fetch_end_date, max_age_seconds=-1)
+            if stored is not None and stored[0]:
+                metrics.increment("macro_stale_served_total", cache="indicator_window")
+                logger.warning(f"Serving stale stored data for {indicator_id}")
+                return stored
         
-        logger.info(f"Fetched {len(data_points)} raw data points for {indicator_id} (including any buffer data)")
+        logger.debug("Fetched %s raw data points for %s (including any buffer data)", len(data_points), indicator_id)
         return data_points, title, units, frequency
 
+    def _fetch_from_source(
+        self,
+        indicator_id: str,
+        metadata: IndicatorMetadata,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        title: str,
+        units: Optional[str],
+        frequency: Optional[str]
+    ) -> Tuple[pd.DataFrame, str, Optional[str], Optional[str]]:
+        """Call the indicator's upstream source for a raw window; returns the data and source-reported metadata."""
+        df = pd.DataFrame()
+        if metadata.data_source == DataSourceType.FRED:
+            df = self.fred_service.get_series_data(metadata.series_id, start_date, end_date)
+            series_info = self.fred_service.get_series_info(metadata.series_id)
+            title = series_info.get("title", metadata.name) 
+            units = series_info.get("units", metadata.units)
+            frequency = series_info.get("frequency", metadata.frequency)
+        elif metadata.data_source == DataSourceType.YAHOO:
+            logger.debug("[_fetch_raw_data for %s] Calling Yahoo with series_id: '%s', start: '%s', end: '%s'", indicator_id, metadata.series_id, start_date, end_date)
+            df = self.yahoo_service.get_ticker_data(metadata.series_id, start_date, end_date)
+        elif metadata.data_source == DataSourceType.DBNOMICS_ISM:
+            logger.debug("[_fetch_raw_data for %s] Calling DBNOMICS_ISM with start: '%s', end: '%s'", indicator_id, start_date, end_date)
+            if indicator_id == "ISM-PMI":
+                df = self.dbnom_service.get_ism_pmi(start_date, end_date)
+            elif indicator_id == "ISM-NEW-ORDERS":
+                df = self.dbnom_service.get_ism_new_orders(start_date, end_date)
+            else: 
+                logger.error(f"Unknown indicator ID: {indicator_id} for DataSourceType.DBNOMICS_ISM")
+        elif metadata.data_source == DataSourceType.CUSTOM_COMPOSITE:
+            logger.debug("[_fetch_raw_data for %s] Calling CUSTOM_COMPOSITE with start: '%s', end: '%s'", indicator_id, start_date, end_date)
+            df = self.composite_service.get_composite_data(indicator_id, start_date, end_date)
+        else:
+            logger.error(f"Unsupported data source: {metadata.data_source} for indicator {indicator_id}")
+        return df, title, units, frequency
+
+    def get_raw_history(self, indicator_id: str) -> pd.DataFrame:
+        """
+        Full raw history (from settings.HISTORY_START_DATE) for an indicator, served from
+        the local series store and fetched from its upstream source on a miss.
+        Used by the analytics services, which need long histories rather than display windows.
+
+        Returns:
+            pandas.DataFrame: DataFrame with date and value columns
+        """
+        # The stored copy may reach further back (requests without a start date); analytics
+        # always see the same span
+        return self._ensure_history(indicator_id).series.window(settings.HISTORY_START_DATE).to_frame()
+
+    def _input_versions(self, indicator_id: str) -> Optional[Dict[str, int]]:
+        """Current store versions of a composite's upstream leaf series (None for other indicators)."""
+        compiled = self.composite_service.graph.get(indicator_id)
+        if compiled is None:
+            return None
+        return {leaf: self.series_store.version(leaf) for leaf in compiled.leaves}
+
+    def _inputs_current(self, indicator_id: str, entry: StoredSeries) -> bool:
+        """False if a stored composite was computed from older versions of its leaves."""
+        inputs = entry.info.get("inputs")
+        return inputs is None or inputs == self._input_versions(indicator_id)
+
+    def refresh_composite_history(self, indicator_id: str) -> bool:
+        """
+        Recompute a stored composite history, at background priority, if its leaf series changed
+        since it was computed (called when one of them changed). Returns whether it was recomputed.
+        """
+        entry = self.series_store.peek(indicator_id)
+        if entry is None or self._inputs_current(indicator_id, entry):
+            return False
+        with upstream_priority(Priority.BACKGROUND):
+            self._ensure_history(indicator_id, self.series_store.history_start(entry))
+        return True
+
+    def _fetch_history_range(
+        self,
+        indicator_id: str,
+        start_date: str,
+        end_date: Optional[str] = None
+    ) -> Tuple[CompactSeries, Dict[str, Optional[str]]]:
+        """Fetch one range of an indicator's raw history upstream (backfill applied); FULL_HISTORY starts at the source's first observation."""
+        points, title, units, frequency = self._fetch_raw_data(indicator_id, start_date or None, end_date, use_store=False)
+        series = CompactSeries.from_frame(pd.DataFrame({
+            "date": [point.date for point in points],
+            "value": [point.value for point in points]
+        }))
+        return series, {"title": title, "units": units, "frequency": frequency}
+
+    def _ensure_history(self, indicator_id: str, start_date: Optional[str] = None) -> StoredSeries:
+        """
+        The stored full history of an indicator, extended to cover start_date (by default
+        settings.HISTORY_START_DATE; FULL_HISTORY for everything the source has) through today
+        (SeriesStore.get_history). The whole history is refetched every
+        settings.HISTORY_FULL_REFRESH_SECONDS, and a composite whenever any of its leaf series
+        changed version since it was computed.
+        """
+        fetched_info: Dict[str, Optional[str]] = {}
+
+        def fetch_range(start: str, end: Optional[str]) -> CompactSeries:
+            series, info = self._fetch_history_range(indicator_id, start, end)
+            fetched_info.update(info)
+            return series
+
+        def annotate() -> Dict[str, Any]:
+            info: Dict[str, Any] = dict(fetched_info)
+            # Leaf versions after the computation, which refreshes expired leaves itself
+            inputs = self._input_versions(indicator_id)
+            if inputs is not None:
+                info["inputs"] = inputs
+            return info
+
+        return self.series_store.get_history(
+            indicator_id,
+            start_date,
+            fetch_range,
+            full_refresh_seconds=settings.HISTORY_FULL_REFRESH_SECONDS,
+            is_current=lambda entry: self._inputs_current(indicator_id, entry),
+            annotate=annotate
+        )
+
+    def _window_points(
+        self,
+        indicator_id: str,
+        entry: StoredSeries,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Tuple[List[TimeSeriesPoint], str, Optional[str], Optional[str]]:
+        """A raw data window of a stored history, as _fetch_raw_data returns it."""
+        # Binary-search slice of the stored buffers; no copy until the points are built
+        window = entry.series.window(start_date, end_date)
+
+        metadata = get_indicator_metadata(indicator_id)
+        data_points = [
+            TimeSeriesPoint(date=date, value=value)
+            for date, value in zip(pd.DatetimeIndex(window.dates), window.values.tolist())
+        ]
+        logger.debug("Served %s raw data points for %s from the series store (version %s)", len(data_points), indicator_id, entry.version)
+        return (
+            data_points,
+            entry.info.get("title") or metadata.name,
+            entry.info.get("units") or metadata.units,
+            entry.info.get("frequency") or metadata.frequency
+        )
+
+    def _get_stored_window(
+        self,
+        indicator_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        max_age_seconds: Optional[int] = None
+    ) -> Optional[Tuple[List[TimeSeriesPoint], str, Optional[str], Optional[str]]]:
+        """
+        Serve a raw data window from the local series store (filled by analytics requests or a
+        snapshot import) instead of the upstream source, if the stored history covers its start.
+        """
+        entry = self.series_store.peek(indicator_id)
+        if entry is None or (start_date and start_date < self.series_store.history_start(entry)):
+            return None
+        entry = self.series_store.get(indicator_id, max_age_seconds)
+        if entry is None:
+            return None
+        return self._window_points(indicator_id, entry, start_date, end_date)
+
+    def get_fred_history(self, series_id: str) -> pd.DataFrame:
+        """
+        Full history of an auxiliary FRED series (e.g. USREC) that is not a configured
+        indicator, served from the local series store (the same entry composite FRED leaves use).
+        """
+        return self.series_store.get_history(
+            f"fred:{series_id}",
+            None,
+            lambda start, end: self.fred_service.get_series_data(series_id, start, end)
+        ).data
+
+    def get_fred_vintage(self, series_id: str, realtime_start: str, realtime_end: Optional[str] = None) -> pd.DataFrame:
+        """
+        Full history of a FRED series as published during a real-time period (ALFRED vintage),
+        e.g. realtime_start == realtime_end == "2008-09-15" for the data known on that day.
+
+        A vintage that ended in the past can never change, so it is stored permanently
+        (it never expires from the series store and is never refetched). An empty result
+        (FredService.get_series_data returns one on any error) is never stored.
+
+        Raises:
+            ValueError: If FRED returned no observations for the period
+        """
+        realtime_end = realtime_end or realtime_start
+        immutable = realtime_end < datetime.now().strftime("%Y-%m-%d")
+
+        def fetch() -> pd.DataFrame:
+            df = self.fred_service.get_series_data(
+                series_id, realtime_start=realtime_start, realtime_end=realtime_end
+            )
+            if df.empty:
+                raise ValueError(f"No data found for series {series_id} in real-time period {realtime_start} to {realtime_end}")
+            return df
+
+        return self.series_store.get_or_fetch(
+            f"alfred:{series_id}:{realtime_start}:{realtime_end}",
+            fetch,
+            max_age_seconds=-1 if immutable else None
+        ).data
+
+    def _prefetch_fred(self, indicator_ids: List[str], start_date: Optional[str]) -> None:
+        """Fetch the FRED series behind a multi-indicator view together, before processing it."""
+        if start_date and start_date < settings.HISTORY_START_DATE:
+            return  # Windows before the stored history are fetched per indicator
+        try:
+            self.fred_planner.prefetch(indicator_ids)
+        except Exception as e:
+            logger.error(f"FRED prefetch failed: {e}", exc_info=True)
+
     def get_indicator(
         self,
         indicator_id: str,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        include_signal_series: bool = False
     ) -> EnrichedIndicatorData:
         
-        logger.info(f"[get_indicator for {indicator_id}] Received params -> start_date: '{start_date}', end_date: '{end_date}'")
+        logger.debug("[get_indicator for %s] Received params -> start_date: '%s', end_date: '%s'", indicator_id, start_date, end_date)
         
         metadata = get_indicator_metadata(indicator_id)
         if not metadata:
@@ -181,12 +417,17 @@ class UnifiedIndicatorService:
             )
 
         # Fetch raw data (with buffers included)
-        raw_data, title, units, frequency = self._fetch_raw_data(indicator_id, start_date, end_date)
+        with track_freshness() as freshness:
+            raw_data, title, units, frequency = self._fetch_raw_data(indicator_id, start_date, end_date)
         
         # Process the data, passing the original start_date for proper trimming
         enriched_data = self.processing_service.process_indicator_data(
-            indicator_id, raw_data, title, units, frequency, start_date
+            indicator_id, raw_data, title, units, frequency, start_date,
+            include_signal_series=include_signal_series
         )
+        # Data not served from the store was fetched from its source just now
+        enriched_data.stale = freshness.stale
+        enriched_data.as_of = datetime.fromtimestamp(freshness.as_of) if freshness.as_of is not None else datetime.now()
         return enriched_data
 
     def get_all_indicators_metadata(self) -> List[IndicatorMetadataResponse]:
@@ -204,13 +445,9 @@ class UnifiedIndicatorService:
 
     def get_categories(self) -> List[CategoryInfo]:
         sorted_category_defs = get_sorted_categories() 
-        all_indicators_meta = get_all_indicators()   
         category_info_list = []
         for cat_def in sorted_category_defs:
-            indicator_ids_for_category = [
-                indicator_id for indicator_id, meta in all_indicators_meta.items()
-                if meta.category == cat_def.name 
-            ]
+            indicator_ids_for_category = list(get_indicators_by_category_name(cat_def.name))
             category_info_list.append(
                 CategoryInfo(
                     category_id=cat_def.id, name=cat_def.name,
@@ -223,19 +460,21 @@ class UnifiedIndicatorService:
         self,
         indicator_type: IndicatorType,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        include_signal_series: bool = False
     ) -> IndicatorsByTypeResponse:
         
-        logger.info(f"[get_enriched_indicators_by_type for type '{indicator_type.value}'] Received params -> start_date: '{start_date}', end_date: '{end_date}'")
+        logger.info("[get_enriched_indicators_by_type for type '%s'] Received params -> start_date: '%s', end_date: '%s'", indicator_type.value, start_date, end_date)
         
         typed_indicators_meta = get_indicators_by_type(indicator_type) 
         enriched_indicators_list: List[EnrichedIndicatorData] = []
         relevant_category_names_ordered: List[str] = [] 
+        self._prefetch_fred(list(typed_indicators_meta.keys()), start_date)
 
         for indicator_id, metadata in typed_indicators_meta.items():
             try:
                 # Pass the received start_date and end_date down
-                enriched_data = self.get_indicator(indicator_id, start_date, end_date) 
+                enriched_data = self.get_indicator(indicator_id, start_date, end_date, include_signal_series)
                 enriched_indicators_list.append(enriched_data)
                 if metadata.category not in relevant_category_names_ordered:
                     relevant_category_names_ordered.append(metadata.category)
@@ -247,7 +486,8 @@ class UnifiedIndicatorService:
         for cat_def in all_sorted_category_defs:
             if cat_def.name in relevant_category_names_ordered:
                 indicators_for_this_category_and_type = [
-                    ind_id for ind_id, meta in typed_indicators_meta.items() if meta.category == cat_def.name
+                    ind_id for ind_id, meta in get_indicators_by_category_name(cat_def.name).items()
+                    if meta.indicator_type == indicator_type
                 ]
                 if indicators_for_this_category_and_type:
                     final_categories_list.append(
@@ -257,44 +497,82 @@ class UnifiedIndicatorService:
                         )
                     )
         
-        logger.info(f"Successfully fetched {len(enriched_indicators_list)} indicators of type {indicator_type.value}")
+        logger.info("Successfully fetched %s indicators of type %s", len(enriched_indicators_list), indicator_type.value)
         return IndicatorsByTypeResponse(
             indicator_type=indicator_type.value, indicators=enriched_indicators_list, 
             categories=final_categories_list 
         )
 
-    def get_indicators_by_category_name(self, category_name: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[EnrichedIndicatorData]:
-        logger.info(f"[get_indicators_by_category_name for '{category_name}'] Received params -> start_date: '{start_date}', end_date: '{end_date}'")
-        indicators_meta_dict = {
-            ind_id: meta for ind_id, meta in get_all_indicators().items() 
-            if meta.category == category_name
-        }
+    def get_indicators_by_category_name(self, category_name: str, start_date: Optional[str] = None, end_date: Optional[str] = None, include_signal_series: bool = False) -> List[EnrichedIndicatorData]:
+        logger.debug("[get_indicators_by_category_name for '%s'] Received params -> start_date: '%s', end_date: '%s'", category_name, start_date, end_date)
+        indicators_meta_dict = get_indicators_by_category_name(category_name)
         results = []
         if not indicators_meta_dict:
             logger.warning(f"No indicators found defined for category name: {category_name}")
             return []
+        self._prefetch_fred(list(indicators_meta_dict.keys()), start_date)
         for indicator_id in indicators_meta_dict.keys(): 
             try:
-                indicator_data = self.get_indicator(indicator_id, start_date, end_date) # Pass dates
+                indicator_data = self.get_indicator(indicator_id, start_date, end_date, include_signal_series) # Pass dates
                 results.append(indicator_data)
             except Exception as e:
                 logger.error(f"Error fetching indicator {indicator_id} for category {category_name}: {e}", exc_info=True)
                 continue
         return results
 
+    def _market_status_versions(self) -> Dict[str, int]:
+        return {indicator_id: self.series_store.version(indicator_id) for indicator_id in get_all_indicators()}
+
+    def market_status_current(self) -> bool:
+        """True if the cached default market status was calculated from the current indicator series."""
+        cached = self._market_status
+        # A negative TTL (--offline) never expires, as in the series store
+        ttl = settings.SERIES_CACHE_TTL_SECONDS
+        return (
+            cached is not None
+            and (ttl < 0 or time.time() - cached[2] < ttl)
+            and cached[1] == self._market_status_versions()
+        )
+
+    def refresh_market_status(self) -> bool:
+        """
+        Recalculate the cached default market status, at background priority, if there is one
+        and it is out of date (called when an indicator series changed). Returns whether it was.
+        """
+        if self._market_status is None or self.market_status_current():
+            return False
+        with upstream_priority(Priority.BACKGROUND):
+            self.calculate_market_status()
+        return True
+
     def calculate_market_status(
         self,
         indicator_ids: Optional[List[str]] = None
     ) -> MarketStatusResponse:
-        if indicator_ids is None:
-            indicator_ids = list(get_all_indicators().keys())
+        """
+        Market status over the given indicators. The default (all indicators) is cached until
+        one of their series changes version or it is older than settings.SERIES_CACHE_TTL_SECONDS.
+        """
+        if indicator_ids is not None:
+            return self._calculate_market_status(indicator_ids)
+        if self.market_status_current():
+            record_cache("market_status", hit=True)
+            return self._market_status[0]
+        record_cache("market_status", hit=False)
+        status = self._calculate_market_status(list(get_all_indicators().keys()))
+        # Versions after the calculation, which refreshes expired series itself
+        self._market_status = (status, self._market_status_versions(), time.time())
+        return status
+
+    def _calculate_market_status(self, indicator_ids: List[str]) -> MarketStatusResponse:
         bullish_count = 0
         bearish_count = 0
         neutral_count = 0
         risk_on_count = 0 
         risk_off_count = 0
 
-        logger.info(f"Calculating market status using {len(indicator_ids)} indicators")
+        logger.info("Calculating market status using %s indicators", len(indicator_ids))
+        self._prefetch_fred(indicator_ids, None)
 
         for indicator_id in indicator_ids: 
             try:
@@ -349,8 +627,8 @@ class UnifiedIndicatorService:
                 risk_on_off_status_val = "NEUTRAL"
                 risk_on_off_score_val = 50.0
 
-        logger.info(f"Market status: {bull_bear_status_val} / {risk_on_off_status_val}")
-        logger.info(f"Signal breakdown: {bullish_count} bullish, {bearish_count} bearish, {neutral_count} neutral")
+        logger.info("Market status: %s / %s", bull_bear_status_val, risk_on_off_status_val)
+        logger.info("Signal breakdown: %s bullish, %s bearish, %s neutral", bullish_count, bearish_count, neutral_count)
 
         return MarketStatusResponse(
             bull_bear_status=bull_bear_status_val,
@@ -0,0 +1,269 @@
+# backend/app/services/upstream_client.py
+
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+import requests
+
+from app.core.config import settings
+from app.core.metrics import record_upstream, span
+from app.services.circuit_breaker import get_breaker, is_outage
+from app.services.rate_governor import Priority, RateLimited, key_label, rate_governor, upstream_priority
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_MODES = ("live", "record", "replay")
+
+# Request parameters that never affect the response identity and must not be written to disk
+_SECRET_PARAMS = ("api_key",)
+# Parameters ignored by the loose replay match, so a recording can answer other date windows
+_WINDOW_PARAMS = ("observation_start", "observation_end", "start", "end")
+
+
+class UpstreamReplayMiss(requests.exceptions.RequestException):
+    """Raised in replay mode when no recording matches a request."""
+
+
+class InjectedUpstreamError(requests.exceptions.HTTPError):
+    """Raised when the configured error profile fails a request."""
+
+
+class UpstreamClient:
+    """
+    Single gateway for upstream calls of one source (FRED, DBNomics, Yahoo).
+
+    Modes (settings.UPSTREAM_MODE):
+        live    call the upstream API
+        record  call the upstream API and write each response to the recordings directory
+        replay  answer from recordings only; never touches the network
+
+    Replay first looks for a recording of the exact request, then for the most recent
+    recording of the same request with different date-window parameters, so a recording
+    session need not reproduce every window a load test asks for.
+
+    Every call is bounded by settings.UPSTREAM_TIMEOUT_SECONDS and guarded by the source's
+    circuit breaker, which fails calls fast during an outage (see circuit_breaker.py).
+
+    In live and record mode every call first takes a token from the process-wide rate
+    governor for its source and API key; replay never touches the upstream, so it is not
+    throttled.
+
+    Latency (UPSTREAM_LATENCY_MS +/- UPSTREAM_LATENCY_JITTER_MS) and failures
+    (UPSTREAM_ERROR_RATE) can be injected in every mode. They are drawn from a generator
+    seeded with UPSTREAM_FAULT_SEED, so a benchmark run is reproducible.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        mode: Optional[str] = None,
+        recordings_dir: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        latency_jitter_ms: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        self.source = source
+        self.mode = (mode or settings.UPSTREAM_MODE).lower()
+        if self.mode not in UPSTREAM_MODES:
+            raise ValueError(f"Invalid upstream mode '{self.mode}'. Valid modes are: {', '.join(UPSTREAM_MODES)}.")
+        self.recordings_dir = os.path.join(recordings_dir or settings.UPSTREAM_RECORDINGS_DIR, source)
+        self.latency_ms = settings.UPSTREAM_LATENCY_MS if latency_ms is None else latency_ms
+        self.latency_jitter_ms = settings.UPSTREAM_LATENCY_JITTER_MS if latency_jitter_ms is None else latency_jitter_ms
+        self.error_rate = settings.UPSTREAM_ERROR_RATE if error_rate is None else error_rate
+        self._random = random.Random(settings.UPSTREAM_FAULT_SEED if seed is None else seed)
+        self._random_lock = threading.Lock()
+        self.breaker = get_breaker(source)
+        # Pooled keep-alive connections, sized for the concurrent fetches of a dashboard view
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=settings.UPSTREAM_POOL_SIZE, pool_maxsize=settings.UPSTREAM_POOL_SIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if self.mode != "live":
+            logger.info("Upstream client for %s in %s mode (recordings: %s)", source, self.mode, self.recordings_dir)
+
+    # --- Recording keys and storage ---
+
+    @staticmethod
+    def _public_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        return {k: str(v) for k, v in sorted((params or {}).items()) if k not in _SECRET_PARAMS and v is not None}
+
+    @staticmethod
+    def _digest(payload: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+
+    def _keys(self, operation: str, params: Dict[str, str]):
+        exact = self._digest({"operation": operation, "params": params})
+        loose = self._digest({
+            "operation": operation,
+            "params": {k: v for k, v in params.items() if k not in _WINDOW_PARAMS}
+        })
+        return exact, loose
+
+    def _write_recording(self, operation: str, params: Dict[str, str], payload: Any) -> None:
+        exact, loose = self._keys(operation, params)
+        os.makedirs(self.recordings_dir, exist_ok=True)
+        record = {
+            "operation": operation,
+            "params": params,
+            "recorded_at": time.time(),
+            "payload": payload,
+        }
+        # Write-then-rename so a concurrent replay never reads a partial file
+        for key in (exact, f"loose-{loose}"):
+            path = os.path.join(self.recordings_dir, f"{key}.json")
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(record, f)
+            os.replace(temp_path, path)
+        logger.debug("Recorded %s %s %s", self.source, operation, params)
+
+    def _read_recording(self, operation: str, params: Dict[str, str]) -> Any:
+        exact, loose = self._keys(operation, params)
+        for key in (exact, f"loose-{loose}"):
+            path = os.path.join(self.recordings_dir, f"{key}.json")
+            try:
+                with open(path, "r") as f:
+                    return json.load(f)["payload"]
+            except FileNotFoundError:
+                continue
+        raise UpstreamReplayMiss(f"No {self.source} recording for {operation} {params}")
+
+    # --- Fault injection ---
+
+    def _inject_faults(self, operation: str) -> None:
+        if not (self.latency_ms or self.latency_jitter_ms or self.error_rate):
+            return
+        with self._random_lock:
+            jitter = self._random.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)
+            fail = self._random.random() < self.error_rate
+        delay_ms = max(0.0, self.latency_ms + jitter)
+        if delay_ms:
+            time.sleep(delay_ms / 1000.0)
+        if fail:
+            raise InjectedUpstreamError(f"Injected {self.source} error for {operation}")
+
+    # --- Operations ---
+
+    def _timed(self, operation: Callable[[], Any], api_key: Optional[str] = None) -> Any:
+        """
+        Run one upstream operation behind the circuit breaker and rate governor, inside an
+        "upstream" timing span, and count its outcome.
+        """
+        try:
+            self.breaker.before_call()
+        except requests.exceptions.RequestException:
+            record_upstream(self.source, "circuit_open")
+            raise
+        self._acquire_token(api_key)
+        with span("upstream", source=self.source):
+            try:
+                result = operation()
+            except Exception as e:
+                record_upstream(self.source, "error")
+                if is_outage(e):
+                    self.breaker.record_failure(lambda: self._probe(operation, api_key))
+                raise
+        record_upstream(self.source, "ok")
+        self.breaker.record_success()
+        return result
+
+    def _acquire_token(self, api_key: Optional[str]) -> None:
+        if self.mode == "replay":
+            return
+        try:
+            with span("rate_limit", source=self.source):
+                rate_governor.acquire(self.source, key_label(api_key))
+        except RateLimited:
+            record_upstream(self.source, "rate_limited")
+            raise
+
+    def _probe(self, operation: Callable[[], Any], api_key: Optional[str]) -> None:
+        """Half-open probe run by the circuit breaker: repeat a failed call at background priority."""
+        with upstream_priority(Priority.BACKGROUND):
+            self._acquire_token(api_key)
+        with span("upstream", source=self.source):
+            operation()
+        record_upstream(self.source, "probe_ok")
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a JSON document.
+
+        Raises:
+            requests.exceptions.RequestException: On network/HTTP errors, rate limiting, injected errors or replay misses
+            ValueError: If a live response is not valid JSON
+        """
+        return self._timed(lambda: self._get_json(url, params), (params or {}).get("api_key"))
+
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]]) -> Any:
+        public_params = self._public_params(params)
+        self._inject_faults(url)
+
+        if self.mode == "replay":
+            return self._read_recording(url, public_params)
+
+        response = self.session.get(url, params=params, timeout=settings.UPSTREAM_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        data = response.json()
+        if self.mode == "record":
+            self._write_recording(url, public_params, data)
+        return data
+
+    def download_prices(self, ticker_symbol: str, start, end, interval: str = "1d") -> pd.DataFrame:
+        """
+        Prices for a ticker via yfinance at the given bar interval ("1h", "1d", "1wk"), with a
+        single 'Close' column indexed by date (bar start time for intraday bars).
+
+        Raises:
+            requests.exceptions.RequestException: On rate limiting, injected errors or replay misses
+        """
+        return self._timed(lambda: self._download_prices(ticker_symbol, start, end, interval))
+
+    def _download_prices(self, ticker_symbol: str, start, end, interval: str = "1d") -> pd.DataFrame:
+        params = {
+            "ticker": ticker_symbol,
+            "start": pd.Timestamp(start).strftime("%Y-%m-%d"),
+            "end": pd.Timestamp(end).strftime("%Y-%m-%d"),
+        }
+        if interval != "1d":
+            # Daily recordings keep their original keys
+            params["interval"] = interval
+        self._inject_faults("download")
+
+        if self.mode == "replay":
+            payload = self._read_recording("download", params)
+            frame = pd.DataFrame(
+                {"Close": payload["close"]},
+                index=pd.DatetimeIndex(pd.to_datetime(payload["dates"]), name="Date")
+            )
+            # A loose match may cover a wider window than requested; yfinance's end is exclusive
+            return frame[(frame.index >= pd.Timestamp(start)) & (frame.index < pd.Timestamp(end))]
+
+        import yfinance as yf  # Imported here so replay runs never load yfinance
+        data = yf.download(ticker_symbol, start=start, end=end, interval=interval, timeout=settings.UPSTREAM_TIMEOUT_SECONDS)
+        if data.empty:
+            # yfinance reports network failures by returning nothing; surface them so the breaker sees them
+            error = getattr(getattr(yf, "shared", None), "_ERRORS", {}).get(ticker_symbol)
+            if error and not any(hint in str(error).lower() for hint in ("delisted", "no data found", "no price data")):
+                raise requests.exceptions.ConnectionError(f"yfinance download of {ticker_symbol} failed: {error}")
+        if self.mode == "record" and not data.empty:
+            close = data["Close"]
+            if isinstance(close, pd.DataFrame):
+                close = close.iloc[:, 0]
+            # Intraday bars are recorded as naive UTC times, as get_ticker_data returns them
+            index = close.index.tz_convert(None) if close.index.tz is not None else close.index
+            self._write_recording("download", params, {
+                "dates": [d.strftime("%Y-%m-%d" if interval != "1h" else "%Y-%m-%dT%H:%M:%S") for d in index],
+                "close": [None if pd.isna(v) else float(v) for v in close.to_numpy()],
+            })
+        return data
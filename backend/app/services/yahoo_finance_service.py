@@ -1,57 +1,103 @@
 # backend/app/services/yahoo_finance_service.py
 
 import pandas as pd
-import yfinance as yf
 from datetime import datetime, timedelta
 import logging
 import traceback
+from typing import Dict, Optional
+
+from app.services.series_store import StoredSeries, series_store
+from app.services.upstream_client import UpstreamClient
 
 logger = logging.getLogger(__name__)
 
 class YahooFinanceService:
     """Service for fetching price data using Yahoo Finance."""
-    
+
+    # Bar interval -> days fetched when no start date is given. The daily default covers a
+    # 200-day moving average (about 290 calendar days) with room to spare
+    INTERVALS: Dict[str, int] = {
+        "1h": 5,
+        "1d": 400,
+        "1wk": 5 * 365,
+    }
+    # Yahoo only serves hourly bars for the last 730 days
+    MAX_INTRADAY_DAYS = 729
+
     def __init__(self):
         """Initialize the Yahoo Finance service."""
+        self.client = UpstreamClient("yahoo")
+        self.series_store = series_store
         logger.info("YahooFinanceService initialized")
-    
-    def get_ticker_data(self, ticker_symbol: str, start_date=None, end_date=None):
+
+    @classmethod
+    def default_start(cls, interval: str = "1d", lookback_days: Optional[int] = None) -> str:
+        """
+        Start date of the default window for an interval, lookback_days (by default the
+        interval's entry in INTERVALS) before today.
+
+        Raises:
+            ValueError: If the interval is not one of INTERVALS
+        """
+        if interval not in cls.INTERVALS:
+            raise ValueError(f"Invalid interval '{interval}'. Valid intervals are: {', '.join(cls.INTERVALS)}.")
+        days = lookback_days if lookback_days is not None else cls.INTERVALS[interval]
+        return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+    def get_ticker_data(
+        self,
+        ticker_symbol: str,
+        start_date=None,
+        end_date=None,
+        interval: str = "1d",
+        lookback_days: Optional[int] = None
+    ):
         """
         Fetch ticker price data from Yahoo Finance.
         
         Args:
             ticker_symbol (str): The Yahoo Finance ticker symbol
-            start_date (str, optional): Start date in YYYY-MM-DD format
+            start_date (str, optional): Start date in YYYY-MM-DD format (default: see default_start)
             end_date (str, optional): End date in YYYY-MM-DD format
+            interval (str): Bar interval, one of INTERVALS
+            lookback_days (int, optional): Days to fetch when no start_date is given
             
         Returns:
-            pandas.DataFrame: DataFrame with date and value columns
+            pandas.DataFrame: DataFrame with date and value columns (naive UTC times for hourly bars)
+
+        Raises:
+            ValueError: If the interval is not one of INTERVALS
         """
-        logger.info(f"Fetching price data for ticker {ticker_symbol} from Yahoo Finance with start_date={start_date}, end_date={end_date}")
-        
+        logger.info("Fetching price data for ticker %s from Yahoo Finance with start_date=%s, end_date=%s, interval=%s", ticker_symbol, start_date, end_date, interval)
+        default_start = self.default_start(interval, lookback_days)
+
         try:
             # Convert string dates to datetime if provided
-            start_dt = pd.to_datetime(start_date) if start_date else datetime.now() - timedelta(days=30)
+            start_dt = pd.to_datetime(start_date or default_start)
             end_dt = pd.to_datetime(end_date) if end_date else datetime.now()
+            if interval == "1h":
+                start_dt = max(start_dt, pd.Timestamp(datetime.now() - timedelta(days=self.MAX_INTRADAY_DAYS)).normalize())
             
             # Fetch price data from Yahoo Finance
-            logger.info(f"Fetching data for {ticker_symbol} from {start_dt} to {end_dt}")
-            ticker_data = yf.download(ticker_symbol, start=start_dt, end=end_dt)
+            logger.info("Fetching data for %s from %s to %s", ticker_symbol, start_dt, end_dt)
+            ticker_data = self.client.download_prices(ticker_symbol, start_dt, end_dt, interval)
             
             # Check if data was returned
             if ticker_data.empty:
                 logger.warning(f"No data returned from Yahoo Finance for {ticker_symbol}")
                 return pd.DataFrame(columns=["date", "value"])
+            if getattr(ticker_data.index, "tz", None) is not None:
+                ticker_data.index = ticker_data.index.tz_convert(None)
             
             # Log data sample for debugging at debug level
-            logger.debug(f"Data shape: {ticker_data.shape}, columns: {ticker_data.columns.tolist()}")
-            logger.debug(f"Data sample:\n{ticker_data.head(3).to_string()}")
+            logger.debug("Data shape: %s, columns: %s", ticker_data.shape, ticker_data.columns.tolist())
+            logger.debug("Data sample:\n%s", ticker_data.head(3).to_string())
             
             # Extract the closing prices and create a new DataFrame
             try:
                 # Handle different column structures (could be multi-level)
                 if isinstance(ticker_data.columns, pd.MultiIndex):
-                    logger.debug(f"{ticker_symbol} data has multi-level columns")
+                    logger.debug("%s data has multi-level columns", ticker_symbol)
                     close_cols = [col for col in ticker_data.columns if isinstance(col, tuple) and col[0] == 'Close']
                     if close_cols:
                         close_col = close_cols[0]
@@ -66,7 +112,7 @@ class YahooFinanceService:
                 df["date"] = ticker_data.index
                 df["value"] = ticker_data[close_col].values
                 
-                logger.info(f"Successfully processed {len(df)} price data points for {ticker_symbol}")
+                logger.info("Successfully processed %s price data points for %s", len(df), ticker_symbol)
                 return df
                 
             except Exception as e:
@@ -90,7 +136,7 @@ class YahooFinanceService:
                     if hasattr(latest_close, 'item'):
                         latest_close = latest_close.item()
                     
-                    logger.debug(f"Fallback: Latest price at {latest_date}: {latest_close}")
+                    logger.debug("Fallback: Latest price at %s: %s", latest_date, latest_close)
                     
                     return pd.DataFrame({
                         "date": [latest_date],
@@ -105,4 +151,35 @@ class YahooFinanceService:
         except Exception as e:
             logger.error(f"Error fetching price data for {ticker_symbol}: {e}")
             traceback.print_exc()
-            return pd.DataFrame(columns=["date", "value"])
\ No newline at end of file
+            return pd.DataFrame(columns=["date", "value"])
+
+    def get_ticker_history(self, ticker_symbol: str, start_date: Optional[str] = None) -> StoredSeries:
+        """
+        Daily closes for a ticker from settings.HISTORY_START_DATE (or the earlier start_date)
+        through today, kept in the series store under "yahoo:<ticker>", the key composite
+        leaves use. Only what the stored copy lacks is downloaded (SeriesStore.get_history).
+        """
+        return self.series_store.get_history(
+            f"yahoo:{ticker_symbol}",
+            start_date,
+            lambda start, end: self.get_ticker_data(ticker_symbol, start, end)
+        )
+
+    def get_ticker_window(
+        self,
+        ticker_symbol: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        interval: str = "1d"
+    ) -> pd.DataFrame:
+        """
+        Prices for a display window (by default the interval's default window). Daily bars are
+        sliced from the stored history; hourly and weekly bars are downloaded for just the window.
+
+        Raises:
+            ValueError: If the interval is not one of INTERVALS
+        """
+        start_date = start_date or self.default_start(interval)
+        if interval != "1d":
+            return self.get_ticker_data(ticker_symbol, start_date, end_date, interval)
+        return self.get_ticker_history(ticker_symbol, start_date).series.window(start_date, end_date).to_frame()
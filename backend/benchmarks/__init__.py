@@ -0,0 +1,13 @@
+# backend/benchmarks/__init__.py
+"""
+Benchmarks for the API request path and the indicator processing functions.
+
+Run from the backend directory:
+
+    # Record upstream responses once (needs network and FRED_API_KEY)
+    python -m benchmarks.run_benchmarks --upstream-mode record --requests 1 --concurrency 1 --skip-processing
+
+    # Reproducible runs against the recordings
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --output bench-new.json --compare bench.json
+"""
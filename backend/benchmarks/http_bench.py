@@ -0,0 +1,97 @@
+# backend/benchmarks/http_bench.py
+
+import asyncio
+import cProfile
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from benchmarks.stats import latency_summary, peak_rss_mb
+
+# (name, path) pairs driven through the ASGI app
+ENDPOINTS = [
+    ("v2_indicator_daily", "/api/v2/indicators/SP500?start_date=2020-01-01"),
+    ("v2_indicator_monthly_yoy", "/api/v2/indicators/M2SL?start_date=2015-01-01"),
+    ("v2_indicator_ism", "/api/v2/indicators/ISM-PMI?start_date=2015-01-01"),
+    ("v2_type_leading", "/api/v2/indicators/type/leading?start_date=2020-01-01"),
+    ("v2_type_coincident", "/api/v2/indicators/type/coincident?start_date=2020-01-01"),
+    ("v2_categorydata", "/api/v2/indicators/categorydata/Business%20Cycle%20Indicators?start_date=2020-01-01"),
+    ("v2_market_status", "/api/v2/indicators/market-status"),
+    ("legacy_fred", "/api/indicators/fred/UNRATE?start_date=2015-01-01"),
+    ("legacy_ism_pmi", "/api/indicators/ism/pmi?start_date=2015-01-01"),
+    ("legacy_gold_copper", "/api/indicators/metals/gold-copper-ratio?start_date=2020-01-01"),
+    ("legacy_sp500", "/api/indicators/market/sp500?start_date=2020-01-01"),
+    ("legacy_yahoo", "/api/indicators/yahoo/%5EVIX?start_date=2020-01-01"),
+]
+
+
+async def _drive(app, path: str, total_requests: int, concurrency: int) -> Dict[str, Any]:
+    """Issue total_requests GETs for path from `concurrency` concurrent workers."""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    remaining = iter(range(total_requests))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    result = latency_summary(np.array(latencies))
+    result.update({
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "requests_per_second": total_requests / elapsed if elapsed else None,
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "peak_rss_mb": peak_rss_mb(),
+    })
+    return result
+
+
+def run_endpoint_benchmarks(
+    app,
+    total_requests: int,
+    concurrency_levels: List[int],
+    endpoints: Optional[List[str]] = None,
+    profile_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Latency percentiles and throughput per endpoint and concurrency level.
+    One warm-up request per endpoint is made first and is not counted.
+    With profile_dir, a cProfile .pstats file is written per endpoint (covering all levels).
+    """
+    results: Dict[str, Any] = {}
+    for name, path in ENDPOINTS:
+        if endpoints and name not in endpoints:
+            continue
+        asyncio.run(_drive(app, path, 1, 1))
+
+        profiler = cProfile.Profile() if profile_dir else None
+        if profiler:
+            profiler.enable()
+        levels = {}
+        for concurrency in concurrency_levels:
+            levels[str(concurrency)] = asyncio.run(_drive(app, path, total_requests, concurrency))
+        if profiler:
+            profiler.disable()
+            os.makedirs(profile_dir, exist_ok=True)
+            profiler.dump_stats(os.path.join(profile_dir, f"{name}.pstats"))
+
+        results[name] = {"path": path, "levels": levels}
+        first = levels[str(concurrency_levels[0])]
+        print(
+            f"{name:28s} p50={first['p50_ms']:8.2f}ms p95={first['p95_ms']:8.2f}ms "
+            f"p99={first['p99_ms']:8.2f}ms rps(c={concurrency_levels[-1]})="
+            f"{levels[str(concurrency_levels[-1])]['requests_per_second']:8.1f}"
+        )
+    return results
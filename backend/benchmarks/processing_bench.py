@@ -0,0 +1,75 @@
+# backend/benchmarks/processing_bench.py
+
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from app.core.indicator_config import TransformationType, get_indicator_metadata
+from app.models.indicators import TimeSeriesPoint
+from app.services.indicator_processing_service import IndicatorProcessingService
+
+from benchmarks.stats import peak_rss_mb
+
+
+def synthetic_points(size: int, seed: int = 0) -> List[TimeSeriesPoint]:
+    """A random-walk series of `size` hourly points ending now (hourly so 1M points stay within pandas' date range)."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=pd.Timestamp.now().floor("h"), periods=size, freq="h")
+    values = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.001, size)))
+    return [TimeSeriesPoint(date=date, value=float(value)) for date, value in zip(dates.to_pydatetime(), values)]
+
+
+def _time(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return {"median_s": float(np.median(timings)), "min_s": float(np.min(timings)), "repeat": repeat}
+
+
+def run_processing_benchmarks(sizes: List[int], repeat: int = 3) -> Dict[str, Any]:
+    """
+    Time the IndicatorProcessingService functions on synthetic series of each size.
+    Sizes of 1M points and above are timed once regardless of `repeat`.
+    """
+    service = IndicatorProcessingService
+    sp500 = get_indicator_metadata("SP500")  # Moving-average crossover signal
+    m2 = get_indicator_metadata("M2SL")      # YoY transformation with static thresholds
+    ma_period = sp500.dynamic_threshold.config.period
+
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        points = synthetic_points(size)
+        dates, values = service.points_to_arrays(points)
+        median = float(np.median(values))
+        codes = service.static_signal_codes(values, median * 1.01, median * 0.99)
+        series = pd.Series(values, index=pd.DatetimeIndex(dates))
+        start_date = (pd.Timestamp(dates[len(dates) // 2])).strftime("%Y-%m-%d")
+        size_repeat = 1 if size >= 1_000_000 else repeat
+
+        cases = {
+            "calculate_yoy_growth": lambda: service.calculate_yoy_growth(points),
+            "calculate_moving_average": lambda: service.calculate_moving_average(points, ma_period),
+            "invert_values": lambda: service.invert_values(points),
+            "trim_data_to_requested_range": lambda: service.trim_data_to_requested_range(points, start_date),
+            "points_to_arrays": lambda: service.points_to_arrays(points),
+            "run_length_encode_signals": lambda: service.run_length_encode_signals(dates, codes),
+            "transform_series_yoy": lambda: service.transform_series(series, TransformationType.YOY),
+            "signal_codes_for_series_ma": lambda: service.signal_codes_for_series(series, sp500),
+            "process_indicator_data_ma": lambda: service.process_indicator_data("SP500", points, sp500.name, original_start_date=start_date),
+            "process_indicator_data_yoy": lambda: service.process_indicator_data("M2SL", points, m2.name, original_start_date=start_date),
+        }
+
+        size_results = {}
+        for name, function in cases.items():
+            timing = _time(function, size_repeat)
+            timing["points_per_second"] = size / timing["median_s"] if timing["median_s"] else None
+            size_results[name] = timing
+            print(f"{name:32s} n={size:>9,d} median={timing['median_s'] * 1000:10.2f}ms")
+
+        size_results["peak_rss_mb"] = peak_rss_mb()
+        results[str(size)] = size_results
+    return results
@@ -0,0 +1,102 @@
+# backend/benchmarks/run_benchmarks.py
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Any, Dict
+
+# Make `app` and `main` importable when run as `python benchmarks/run_benchmarks.py`
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def _int_list(value: str):
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print p50 latency and median processing time ratios against a baseline result file."""
+    print("\nComparison with baseline (ratio > 1 means slower):")
+    for name, endpoint in current.get("endpoints", {}).items():
+        for level, stats in endpoint["levels"].items():
+            base = baseline.get("endpoints", {}).get(name, {}).get("levels", {}).get(level)
+            if base and base.get("p50_ms") and stats.get("p50_ms"):
+                print(f"  {name:28s} c={level:>3s} p50 x{stats['p50_ms'] / base['p50_ms']:.2f}")
+    for size, cases in current.get("processing", {}).items():
+        for name, stats in cases.items():
+            base = baseline.get("processing", {}).get(size, {}).get(name)
+            if isinstance(stats, dict) and base and base.get("median_s"):
+                print(f"  {name:32s} n={size:>9s} x{stats['median_s'] / base['median_s']:.2f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Macro Dashboard API request path")
+    parser.add_argument("--upstream-mode", choices=["replay", "record", "live"], default="replay",
+                        help="How upstream calls are served (default: replay from recordings)")
+    parser.add_argument("--recordings-dir", default=None, help="Upstream recordings directory")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per endpoint and concurrency level")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 4, 16], help="Comma-separated concurrency levels")
+    parser.add_argument("--endpoints", default=None, help="Comma-separated endpoint names to run (default: all)")
+    parser.add_argument("--sizes", type=_int_list, default=[10_000, 100_000, 1_000_000],
+                        help="Comma-separated series sizes for processing microbenchmarks")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per microbenchmark")
+    parser.add_argument("--skip-http", action="store_true", help="Skip endpoint benchmarks")
+    parser.add_argument("--skip-processing", action="store_true", help="Skip processing microbenchmarks")
+    parser.add_argument("--profile-dir", default=None, help="Write a cProfile .pstats file per endpoint here")
+    parser.add_argument("--output", default="benchmark_results.json", help="Result file (JSON)")
+    parser.add_argument("--compare", default=None, help="Baseline result file to compare against")
+    args = parser.parse_args()
+
+    # Must be set before the app (and its settings) are imported
+    os.environ["UPSTREAM_MODE"] = args.upstream_mode
+    if args.recordings_dir:
+        os.environ["UPSTREAM_RECORDINGS_DIR"] = args.recordings_dir
+    # Upstream misses in replay mode are reported through status_codes rather than the log
+    logging.disable(logging.ERROR)
+
+    from app.core.config import settings
+    from benchmarks.stats import peak_rss_mb
+
+    results: Dict[str, Any] = {
+        "created_at": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "upstream_mode": settings.UPSTREAM_MODE,
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "sizes": args.sizes,
+            "repeat": args.repeat,
+        },
+    }
+
+    if not args.skip_http:
+        from main import app
+        from benchmarks.http_bench import run_endpoint_benchmarks
+
+        endpoints = args.endpoints.split(",") if args.endpoints else None
+        results["endpoints"] = run_endpoint_benchmarks(app, args.requests, args.concurrency, endpoints, args.profile_dir)
+
+    if not args.skip_processing:
+        from benchmarks.processing_bench import run_processing_benchmarks
+
+        results["processing"] = run_processing_benchmarks(args.sizes, args.repeat)
+
+    results["peak_rss_mb"] = peak_rss_mb()
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nPeak RSS: {results['peak_rss_mb']:.1f} MiB. Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            compare_results(results, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
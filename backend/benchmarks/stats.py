@@ -0,0 +1,29 @@
+# backend/benchmarks/stats.py
+
+import resource
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def latency_summary(seconds: np.ndarray) -> Dict[str, Optional[float]]:
+    """p50/p95/p99, mean and max of a latency sample, in milliseconds."""
+    if len(seconds) == 0:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "mean_ms": None, "max_ms": None}
+    milliseconds = seconds * 1000.0
+    p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+    return {
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "mean_ms": float(milliseconds.mean()),
+        "max_ms": float(milliseconds.max()),
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
@@ -1,29 +1,46 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exception_handlers import http_exception_handler
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from contextlib import asynccontextmanager
 import logging
 import argparse
+import os
 import sys
+import threading
 from app.core.config import settings
 from app.api.api import router as api_router
+from app.api.timing import ServerTimingMiddleware
+from app.core.metrics import metrics
+from app.core.logging_config import configure_logging
+from app.services.container import services
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging (level, format, queue and sampling come from the LOG_* settings)
+configure_logging()
 
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Services (and pandas/numpy with them) are built once per worker here, not at import
+    services.build()
+    if settings.SNAPSHOT_PATH:
+        from app.services.snapshot_service import SnapshotService
+        try:
+            SnapshotService().import_snapshot(settings.SNAPSHOT_PATH)
+        except Exception as e:
+            logger.error(f"Failed to import snapshot {settings.SNAPSHOT_PATH}: {e}", exc_info=True)
+    if settings.PREWARM_ON_STARTUP:
+        # In the background so the worker accepts requests while histories load
+        threading.Thread(target=services.prewarm, name="prewarm", daemon=True).start()
+    yield
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="API for the Macro Investment Dashboard",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -33,8 +50,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# Per-request timing spans (Server-Timing header)
+app.add_middleware(ServerTimingMiddleware)
+
 # Global exception handler
 @app.exception_handler(StarletteHTTPException)
 async def custom_http_exception_handler(request: Request, exc: StarletteHTTPException):
@@ -59,6 +80,13 @@ async def health_check():
     """
     return {"status": "ok"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """
+    Counters and latency histograms in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
 @app.get("/")
 async def root():
     """
@@ -70,12 +98,29 @@ async def root():
         "description": "API for the Macro Investment Dashboard",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "api": "/api",
             "docs": "/docs"
         }
     }
 
-def run_server(host: str = None, port: int = None, reload: bool = None):
+def export_snapshot(path: str):
+    """
+    Fetch the full history of every configured indicator and write it to a snapshot bundle.
+
+    Args:
+        path: Destination bundle path
+    """
+    from app.services.snapshot_service import SnapshotService
+
+    manifest = SnapshotService().export_snapshot(path)
+    logger.info(f"Snapshot written to {path}: {len(manifest['series'])} series")
+    if manifest["failed_indicators"]:
+        logger.warning(f"Indicators without data in snapshot: {', '.join(manifest['failed_indicators'])}")
+        return 1
+    return 0
+
+def run_server(host: str = None, port: int = None, reload: bool = None, workers: int = 1):
     """
     Run the FastAPI server with specified parameters.
     
@@ -83,20 +128,24 @@ def run_server(host: str = None, port: int = None, reload: bool = None):
         host: The host to bind to
         port: The port to bind to
         reload: Whether to reload on code changes
+        workers: Number of worker processes (disables reload when > 1)
     """
     import uvicorn
     
     uvicorn_host = host or settings.API_HOST
     uvicorn_port = port or settings.API_PORT
     uvicorn_reload = reload if reload is not None else True
+    if workers > 1:
+        uvicorn_reload = False
     
-    logger.info(f"Starting server on {uvicorn_host}:{uvicorn_port} (reload={uvicorn_reload})")
+    logger.info(f"Starting server on {uvicorn_host}:{uvicorn_port} (reload={uvicorn_reload}, workers={workers})")
     
     uvicorn.run(
         "main:app", 
         host=uvicorn_host, 
         port=uvicorn_port, 
-        reload=uvicorn_reload
+        reload=uvicorn_reload,
+        workers=workers
     )
 
 if __name__ == "__main__":
@@ -105,10 +154,34 @@ if __name__ == "__main__":
     parser.add_argument("--host", help="Host to bind to", default=None)
     parser.add_argument("--port", help="Port to bind to", type=int, default=None)
     parser.add_argument("--no-reload", help="Disable auto-reload on code changes", action="store_true")
+    parser.add_argument("--workers", help="Number of worker processes; more than one uses the SQLite shared cache unless SHARED_CACHE_BACKEND is set", type=int, default=1)
+    parser.add_argument("--export-snapshot", metavar="PATH", help="Export all indicator histories to a snapshot bundle and exit", default=None)
+    parser.add_argument("--snapshot", metavar="PATH", help="Load a snapshot bundle into the series store at startup", default=None)
+    parser.add_argument("--prewarm", help="Load every indicator history in the background at startup", action="store_true")
+    parser.add_argument("--offline", help="Never expire stored series, so a snapshot is served without upstream calls", action="store_true")
     
     args = parser.parse_args()
+    if args.export_snapshot:
+        sys.exit(export_snapshot(args.export_snapshot))
+
+    # Passed through the environment so the settings of reloader worker processes pick them up too
+    if args.snapshot:
+        os.environ["SNAPSHOT_PATH"] = args.snapshot
+        settings.SNAPSHOT_PATH = args.snapshot
+    if args.workers > 1 and settings.SHARED_CACHE_BACKEND == "none":
+        os.environ["SHARED_CACHE_BACKEND"] = "sqlite"
+    if args.prewarm:
+        os.environ["PREWARM_ON_STARTUP"] = "true"
+        settings.PREWARM_ON_STARTUP = True
+    if args.offline:
+        from app.services.series_store import series_store
+        os.environ["SERIES_CACHE_TTL_SECONDS"] = "-1"
+        settings.SERIES_CACHE_TTL_SECONDS = -1
+        series_store.max_age_seconds = -1
+
     run_server(
         host=args.host, 
         port=args.port, 
-        reload=not args.no_reload
+        reload=not args.no_reload,
+        workers=args.workers
     )
\ No newline at end of file
@@ -10,6 +10,8 @@ import {
   ButtonGroup,
 } from '@mui/material';
 import IndicatorService, {
+  BUNDLED_WINDOWS,
+  BundledWindow,
   CategoryInfo,
   IndicatorsByTypeAPIResponse
 } from '../services/IndicatorService';
@@ -107,10 +109,15 @@ const IndicatorCategoryPage: React.FC<IndicatorCategoryPageProps> = ({
     const rangeToFetch = currentDateRange; // Uses the state-derived currentDateRange
 
     try {
+      // Default windows come from the backend's precomputed bundles
+      const bundledWindow = (BUNDLED_WINDOWS as readonly string[]).includes(activeDateRangeKey)
+        ? activeDateRangeKey as BundledWindow
+        : undefined;
       const response: IndicatorsByTypeAPIResponse = await IndicatorService.getIndicatorsByType(
         indicatorType,
         rangeToFetch.startDate,
-        rangeToFetch.endDate
+        rangeToFetch.endDate,
+        bundledWindow
       );
 
       const newFetchedDetails: Record<string, EnrichedIndicatorAPIResponse | null> = {};
@@ -139,7 +146,7 @@ const IndicatorCategoryPage: React.FC<IndicatorCategoryPageProps> = ({
         setInitialLoadAttempted(true);
       }
     }
-  }, [indicatorType, pageTitle, currentDateRange, initialLoadAttempted /*, setIndicator, activeDateRangeKey is implicitly handled via currentDateRange */]);
+  }, [indicatorType, pageTitle, currentDateRange, activeDateRangeKey, initialLoadAttempted /*, setIndicator, activeDateRangeKey is implicitly handled via currentDateRange */]);
 
   useEffect(() => {
     const previousIndicatorType = prevPropsRef.current?.indicatorType;
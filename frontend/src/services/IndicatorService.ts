@@ -1,6 +1,7 @@
 // frontend/src/services/IndicatorService.ts
 import axios from 'axios';
 import { IndicatorData, TimeSeriesPoint } from '../components/IndicatorCard'; // Assuming IndicatorCard exports these
+import { DATE_RANGES } from './DashboardConfig';
 
 const API_BASE_URL = process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000/api';
 
@@ -11,6 +12,14 @@ const apiClient = axios.create({
   },
 });
 
+// Run-length encoded signal regime, returned when include_signal_series=true
+export interface SignalInterval {
+  start_date: string;
+  end_date: string;
+  signal: 'bullish' | 'bearish' | 'neutral';
+  points: number;
+}
+
 // Interface for the raw response from /v2/indicators/{indicator_id}
 export interface EnrichedIndicatorAPIResponse { // Exporting for IndicatorCategoryPage
   indicator_id: string;
@@ -27,6 +36,9 @@ export interface EnrichedIndicatorAPIResponse { // Exporting for IndicatorCatego
   last_updated?: string; 
   y_axis_domain?: [number, number];
   ma_series_data?: TimeSeriesPoint[]; // Added MA series data
+  signal_series?: SignalInterval[]; // Optional per-point signal history
+  stale?: boolean; // Served from a last-known-good copy while the source is unavailable
+  as_of?: string; // When the underlying data was fetched from its source
 }
 
 // Interface for the metadata response from /v2/indicators/{indicator_id}/metadata or /v2/indicators/
@@ -61,6 +73,11 @@ interface MarketStatusResponse {
   last_updated: string; 
 }
 
+// Windows the backend serves as precomputed bundles from /v2/indicators/type/{indicator_type_value}?window=
+// (every dashboard date range; BundleService.WINDOWS mirrors DATE_RANGES)
+export type BundledWindow = keyof typeof DATE_RANGES;
+export const BUNDLED_WINDOWS = Object.keys(DATE_RANGES) as BundledWindow[];
+
 // Interface for the response from /v2/indicators/type/{indicator_type_value}
 export interface IndicatorsByTypeAPIResponse { 
   indicator_type: string; 
@@ -155,12 +172,16 @@ const IndicatorService = {
   async getIndicatorsByType(
     indicatorType: 'leading' | 'coincident' | 'lagging',
     startDate?: string,
-    endDate?: string
+    endDate?: string,
+    window?: BundledWindow
   ): Promise<IndicatorsByTypeAPIResponse> {
     try {
-      const timestamp = new Date().getTime(); 
+      // Default windows are precomputed bundles revalidated by ETag, so no cache-busting timestamp
+      const params = window
+        ? { window }
+        : { start_date: startDate, end_date: endDate, _t: new Date().getTime() };
       const response = await apiClient.get<IndicatorsByTypeAPIResponse>(`/v2/indicators/type/${indicatorType}`, {
-        params: { start_date: startDate, end_date: endDate, _t: timestamp },
+        params,
       });
       // The response.data.indicators are EnrichedIndicatorAPIResponse[], which now include ma_series_data
       return response.data;